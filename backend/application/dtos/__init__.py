@@ -1,3 +1,25 @@
-from .feature_dto import CreateFeatureDTO, FeatureResponseDTO, VoteDTO
+from .feature_dto import (
+    BulkVoteItemDTO,
+    BulkVoteResultDTO,
+    CreateFeatureDTO,
+    CreatedFeatureDTO,
+    FeaturePageDTO,
+    FeatureResponseDTO,
+    SimilarFeatureDTO,
+    VoteDTO,
+    VoteHistogramBucketDTO,
+    VoteHistogramDTO,
+)
 
-__all__ = ["CreateFeatureDTO", "FeatureResponseDTO", "VoteDTO"]
+__all__ = [
+    "BulkVoteItemDTO",
+    "BulkVoteResultDTO",
+    "CreateFeatureDTO",
+    "CreatedFeatureDTO",
+    "FeaturePageDTO",
+    "FeatureResponseDTO",
+    "SimilarFeatureDTO",
+    "VoteDTO",
+    "VoteHistogramBucketDTO",
+    "VoteHistogramDTO",
+]
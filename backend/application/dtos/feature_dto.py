@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -19,8 +20,55 @@ class FeatureResponseDTO:
     votes_count: int
     created_at: datetime
     updated_at: datetime
+    has_voted: Optional[bool] = None
+
+
+@dataclass
+class SimilarFeatureDTO:
+    id: UUID
+    title: str
+    similarity: float
+
+
+@dataclass
+class CreatedFeatureDTO(FeatureResponseDTO):
+    similar_features: List[SimilarFeatureDTO] = field(default_factory=list)
+
+
+@dataclass
+class FeaturePageDTO:
+    items: List[FeatureResponseDTO]
+    next_cursor: Optional[str] = None
 
 
 @dataclass
 class VoteDTO:
     user_identifier: str
+
+
+@dataclass
+class BulkVoteItemDTO:
+    feature_id: UUID
+    user_identifier: str
+
+
+@dataclass
+class BulkVoteResultDTO:
+    feature_id: UUID
+    user_identifier: str
+    status: str
+
+
+@dataclass
+class VoteHistogramBucketDTO:
+    bucket_start: datetime
+    count: int
+
+
+@dataclass
+class VoteHistogramDTO:
+    feature_id: UUID
+    granularity: str
+    start: datetime
+    end: datetime
+    buckets: List[VoteHistogramBucketDTO]
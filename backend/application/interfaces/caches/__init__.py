@@ -0,0 +1,6 @@
+from .leaderboard_cache import LeaderboardCache
+from .request_coalescer import RequestCoalescer
+from .similarity_index import SimilarityIndex
+from .vote_membership_filter import VoteMembershipFilter
+
+__all__ = ["LeaderboardCache", "RequestCoalescer", "SimilarityIndex", "VoteMembershipFilter"]
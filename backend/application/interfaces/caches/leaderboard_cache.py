@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from domain.entities import Feature
+
+
+class LeaderboardCache(ABC):
+    capacity: int
+
+    @abstractmethod
+    def get_top(self, limit: int) -> Optional[List[Feature]]:
+        pass
+
+    @abstractmethod
+    def load(self, features: List[Feature]) -> None:
+        pass
+
+    @abstractmethod
+    def record(self, feature: Feature) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        pass
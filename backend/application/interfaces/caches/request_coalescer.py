@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestCoalescer(ABC):
+    @abstractmethod
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+from uuid import UUID
+
+
+class SimilarityIndex(ABC):
+    @abstractmethod
+    def add(self, feature_id: UUID, title: str, description: str) -> None:
+        pass
+
+    @abstractmethod
+    def query(
+        self, title: str, description: str = "", limit: int = 5
+    ) -> List[Tuple[UUID, str, float]]:
+        pass
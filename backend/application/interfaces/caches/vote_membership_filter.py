@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class VoteMembershipFilter(ABC):
+    @abstractmethod
+    def might_contain(self, feature_id: UUID, user_identifier: str) -> bool:
+        pass
+
+    @abstractmethod
+    def add(self, feature_id: UUID, user_identifier: str) -> None:
+        pass
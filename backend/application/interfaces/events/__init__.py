@@ -0,0 +1,3 @@
+from .vote_event_publisher import VoteEventPublisher
+
+__all__ = ["VoteEventPublisher"]
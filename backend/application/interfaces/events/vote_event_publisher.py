@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class VoteEventPublisher(ABC):
+    @abstractmethod
+    def publish(self, feature_id: UUID, votes_count: int) -> None:
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from domain.entities import Feature
@@ -16,10 +17,44 @@ class FeatureRepository(ABC):
 
     @abstractmethod
     async def list_all(
-        self, sort_by: str = "created_at", order: str = "desc", limit: int = 50
+        self,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        limit: int = 50,
+        after: Optional[Tuple[Union[int, float, datetime], UUID]] = None,
+        description_limit: Optional[int] = None,
     ) -> List[Feature]:
         pass
 
     @abstractmethod
     async def update(self, feature: Feature) -> Feature:
         pass
+
+    @abstractmethod
+    async def increment_votes(self, feature_id: UUID, amount: int = 1) -> Optional[Feature]:
+        pass
+
+    @abstractmethod
+    async def increment_many(self, amounts: Dict[UUID, int]) -> Dict[UUID, int]:
+        pass
+
+    @abstractmethod
+    async def existing_ids(self, feature_ids: Iterable[UUID]) -> Set[UUID]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, feature_id: UUID) -> Optional[Tuple[datetime, int]]:
+        pass
+
+    @abstractmethod
+    async def list_watermark(self) -> int:
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Tuple[Feature, float]]:
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from domain.value_objects import Vote
@@ -10,6 +11,14 @@ class VoteRepository(ABC):
     async def create(self, vote: Vote) -> Vote:
         pass
 
+    @abstractmethod
+    async def create_if_absent(self, vote: Vote) -> bool:
+        pass
+
+    @abstractmethod
+    async def create_many(self, votes: List[Vote]) -> List[Vote]:
+        pass
+
     @abstractmethod
     async def get_by_feature_and_user(
         self, feature_id: UUID, user_identifier: str
@@ -19,3 +28,19 @@ class VoteRepository(ABC):
     @abstractmethod
     async def exists(self, feature_id: UUID, user_identifier: str) -> bool:
         pass
+
+    @abstractmethod
+    async def has_voted_many(
+        self, user_identifier: str, feature_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        pass
+
+    @abstractmethod
+    async def vote_histogram(
+        self,
+        feature_id: UUID,
+        start: datetime,
+        end: datetime,
+        granularity: str = "hour",
+    ) -> List[Tuple[datetime, int]]:
+        pass
@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+from domain.exceptions import InvalidCursorException
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorException(cursor)
+
+    if not isinstance(payload, dict):
+        raise InvalidCursorException(cursor)
+    return payload
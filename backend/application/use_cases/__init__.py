@@ -1,11 +1,17 @@
+from .bulk_upvote_features import BulkUpvoteFeaturesUseCase
 from .create_feature import CreateFeatureUseCase
 from .get_feature import GetFeatureUseCase
+from .get_vote_histogram import GetVoteHistogramUseCase
 from .list_features import ListFeaturesUseCase
+from .search_features import SearchFeaturesUseCase
 from .upvote_feature import UpvoteFeatureUseCase
 
 __all__ = [
+    "BulkUpvoteFeaturesUseCase",
     "CreateFeatureUseCase",
     "GetFeatureUseCase",
+    "GetVoteHistogramUseCase",
     "ListFeaturesUseCase",
+    "SearchFeaturesUseCase",
     "UpvoteFeatureUseCase",
 ]
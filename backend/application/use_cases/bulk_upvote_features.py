@@ -0,0 +1,77 @@
+from collections import Counter
+from typing import List, Optional
+
+from application.dtos import BulkVoteItemDTO, BulkVoteResultDTO
+from application.interfaces.caches import LeaderboardCache, VoteMembershipFilter
+from application.interfaces.events import VoteEventPublisher
+from application.interfaces.repositories import FeatureRepository, VoteRepository
+from domain.value_objects import Vote
+
+VOTE_CREATED = "created"
+VOTE_DUPLICATE = "duplicate"
+VOTE_FEATURE_NOT_FOUND = "not_found"
+
+
+class BulkUpvoteFeaturesUseCase:
+    def __init__(
+        self,
+        feature_repository: FeatureRepository,
+        vote_repository: VoteRepository,
+        leaderboard: Optional[LeaderboardCache] = None,
+        vote_filter: Optional[VoteMembershipFilter] = None,
+        event_publisher: Optional[VoteEventPublisher] = None,
+    ):
+        self.feature_repository = feature_repository
+        self.vote_repository = vote_repository
+        self.leaderboard = leaderboard
+        self.vote_filter = vote_filter
+        self.event_publisher = event_publisher
+
+    async def execute(self, items: List[BulkVoteItemDTO]) -> List[BulkVoteResultDTO]:
+        existing_ids = await self.feature_repository.existing_ids(
+            item.feature_id for item in items
+        )
+
+        candidates = {}
+        for item in items:
+            key = (item.feature_id, item.user_identifier)
+            if item.feature_id in existing_ids and key not in candidates:
+                candidates[key] = Vote(
+                    feature_id=item.feature_id, user_identifier=item.user_identifier
+                )
+
+        created = await self.vote_repository.create_many(list(candidates.values()))
+        counts = await self.feature_repository.increment_many(
+            Counter(vote.feature_id for vote in created)
+        )
+
+        if self.event_publisher:
+            for feature_id, votes_count in counts.items():
+                self.event_publisher.publish(feature_id, votes_count)
+
+        if self.leaderboard and created:
+            self.leaderboard.invalidate()
+
+        if self.vote_filter:
+            for vote in created:
+                self.vote_filter.add(vote.feature_id, vote.user_identifier)
+
+        pending = {(vote.feature_id, vote.user_identifier) for vote in created}
+        results = []
+        for item in items:
+            key = (item.feature_id, item.user_identifier)
+            if item.feature_id not in existing_ids:
+                status = VOTE_FEATURE_NOT_FOUND
+            elif key in pending:
+                status = VOTE_CREATED
+                pending.discard(key)
+            else:
+                status = VOTE_DUPLICATE
+            results.append(
+                BulkVoteResultDTO(
+                    feature_id=item.feature_id,
+                    user_identifier=item.user_identifier,
+                    status=status,
+                )
+            )
+        return results
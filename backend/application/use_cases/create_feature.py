@@ -1,14 +1,29 @@
-from application.dtos import CreateFeatureDTO, FeatureResponseDTO
+from typing import Optional
+
+from application.dtos import CreateFeatureDTO, CreatedFeatureDTO, SimilarFeatureDTO
+from application.interfaces.caches import LeaderboardCache, SimilarityIndex
+from application.interfaces.events import VoteEventPublisher
 from application.interfaces.repositories import FeatureRepository
 from domain.entities import Feature
 from domain.exceptions import InvalidFeatureDataException
 
 
 class CreateFeatureUseCase:
-    def __init__(self, feature_repository: FeatureRepository):
+    def __init__(
+        self,
+        feature_repository: FeatureRepository,
+        leaderboard: Optional[LeaderboardCache] = None,
+        event_publisher: Optional[VoteEventPublisher] = None,
+        similarity_index: Optional[SimilarityIndex] = None,
+        similar_limit: int = 5,
+    ):
         self.feature_repository = feature_repository
+        self.leaderboard = leaderboard
+        self.event_publisher = event_publisher
+        self.similarity_index = similarity_index
+        self.similar_limit = similar_limit
 
-    async def execute(self, dto: CreateFeatureDTO) -> FeatureResponseDTO:
+    async def execute(self, dto: CreateFeatureDTO) -> CreatedFeatureDTO:
         if not dto.title or len(dto.title) > 200:
             raise InvalidFeatureDataException("Title must be between 1 and 200 characters")
 
@@ -18,6 +33,15 @@ class CreateFeatureUseCase:
         if not dto.author_name or len(dto.author_name) > 100:
             raise InvalidFeatureDataException("Author name must be between 1 and 100 characters")
 
+        similar_features = []
+        if self.similarity_index:
+            similar_features = [
+                SimilarFeatureDTO(id=feature_id, title=title, similarity=score)
+                for feature_id, title, score in self.similarity_index.query(
+                    dto.title, dto.description, self.similar_limit
+                )
+            ]
+
         feature = Feature(
             title=dto.title,
             description=dto.description,
@@ -26,7 +50,18 @@ class CreateFeatureUseCase:
 
         created_feature = await self.feature_repository.create(feature)
 
-        return FeatureResponseDTO(
+        if self.leaderboard:
+            self.leaderboard.record(created_feature)
+
+        if self.similarity_index:
+            self.similarity_index.add(
+                created_feature.id, created_feature.title, created_feature.description
+            )
+
+        if self.event_publisher:
+            self.event_publisher.publish(created_feature.id, created_feature.votes_count)
+
+        return CreatedFeatureDTO(
             id=created_feature.id,
             title=created_feature.title,
             description=created_feature.description,
@@ -34,4 +69,5 @@ class CreateFeatureUseCase:
             votes_count=created_feature.votes_count,
             created_at=created_feature.created_at,
             updated_at=created_feature.updated_at,
+            similar_features=similar_features,
         )
@@ -1,16 +1,28 @@
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable, Optional, Tuple, TypeVar
 from uuid import UUID
 
 from application.dtos import FeatureResponseDTO
+from application.interfaces.caches import RequestCoalescer
 from application.interfaces.repositories import FeatureRepository
 from domain.exceptions import FeatureNotFoundException
 
+T = TypeVar("T")
+
 
 class GetFeatureUseCase:
-    def __init__(self, feature_repository: FeatureRepository):
+    def __init__(
+        self,
+        feature_repository: FeatureRepository,
+        coalescer: Optional[RequestCoalescer] = None,
+    ):
         self.feature_repository = feature_repository
+        self.coalescer = coalescer
 
     async def execute(self, feature_id: UUID) -> FeatureResponseDTO:
-        feature = await self.feature_repository.get_by_id(feature_id)
+        feature = await self._coalesce(
+            ("feature", feature_id), lambda: self.feature_repository.get_by_id(feature_id)
+        )
 
         if not feature:
             raise FeatureNotFoundException(str(feature_id))
@@ -24,3 +36,19 @@ class GetFeatureUseCase:
             created_at=feature.created_at,
             updated_at=feature.updated_at,
         )
+
+    async def get_version(self, feature_id: UUID) -> Tuple[datetime, int]:
+        version = await self._coalesce(
+            ("feature_version", feature_id),
+            lambda: self.feature_repository.get_version(feature_id),
+        )
+
+        if not version:
+            raise FeatureNotFoundException(str(feature_id))
+
+        return version
+
+    async def _coalesce(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        if self.coalescer is None:
+            return await call()
+        return await self.coalescer.run(key, call)
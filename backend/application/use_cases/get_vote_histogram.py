@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from application.dtos import VoteHistogramBucketDTO, VoteHistogramDTO
+from application.interfaces.repositories import FeatureRepository, VoteRepository
+from domain.exceptions import FeatureNotFoundException, InvalidFeatureDataException
+
+BUCKET_WIDTHS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+DEFAULT_BUCKETS = {"hour": 24, "day": 30}
+MAX_HISTOGRAM_BUCKETS = 1000
+
+
+class GetVoteHistogramUseCase:
+    def __init__(
+        self, feature_repository: FeatureRepository, vote_repository: VoteRepository
+    ):
+        self.feature_repository = feature_repository
+        self.vote_repository = vote_repository
+
+    async def execute(
+        self,
+        feature_id: UUID,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        granularity: str = "hour",
+    ) -> VoteHistogramDTO:
+        if granularity not in BUCKET_WIDTHS:
+            raise InvalidFeatureDataException(
+                f"Granularity must be one of: {', '.join(BUCKET_WIDTHS)}"
+            )
+        width = BUCKET_WIDTHS[granularity]
+
+        end = self._truncate(self._to_utc(end) if end else datetime.utcnow(), granularity)
+        end += width
+        start = (
+            self._truncate(self._to_utc(start), granularity)
+            if start
+            else end - width * DEFAULT_BUCKETS[granularity]
+        )
+
+        if start >= end:
+            raise InvalidFeatureDataException("Histogram start must be before end")
+        if (end - start) / width > MAX_HISTOGRAM_BUCKETS:
+            raise InvalidFeatureDataException(
+                f"Histogram range cannot exceed {MAX_HISTOGRAM_BUCKETS} buckets"
+            )
+
+        if not await self.feature_repository.get_version(feature_id):
+            raise FeatureNotFoundException(str(feature_id))
+
+        counts = dict(
+            await self.vote_repository.vote_histogram(feature_id, start, end, granularity)
+        )
+
+        buckets = []
+        bucket = start
+        while bucket < end:
+            buckets.append(
+                VoteHistogramBucketDTO(bucket_start=bucket, count=counts.get(bucket, 0))
+            )
+            bucket += width
+
+        return VoteHistogramDTO(
+            feature_id=feature_id,
+            granularity=granularity,
+            start=start,
+            end=end,
+            buckets=buckets,
+        )
+
+    def _to_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def _truncate(self, value: datetime, granularity: str) -> datetime:
+        value = value.replace(minute=0, second=0, microsecond=0)
+        if granularity == "day":
+            value = value.replace(hour=0)
+        return value
@@ -1,17 +1,40 @@
-from typing import List
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable, List, Optional, TypeVar
+from uuid import UUID
 
-from application.dtos import FeatureResponseDTO
-from application.interfaces.repositories import FeatureRepository
+from application.dtos import FeaturePageDTO, FeatureResponseDTO
+from application.interfaces.caches import LeaderboardCache, RequestCoalescer
+from application.interfaces.repositories import FeatureRepository, VoteRepository
+from application.pagination import decode_cursor, encode_cursor
+from domain.entities import Feature
+from domain.exceptions import InvalidCursorException
+
+T = TypeVar("T")
 
 
 class ListFeaturesUseCase:
-    def __init__(self, feature_repository: FeatureRepository):
+    def __init__(
+        self,
+        feature_repository: FeatureRepository,
+        leaderboard: Optional[LeaderboardCache] = None,
+        vote_repository: Optional[VoteRepository] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ):
         self.feature_repository = feature_repository
+        self.leaderboard = leaderboard
+        self.vote_repository = vote_repository
+        self.coalescer = coalescer
 
     async def execute(
-        self, sort_by: str = "created_at", order: str = "desc", limit: int = 50
-    ) -> List[FeatureResponseDTO]:
-        valid_sort_fields = ["votes", "created_at"]
+        self,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        user_identifier: Optional[str] = None,
+        description_limit: Optional[int] = None,
+    ) -> FeaturePageDTO:
+        valid_sort_fields = ["votes", "created_at", "trending"]
         valid_orders = ["asc", "desc"]
 
         if sort_by not in valid_sort_fields:
@@ -23,17 +46,112 @@ class ListFeaturesUseCase:
         if limit < 1 or limit > 100:
             limit = 50
 
-        features = await self.feature_repository.list_all(sort_by, order, limit)
-
-        return [
-            FeatureResponseDTO(
-                id=feature.id,
-                title=feature.title,
-                description=feature.description,
-                author_name=feature.author_name,
-                votes_count=feature.votes_count,
-                created_at=feature.created_at,
-                updated_at=feature.updated_at,
+        if self.leaderboard and sort_by == "votes" and order == "desc" and not cursor:
+            features = await self._top_from_leaderboard(limit + 1)
+        else:
+            features = None
+
+        if features is None:
+            after = self._decode_cursor(cursor, sort_by, order) if cursor else None
+            features = await self._coalesce(
+                ("list", sort_by, order, limit + 1, cursor, description_limit),
+                lambda: self.feature_repository.list_all(
+                    sort_by, order, limit + 1, after, description_limit
+                ),
             )
-            for feature in features
-        ]
+
+        next_cursor = None
+        if len(features) > limit:
+            features = features[:limit]
+            next_cursor = self._encode_cursor(features[-1], sort_by, order)
+
+        voted_ids = None
+        if user_identifier and self.vote_repository:
+            voted_ids = await self._voted_feature_ids(user_identifier, features)
+
+        return FeaturePageDTO(
+            items=[
+                FeatureResponseDTO(
+                    id=feature.id,
+                    title=feature.title,
+                    description=self._preview(feature.description, description_limit),
+                    author_name=feature.author_name,
+                    votes_count=feature.votes_count,
+                    created_at=feature.created_at,
+                    updated_at=feature.updated_at,
+                    has_voted=feature.id in voted_ids if voted_ids is not None else None,
+                )
+                for feature in features
+            ],
+            next_cursor=next_cursor,
+        )
+
+    def _preview(self, description: str, description_limit: Optional[int]) -> str:
+        if description_limit is None or len(description) <= description_limit:
+            return description
+        return description[:description_limit].rstrip() + "…"
+
+    async def watermark(self) -> int:
+        return await self._coalesce(
+            ("list_watermark",), self.feature_repository.list_watermark
+        )
+
+    async def _voted_feature_ids(self, user_identifier: str, features: List[Feature]):
+        candidates = [feature.id for feature in features]
+        if not candidates:
+            return set()
+        return await self.vote_repository.has_voted_many(user_identifier, candidates)
+
+    async def _top_from_leaderboard(self, limit: int) -> Optional[List[Feature]]:
+        features = self.leaderboard.get_top(limit)
+        if features is not None:
+            return features
+
+        if limit > self.leaderboard.capacity:
+            return None
+
+        features = await self._coalesce(
+            ("leaderboard", self.leaderboard.capacity),
+            lambda: self.feature_repository.list_all(
+                "votes", "desc", self.leaderboard.capacity
+            ),
+        )
+        self.leaderboard.load(features)
+        return features[:limit]
+
+    async def _coalesce(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        if self.coalescer is None:
+            return await call()
+        return await self.coalescer.run(key, call)
+
+    def _encode_cursor(self, feature: Feature, sort_by: str, order: str) -> str:
+        if sort_by == "votes":
+            value = feature.votes_count
+        elif sort_by == "trending":
+            value = feature.trending_score
+        else:
+            value = feature.created_at.isoformat()
+        return encode_cursor(
+            {"sort_by": sort_by, "order": order, "value": value, "id": str(feature.id)}
+        )
+
+    def _decode_cursor(self, cursor: str, sort_by: str, order: str):
+        payload = decode_cursor(cursor)
+
+        if payload.get("sort_by") != sort_by or payload.get("order") != order:
+            raise InvalidCursorException(cursor)
+
+        try:
+            value = payload["value"]
+            if sort_by == "votes":
+                if not isinstance(value, int):
+                    raise ValueError(value)
+            elif sort_by == "trending":
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(value)
+                value = float(value)
+            else:
+                value = datetime.fromisoformat(value)
+            return value, UUID(payload["id"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursorException(cursor)
@@ -0,0 +1,58 @@
+from typing import Optional, Tuple
+from uuid import UUID
+
+from application.dtos import FeaturePageDTO, FeatureResponseDTO
+from application.interfaces.repositories import FeatureRepository
+from application.pagination import decode_cursor, encode_cursor
+from domain.exceptions import InvalidCursorException, InvalidFeatureDataException
+
+
+class SearchFeaturesUseCase:
+    def __init__(self, feature_repository: FeatureRepository):
+        self.feature_repository = feature_repository
+
+    async def execute(
+        self, query: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> FeaturePageDTO:
+        query = query.strip()
+        if not query or len(query) > 200:
+            raise InvalidFeatureDataException("Search query must be between 1 and 200 characters")
+
+        if limit < 1 or limit > 100:
+            limit = 20
+
+        after = self._decode_cursor(cursor, query) if cursor else None
+        matches = await self.feature_repository.search(query, limit + 1, after)
+
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            feature, rank = matches[-1]
+            next_cursor = encode_cursor({"q": query, "rank": rank, "id": str(feature.id)})
+
+        return FeaturePageDTO(
+            items=[
+                FeatureResponseDTO(
+                    id=feature.id,
+                    title=feature.title,
+                    description=feature.description,
+                    author_name=feature.author_name,
+                    votes_count=feature.votes_count,
+                    created_at=feature.created_at,
+                    updated_at=feature.updated_at,
+                )
+                for feature, _ in matches
+            ],
+            next_cursor=next_cursor,
+        )
+
+    def _decode_cursor(self, cursor: str, query: str) -> Tuple[float, UUID]:
+        payload = decode_cursor(cursor)
+
+        if payload.get("q") != query:
+            raise InvalidCursorException(cursor)
+
+        try:
+            return float(payload["rank"]), UUID(payload["id"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursorException(cursor)
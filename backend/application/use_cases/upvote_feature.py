@@ -1,6 +1,9 @@
+from typing import Optional
 from uuid import UUID
 
 from application.dtos import FeatureResponseDTO, VoteDTO
+from application.interfaces.caches import LeaderboardCache, VoteMembershipFilter
+from application.interfaces.events import VoteEventPublisher
 from application.interfaces.repositories import FeatureRepository, VoteRepository
 from domain.exceptions import DuplicateVoteException, FeatureNotFoundException
 from domain.value_objects import Vote
@@ -8,29 +11,42 @@ from domain.value_objects import Vote
 
 class UpvoteFeatureUseCase:
     def __init__(
-        self, feature_repository: FeatureRepository, vote_repository: VoteRepository
+        self,
+        feature_repository: FeatureRepository,
+        vote_repository: VoteRepository,
+        leaderboard: Optional[LeaderboardCache] = None,
+        vote_filter: Optional[VoteMembershipFilter] = None,
+        event_publisher: Optional[VoteEventPublisher] = None,
     ):
         self.feature_repository = feature_repository
         self.vote_repository = vote_repository
+        self.leaderboard = leaderboard
+        self.vote_filter = vote_filter
+        self.event_publisher = event_publisher
 
     async def execute(self, feature_id: UUID, dto: VoteDTO) -> FeatureResponseDTO:
-        feature = await self.feature_repository.get_by_id(feature_id)
+        vote = Vote(feature_id=feature_id, user_identifier=dto.user_identifier)
+        created = await self.vote_repository.create_if_absent(vote)
 
-        if not feature:
-            raise FeatureNotFoundException(str(feature_id))
+        if not created:
+            feature = await self.feature_repository.get_by_id(feature_id)
+            if not feature:
+                raise FeatureNotFoundException(str(feature_id))
+            raise DuplicateVoteException(str(feature_id), dto.user_identifier)
 
-        vote_exists = await self.vote_repository.exists(
-            feature_id, dto.user_identifier
-        )
+        if self.vote_filter:
+            self.vote_filter.add(feature_id, dto.user_identifier)
 
-        if vote_exists:
-            raise DuplicateVoteException(str(feature_id), dto.user_identifier)
+        updated_feature = await self.feature_repository.increment_votes(feature_id)
 
-        vote = Vote(feature_id=feature_id, user_identifier=dto.user_identifier)
-        await self.vote_repository.create(vote)
+        if not updated_feature:
+            raise FeatureNotFoundException(str(feature_id))
+
+        if self.leaderboard:
+            self.leaderboard.record(updated_feature)
 
-        feature.increment_vote()
-        updated_feature = await self.feature_repository.update(feature)
+        if self.event_publisher:
+            self.event_publisher.publish(updated_feature.id, updated_feature.votes_count)
 
         return FeatureResponseDTO(
             id=updated_feature.id,
@@ -0,0 +1,350 @@
+import argparse
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+DEFAULT_MIX = {
+    "create": 5,
+    "list_votes": 20,
+    "list_created_at": 15,
+    "get": 30,
+    "upvote": 25,
+    "upvote_duplicate": 5,
+}
+
+query_counter: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar(
+    "query_counter", default=None
+)
+
+
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+async def call(app, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, int]:
+    path, _, query = path.partition("?")
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"benchmark")]
+    if body is not None:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(payload)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    sent = False
+    status = 0
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.Event().wait()
+        sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    counter = [0]
+    token = query_counter.set(counter)
+    try:
+        await app(scope, receive, send)
+    finally:
+        query_counter.reset(token)
+    return status, counter[0]
+
+
+async def seed(session_maker, features: int, votes_per_feature: int):
+    from sqlalchemy import insert
+
+    from domain.entities import Feature
+    from domain.value_objects import Vote
+    from infrastructure.database.models import FeatureModel
+    from infrastructure.memory import get_in_memory_store
+    from infrastructure.repositories import get_feature_repository, get_vote_repository
+
+    now = datetime.utcnow()
+    seeded = [
+        Feature(
+            title=f"Benchmark feature {i}",
+            description=f"Seeded by benchmarks.api run at {now.isoformat()}",
+            author_name="api-benchmark",
+            created_at=now - timedelta(seconds=i),
+            updated_at=now,
+        )
+        for i in range(features)
+    ]
+    async with session_maker() as session:
+        feature_repo = get_feature_repository(session)
+        vote_repo = get_vote_repository(session)
+
+        if get_in_memory_store() is not None:
+            for feature in seeded:
+                await feature_repo.create(feature)
+        else:
+            rows = [
+                {
+                    "id": feature.id,
+                    "title": feature.title,
+                    "description": feature.description,
+                    "author_name": feature.author_name,
+                    "votes_count": 0,
+                    "created_at": feature.created_at,
+                    "updated_at": feature.updated_at,
+                }
+                for feature in seeded
+            ]
+            for start in range(0, len(rows), 1000):
+                await session.execute(insert(FeatureModel), rows[start : start + 1000])
+
+        votes = [
+            Vote(feature_id=feature.id, user_identifier=f"seed-{n}")
+            for feature in seeded
+            for n in range(random.randint(0, votes_per_feature))
+        ]
+        for start in range(0, len(votes), 1000):
+            created = await vote_repo.create_many(votes[start : start + 1000])
+            await feature_repo.increment_many(Counter(vote.feature_id for vote in created))
+        await session.commit()
+
+    return [feature.id for feature in seeded], [
+        (vote.feature_id, vote.user_identifier) for vote in votes
+    ]
+
+
+def percentile(cuts: List[float], p: int) -> float:
+    return cuts[p - 1] if cuts else 0.0
+
+
+def summarize(samples: Dict[str, List[Tuple[float, int, int]]], elapsed: float) -> dict:
+    routes = {}
+    for operation, results in sorted(samples.items()):
+        latencies = [latency for latency, _, _ in results]
+        queries = [count for _, count, _ in results]
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        routes[operation] = {
+            "requests": len(results),
+            "throughput_rps": len(results) / elapsed,
+            "p50_ms": percentile(cuts, 50),
+            "p95_ms": percentile(cuts, 95),
+            "p99_ms": percentile(cuts, 99),
+            "mean_ms": statistics.fmean(latencies),
+            "queries_mean": statistics.fmean(queries),
+            "queries_max": max(queries),
+            "statuses": dict(Counter(str(status) for _, _, status in results)),
+        }
+    return routes
+
+
+async def run(args) -> dict:
+    from sqlalchemy import event
+
+    from infrastructure.database.connection import async_session_maker, engine
+    from main import app
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+
+    mix = dict(DEFAULT_MIX)
+    for item in args.mix or []:
+        operation, _, weight = item.partition("=")
+        if operation not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown operation in --mix: {operation}")
+        mix[operation] = int(weight)
+    operations = [operation for operation, weight in mix.items() if weight > 0]
+    weights = [mix[operation] for operation in operations]
+
+    async with app.router.lifespan_context(app):
+        print(f"Seeding {args.features} features...", file=sys.stderr)
+        feature_ids, voted = await seed(async_session_maker, args.features, args.seed_votes)
+        voters = itertools.count()
+        samples: Dict[str, List[Tuple[float, int, int]]] = defaultdict(list)
+
+        async def request(operation: str) -> Tuple[int, int]:
+            feature_id = random.choice(feature_ids)
+            if operation == "create":
+                return await call(
+                    app,
+                    "POST",
+                    "/api/v1/features",
+                    {
+                        "title": f"Benchmark feature {uuid4().hex[:8]}",
+                        "description": "Created by benchmarks.api",
+                        "author_name": "api-benchmark",
+                    },
+                )
+            if operation == "list_votes":
+                return await call(app, "GET", f"/api/v1/features?sort_by=votes&limit={args.page_size}")
+            if operation == "list_created_at":
+                return await call(
+                    app, "GET", f"/api/v1/features?sort_by=created_at&limit={args.page_size}"
+                )
+            if operation == "get":
+                return await call(app, "GET", f"/api/v1/features/{feature_id}")
+            if operation == "upvote_duplicate" and voted:
+                feature_id, user_identifier = random.choice(voted)
+            else:
+                user_identifier = f"bench-{next(voters)}"
+            status, queries = await call(
+                app,
+                "POST",
+                f"/api/v1/features/{feature_id}/vote",
+                {"user_identifier": user_identifier},
+            )
+            if status in (200, 202):
+                voted.append((feature_id, user_identifier))
+            return status, queries
+
+        async def worker(deadline: float) -> None:
+            while time.perf_counter() < deadline:
+                operation = random.choices(operations, weights)[0]
+                started = time.perf_counter()
+                status, queries = await request(operation)
+                samples[operation].append(
+                    ((time.perf_counter() - started) * 1000, queries, status)
+                )
+
+        if args.warmup > 0:
+            await asyncio.gather(
+                *(worker(time.perf_counter() + args.warmup) for _ in range(args.concurrency))
+            )
+            samples.clear()
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(worker(deadline) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    event.remove(engine.sync_engine, "before_cursor_execute", count_query)
+
+    total = sum(len(results) for results in samples.values())
+    return {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "backend": os.environ.get("REPOSITORY_BACKEND", "sqlalchemy"),
+        "config": {
+            "features": args.features,
+            "seed_votes": args.seed_votes,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "page_size": args.page_size,
+            "mix": mix,
+        },
+        "total": {"requests": total, "throughput_rps": total / elapsed},
+        "routes": summarize(samples, elapsed),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: dict, baseline: Optional[dict]) -> None:
+    header = f"{'route':<18} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8}"
+    if baseline:
+        header += f" {'Δp50':>8} {'Δp95':>8}"
+    print(header)
+    for operation, stats in results["routes"].items():
+        line = (
+            f"{operation:<18} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {stats['queries_mean']:>8.2f}"
+        )
+        previous = (baseline or {}).get("routes", {}).get(operation)
+        if previous:
+            line += (
+                f" {relative(stats['p50_ms'], previous['p50_ms']):>8}"
+                f" {relative(stats['p95_ms'], previous['p95_ms']):>8}"
+            )
+        print(line)
+    print(f"{'total':<18} {results['total']['throughput_rps']:>9.1f}")
+
+
+def relative(current: float, previous: float) -> str:
+    if not previous:
+        return "n/a"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive a mixed workload through the in-process API and report per-route latency"
+    )
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Postgres URL for the sqlalchemy backend (a local or throwaway instance)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["sqlalchemy", "memory"],
+        help="Repository backend (default: REPOSITORY_BACKEND or sqlalchemy); "
+        "memory needs no database and is the stand-in for quick local runs",
+    )
+    parser.add_argument("--features", type=int, default=2000)
+    parser.add_argument("--seed-votes", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mix", nargs="+", metavar="OPERATION=WEIGHT", help=f"Override {sorted(DEFAULT_MIX)}"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Baseline JSON results to diff against")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    if args.backend:
+        os.environ["REPOSITORY_BACKEND"] = args.backend
+    os.environ.setdefault("DATABASE_ECHO", "false")
+    random.seed(args.seed)
+
+    results = asyncio.run(run(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
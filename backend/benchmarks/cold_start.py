@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+from main import app
+imported = time.perf_counter()
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(boot())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "lifespan_ms": (ready - imported) * 1000,
+    "total_ms": (ready - started) * 1000,
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure worker cold start: module import plus lifespan startup"
+    )
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    env = dict(os.environ, DATABASE_ECHO="false")
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+
+    samples = []
+    for _ in range(args.runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", PROBE], env=env, capture_output=True, text=True, check=True
+        )
+        samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    results = {
+        phase: {
+            "median": statistics.median(sample[phase] for sample in samples),
+            "max": max(sample[phase] for sample in samples),
+        }
+        for phase in ("import_ms", "lifespan_ms", "total_ms")
+    }
+
+    print(f"{'phase':<12} {'median ms':>10} {'max ms':>10}")
+    for phase, stats in results.items():
+        print(f"{phase[:-3]:<12} {stats['median']:>10.1f} {stats['max']:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"runs": args.runs, "phases": results}, handle, indent=2)
+
+    if args.budget_ms is not None and results["total_ms"]["max"] > args.budget_ms:
+        raise SystemExit(f"Cold start exceeded budget of {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
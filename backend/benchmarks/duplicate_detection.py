@@ -0,0 +1,188 @@
+import argparse
+import random
+import statistics
+import string
+import time
+from typing import Callable, List, Tuple
+from uuid import UUID, uuid4
+
+from infrastructure.cache.minhash_index import (
+    MinHashSimilarityIndex,
+    containment,
+    description_shingles,
+    title_shingles,
+)
+
+FILLER = ["please", "support", "add", "allow", "option", "feature", "request"]
+
+
+def build_vocabulary(size: int) -> List[str]:
+    return [
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+        for _ in range(size)
+    ]
+
+
+def perturb(title: str) -> str:
+    words = title.split()
+    change = random.choice(["drop", "swap", "typo", "filler", "extend", "case"])
+    if change == "drop" and len(words) > 3:
+        words.pop(random.randrange(len(words)))
+    elif change == "swap" and len(words) > 1:
+        first, second = random.sample(range(len(words)), 2)
+        words[first], words[second] = words[second], words[first]
+    elif change == "typo":
+        position = random.randrange(len(words))
+        word = words[position]
+        cut = random.randrange(len(word))
+        words[position] = word[:cut] + random.choice(string.ascii_lowercase) + word[cut + 1 :]
+    elif change == "filler":
+        words.insert(random.randrange(len(words) + 1), random.choice(FILLER))
+    elif change == "extend":
+        words.extend(random.sample(FILLER, 2))
+    else:
+        words = [word.upper() if random.random() < 0.5 else word.title() for word in words]
+    return " ".join(words)
+
+
+def jaccard(first: set, second: set) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def title_score(first: set, second: set, containment_threshold: float) -> float:
+    score = jaccard(first, second)
+    contained = containment(score, len(first), len(second))
+    return contained if contained >= containment_threshold else score
+
+
+def brute_force(
+    corpus: List[Tuple[UUID, str, str]],
+    threshold: float,
+    containment_threshold: float,
+    limit: int,
+) -> Callable[[str, str], List[UUID]]:
+    shingled = [
+        (feature_id, title_shingles(title), description_shingles(description))
+        for feature_id, title, description in corpus
+    ]
+
+    def query(title: str, description: str) -> List[UUID]:
+        query_title = title_shingles(title)
+        query_description = description_shingles(description)
+        scored = []
+        for feature_id, indexed_title, indexed_description in shingled:
+            score = max(
+                title_score(query_title, indexed_title, containment_threshold),
+                jaccard(query_description, indexed_description),
+            )
+            if score >= threshold:
+                scored.append((score, feature_id))
+        scored.sort(reverse=True)
+        return [feature_id for _, feature_id in scored[:limit]]
+
+    return query
+
+
+def measure(query, queries) -> Tuple[float, List[float]]:
+    found = 0
+    latencies = []
+    for source_id, title, description in queries:
+        started = time.perf_counter()
+        results = query(title, description)
+        latencies.append((time.perf_counter() - started) * 1000)
+        found += source_id in results
+    return found / len(queries), latencies
+
+
+def percentile(latencies: List[float], p: int) -> float:
+    if len(latencies) < 2:
+        return latencies[0] if latencies else 0.0
+    return statistics.quantiles(latencies, n=100)[p - 1]
+
+
+def run(size: int, args) -> dict:
+    vocabulary = build_vocabulary(args.vocabulary)
+    corpus = [
+        (
+            uuid4(),
+            " ".join(random.choices(vocabulary, k=random.randint(3, 7))),
+            " ".join(random.choices(vocabulary, k=random.randint(15, 40))),
+        )
+        for _ in range(size)
+    ]
+
+    index = MinHashSimilarityIndex(
+        args.hashes, args.bands, args.threshold, args.containment_threshold
+    )
+    started = time.perf_counter()
+    for feature_id, title, description in corpus:
+        index.add(feature_id, title, description)
+    build_seconds = time.perf_counter() - started
+
+    queries = [
+        (feature_id, perturb(title), description if args.with_description else "")
+        for feature_id, title, description in random.sample(corpus, min(args.queries, size))
+    ]
+    lsh_recall, lsh_latencies = measure(
+        lambda title, description: [
+            feature_id for feature_id, _, _ in index.query(title, description, args.limit)
+        ],
+        queries,
+    )
+    scan_recall, scan_latencies = measure(
+        brute_force(corpus, args.threshold, args.containment_threshold, args.limit),
+        queries[: args.scan_queries],
+    )
+    return {
+        "size": size,
+        "build_us": build_seconds / size * 1_000_000,
+        "lsh_recall": lsh_recall,
+        "lsh_p50": percentile(lsh_latencies, 50),
+        "lsh_p95": percentile(lsh_latencies, 95),
+        "candidates": index.stats()["candidates_per_query"],
+        "scan_recall": scan_recall,
+        "scan_p50": percentile(scan_latencies, 50),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure near-duplicate recall and query latency of the MinHash LSH index "
+        "against an exact Jaccard scan on a synthetic corpus"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--scan-queries", type=int, default=50)
+    parser.add_argument("--vocabulary", type=int, default=5000)
+    parser.add_argument("--hashes", type=int, default=64)
+    parser.add_argument("--bands", type=int, default=32)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--containment-threshold", type=float, default=0.9)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument(
+        "--with-description",
+        action="store_true",
+        help="Send the original description with each query (default: title only)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    print(
+        f"{'features':>9} {'build us':>9} {'lsh recall':>11} {'lsh p50 ms':>11} "
+        f"{'lsh p95 ms':>11} {'candidates':>11} {'scan recall':>12} {'scan p50 ms':>12}"
+    )
+    for size in args.sizes:
+        result = run(size, args)
+        print(
+            f"{result['size']:>9} {result['build_us']:>9.1f} {result['lsh_recall']:>11.3f} "
+            f"{result['lsh_p50']:>11.3f} {result['lsh_p95']:>11.3f} "
+            f"{result['candidates']:>11.1f} {result['scan_recall']:>12.3f} "
+            f"{result['scan_p50']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
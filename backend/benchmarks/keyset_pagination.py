@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import Base, FeatureModel
+from infrastructure.database.repositories import FeatureRepositoryImpl
+
+SEED_SQL = text(
+    """
+    INSERT INTO features (id, title, description, author_name, votes_count, created_at, updated_at)
+    SELECT
+        gen_random_uuid(),
+        'Benchmark feature ' || n,
+        'Seeded by benchmarks.keyset_pagination',
+        'benchmark',
+        (random() * 10000)::int,
+        now() - (n || ' seconds')::interval,
+        now()
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    existing = await session.scalar(select(func.count()).select_from(FeatureModel))
+    if existing < rows:
+        print(f"Seeding {rows - existing} features...")
+        await session.execute(SEED_SQL, {"count": rows - existing})
+        await session.commit()
+        await session.execute(text("ANALYZE features"))
+
+
+async def time_query(run, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare OFFSET and keyset pagination latency by page depth"
+    )
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sort-by", choices=["votes", "created_at"], default="votes")
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[0, 1_000, 10_000, 100_000, 900_000]
+    )
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        await seed(session, args.rows)
+        repo = FeatureRepositoryImpl(session)
+        sort_column = (
+            FeatureModel.votes_count if args.sort_by == "votes" else FeatureModel.created_at
+        )
+
+        print(f"{'depth':>10} {'offset ms':>12} {'keyset ms':>12}")
+        for depth in args.depths:
+            offset_query = (
+                select(FeatureModel)
+                .order_by(sort_column.desc(), FeatureModel.id.desc())
+                .offset(depth)
+                .limit(args.page_size)
+            )
+            anchor = None
+            if depth:
+                row = (
+                    await session.execute(
+                        select(sort_column, FeatureModel.id)
+                        .order_by(sort_column.desc(), FeatureModel.id.desc())
+                        .offset(depth - 1)
+                        .limit(1)
+                    )
+                ).one()
+                anchor = (row[0], row[1])
+
+            async def run_offset():
+                await session.execute(offset_query)
+
+            async def run_keyset():
+                await repo.list_all(args.sort_by, "desc", args.page_size, anchor)
+
+            offset_ms = await time_query(run_offset, args.repeat)
+            keyset_ms = await time_query(run_keyset, args.repeat)
+            print(f"{depth:>10} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
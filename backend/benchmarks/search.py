@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import Base, FeatureModel
+from infrastructure.database.repositories import FeatureRepositoryImpl
+
+WORDS = (
+    "dark mode theme export csv pdf sync offline mobile widget calendar "
+    "notification email slack integration search filter sort keyboard shortcut "
+    "accessibility contrast font language translation billing invoice report "
+    "dashboard chart api webhook token login sso password avatar profile"
+).split()
+
+SEED_SQL = text(
+    """
+    INSERT INTO features (id, title, description, author_name, votes_count, created_at, updated_at)
+    SELECT
+        gen_random_uuid(),
+        (:words)[1 + (random() * (cardinality(:words) - 1))::int] || ' '
+            || (:words)[1 + (random() * (cardinality(:words) - 1))::int],
+        (
+            SELECT string_agg((:words)[1 + (random() * (cardinality(:words) - 1))::int], ' ')
+            FROM generate_series(1, 40 + n % 2)
+        ),
+        'benchmark',
+        0,
+        now(),
+        now()
+    FROM generate_series(1, :count) AS n
+    """
+)
+
+
+async def timed(run, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare full-text search latency with an ILIKE scan"
+    )
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--queries", nargs="+", default=["dark mode", "slack webhook", "csv"])
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        existing = await session.scalar(select(func.count()).select_from(FeatureModel))
+        if existing < args.rows:
+            print(f"Seeding {args.rows - existing} features...")
+            await session.execute(SEED_SQL, {"count": args.rows - existing, "words": WORDS})
+            await session.commit()
+            await session.execute(text("ANALYZE features"))
+
+        repo = FeatureRepositoryImpl(session)
+        print(f"{'query':>16} {'fts ms':>10} {'fts p2 ms':>10} {'ilike ms':>10}")
+        for query in args.queries:
+            first_page = await repo.search(query, args.limit)
+            anchor = (first_page[-1][1], first_page[-1][0].id) if first_page else None
+
+            async def run_search():
+                await repo.search(query, args.limit)
+
+            async def run_second_page():
+                await repo.search(query, args.limit, anchor)
+
+            async def run_ilike():
+                await session.execute(
+                    select(FeatureModel.id)
+                    .where(FeatureModel.description.ilike(f"%{query}%"))
+                    .limit(args.limit)
+                )
+
+            print(
+                f"{query:>16} {await timed(run_search, args.repeat):>10.2f} "
+                f"{await timed(run_second_page, args.repeat):>10.2f} "
+                f"{await timed(run_ilike, args.repeat):>10.2f}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+import argparse
+import timeit
+from collections import namedtuple
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from application.dtos import FeatureResponseDTO
+from infrastructure.database.models import FeatureModel
+from infrastructure.database.repositories import FeatureRepositoryImpl
+from presentation.api.http import feature_list_response
+from presentation.api.schemas import FeatureResponse
+
+response_adapter = TypeAdapter(List[FeatureResponse])
+repo = FeatureRepositoryImpl(session=None, counter_shards=0)
+
+
+def make_columns(count: int, description_size: int):
+    now = datetime.utcnow()
+    return [
+        {
+            "id": uuid4(),
+            "title": f"Feature {i}",
+            "description": "x" * description_size,
+            "author_name": "benchmark",
+            "votes_count": i,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def to_dto(feature) -> FeatureResponseDTO:
+    return FeatureResponseDTO(
+        id=feature.id,
+        title=feature.title,
+        description=feature.description,
+        author_name=feature.author_name,
+        votes_count=feature.votes_count,
+        created_at=feature.created_at,
+        updated_at=feature.updated_at,
+    )
+
+
+def orm_path(columns):
+    entities = [repo._to_entity(FeatureModel(**values)) for values in columns]
+    responses = [FeatureResponse(**to_dto(entity).__dict__) for entity in entities]
+    validated = response_adapter.validate_python(responses)
+    return JSONResponse(jsonable_encoder(response_adapter.dump_python(validated, mode="json")))
+
+
+def fast_path(rows):
+    entities = [repo._row_to_entity(row) for row in rows]
+    return feature_list_response([to_dto(entity) for entity in entities])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-row serialization cost of the ORM and fast list paths"
+    )
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--description-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    columns = make_columns(args.items, args.description_size)
+    row_type = namedtuple("FeatureRow", columns[0].keys())
+    rows = [row_type(**values) for values in columns]
+
+    runs = (
+        ("orm + response_model", lambda: orm_path(columns)),
+        ("fast path", lambda: fast_path(rows)),
+    )
+    for name, run in runs:
+        seconds = min(timeit.repeat(run, number=args.repeat, repeat=3)) / args.repeat
+        print(f"{name:>22}: {seconds * 1e6:10.1f} us/list  {seconds * 1e6 / args.items:8.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
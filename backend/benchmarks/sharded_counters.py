@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import itertools
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos import VoteDTO
+from application.use_cases import UpvoteFeatureUseCase
+from domain.entities import Feature
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import Base
+from infrastructure.database.repositories import FeatureRepositoryImpl, VoteRepositoryImpl
+
+
+async def run_load(session_maker, shards: int, concurrency: int, duration: float) -> float:
+    async with session_maker() as session:
+        feature = await FeatureRepositoryImpl(session, shards).create(
+            Feature(
+                title=f"Hot feature ({shards} shards)",
+                description="Seeded by benchmarks.sharded_counters",
+                author_name="benchmark",
+            )
+        )
+        await session.commit()
+
+    voters = itertools.count()
+    deadline = time.perf_counter() + duration
+    completed = 0
+
+    async def worker():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            async with session_maker() as session:
+                use_case = UpvoteFeatureUseCase(
+                    FeatureRepositoryImpl(session, shards), VoteRepositoryImpl(session)
+                )
+                await use_case.execute(feature.id, VoteDTO(user_identifier=f"load-{next(voters)}"))
+                await session.commit()
+            completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    if shards > 1:
+        async with session_maker() as session:
+            await FeatureRepositoryImpl(session, shards).rollup_vote_shards()
+            await session.commit()
+
+    return completed / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure single-feature upvote throughput by counter shard count"
+    )
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--shards", type=int, nargs="+", default=[0, 4, 16, 64])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        args.database_url, pool_size=args.concurrency, max_overflow=0
+    )
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'shards':>8} {'votes/s':>12}")
+    for shards in args.shards:
+        throughput = await run_load(session_maker, shards, args.concurrency, args.duration)
+        print(f"{shards:>8} {throughput:>12.1f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+import argparse
+import asyncio
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import VoteBucketModel, VoteModel
+from infrastructure.database.repositories.vote_repository_impl import (
+    upsert_vote_buckets,
+    vote_bucket_start,
+)
+
+
+async def backfill(session_maker, before: datetime, chunk_size: int) -> int:
+    processed = 0
+    async with session_maker() as reader, session_maker() as writer:
+        async with writer.begin():
+            await writer.execute(
+                delete(VoteBucketModel).where(VoteBucketModel.bucket_start < before)
+            )
+
+            result = await reader.stream(
+                select(VoteModel.feature_id, VoteModel.created_at)
+                .where(VoteModel.created_at < before)
+                .execution_options(yield_per=chunk_size)
+            )
+            async for rows in result.partitions():
+                counts = Counter(
+                    (row.feature_id, vote_bucket_start(row.created_at)) for row in rows
+                )
+                await writer.execute(upsert_vote_buckets(counts))
+                processed += len(rows)
+                print(f"{processed} votes rolled up")
+    return processed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild hourly vote buckets from existing votes"
+    )
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument(
+        "--before",
+        type=datetime.fromisoformat,
+        default=vote_bucket_start(datetime.utcnow()),
+        help="Only rebuild buckets older than this UTC time (default: start of current hour)",
+    )
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    before = vote_bucket_start(args.before)
+    processed = await backfill(session_maker, before, args.chunk_size)
+    print(f"Rebuilt vote buckets before {before.isoformat()} from {processed} votes")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
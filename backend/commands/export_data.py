@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.bulk import EXPORT_COLUMNS, EXPORT_FORMATS, export_table
+
+
+async def export(session_maker, table: str, fmt: str, chunk_size: int, output) -> int:
+    written = 0
+    async with session_maker() as session:
+        async for chunk in export_table(session, table, fmt, chunk_size):
+            output.write(chunk)
+            written += len(chunk)
+    output.flush()
+    return written
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Stream a table to NDJSON or CSV with a server-side cursor"
+    )
+    parser.add_argument("table", choices=sorted(EXPORT_COLUMNS))
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--output", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    if args.output:
+        with open(args.output, "wb") as output:
+            written = await export(session_maker, args.table, args.format, args.chunk_size, output)
+    else:
+        written = await export(
+            session_maker, args.table, args.format, args.chunk_size, sys.stdout.buffer
+        )
+    print(f"Exported {args.table} ({written} bytes)", file=sys.stderr)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import os
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.bulk import (
+    EXPORT_FORMATS,
+    copy_records,
+    create_staging_tables,
+    merge_staging_tables,
+    read_records,
+)
+from infrastructure.database.repositories import FeatureRepositoryImpl
+
+
+def file_format(path: str, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+    return "csv" if os.path.splitext(path)[1].lower() == ".csv" else "ndjson"
+
+
+async def load(session_maker, files: dict, fmt: str, chunk_size: int) -> dict:
+    async with session_maker() as session:
+        async with session.begin():
+            await create_staging_tables(session)
+            for table, path in files.items():
+                if path is None:
+                    continue
+                copied = 0
+                with open(path, newline="") as handle:
+                    for records in read_records(
+                        handle, table, file_format(path, fmt), chunk_size
+                    ):
+                        await copy_records(session, table, records)
+                        copied += len(records)
+                        print(f"{copied} {table} rows copied")
+
+            feature_repo = FeatureRepositoryImpl(session)
+            await feature_repo.rollup_vote_shards()
+            counts = await merge_staging_tables(session)
+            await feature_repo.recompute_trending_scores()
+    return counts
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk load exported features and votes with COPY and rebuild vote counts"
+    )
+    parser.add_argument("--features", help="Features file (NDJSON or CSV)")
+    parser.add_argument("--votes", help="Votes file (NDJSON or CSV)")
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    parser.add_argument("--format", choices=("auto", *EXPORT_FORMATS), default="auto")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+    if not args.features and not args.votes:
+        parser.error("pass --features and/or --votes")
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    counts = await load(
+        session_maker,
+        {"features": args.features, "votes": args.votes},
+        args.format,
+        args.chunk_size,
+    )
+    print(
+        f"Inserted {counts['features']} features and {counts['votes']} votes; "
+        f"rebuilt votes_count for {counts['recounted']} features"
+    )
+    if get_settings().vote_analytics_enabled and counts["votes"]:
+        print("Run python -m commands.backfill_vote_buckets to roll the new votes into buckets")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.repositories import FeatureRepositoryImpl
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute trending scores with the configured TRENDING_HALF_LIFE_HOURS"
+    )
+    parser.add_argument("--database-url", default=get_settings().database_url)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as session:
+        async with session.begin():
+            updated = await FeatureRepositoryImpl(session).recompute_trending_scores()
+    print(
+        f"Recomputed trending scores for {updated} features "
+        f"(half-life {get_settings().trending_half_life_hours}h)"
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,17 @@ from typing import Optional
 
 
 class Feature:
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "author_name",
+        "votes_count",
+        "created_at",
+        "updated_at",
+        "trending_score",
+    )
+
     def __init__(
         self,
         title: str,
@@ -13,6 +24,7 @@ class Feature:
         votes_count: int = 0,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        trending_score: float = 0.0,
     ):
         self.id = id or uuid4()
         self.title = title
@@ -21,6 +33,7 @@ class Feature:
         self.votes_count = votes_count
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.trending_score = trending_score
 
     def increment_vote(self) -> None:
         self.votes_count += 1
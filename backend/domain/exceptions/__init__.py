@@ -2,6 +2,7 @@ from .domain_exceptions import (
     DomainException,
     DuplicateVoteException,
     FeatureNotFoundException,
+    InvalidCursorException,
     InvalidFeatureDataException,
 )
 
@@ -9,5 +10,6 @@ __all__ = [
     "DomainException",
     "FeatureNotFoundException",
     "DuplicateVoteException",
+    "InvalidCursorException",
     "InvalidFeatureDataException",
 ]
@@ -19,3 +19,9 @@ class DuplicateVoteException(DomainException):
 
 class InvalidFeatureDataException(DomainException):
     pass
+
+
+class InvalidCursorException(DomainException):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor}")
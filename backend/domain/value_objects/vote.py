@@ -4,6 +4,8 @@ from typing import Optional
 
 
 class Vote:
+    __slots__ = ("id", "feature_id", "user_identifier", "created_at")
+
     def __init__(
         self,
         feature_id: UUID,
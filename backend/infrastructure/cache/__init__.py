@@ -0,0 +1,29 @@
+from .idempotency_store import IdempotencyStore, IdempotentResponse, get_idempotency_store
+from .leaderboard_cache import (
+    InMemoryLeaderboardCache,
+    TransactionalLeaderboardCache,
+    get_leaderboard_cache,
+)
+from .minhash_index import (
+    MinHashSimilarityIndex,
+    TransactionalSimilarityIndex,
+    get_similarity_index,
+)
+from .single_flight import SingleFlight, get_single_flight
+from .vote_bloom_filter import VoteBloomFilter, get_vote_bloom_filter
+
+__all__ = [
+    "IdempotencyStore",
+    "IdempotentResponse",
+    "InMemoryLeaderboardCache",
+    "MinHashSimilarityIndex",
+    "SingleFlight",
+    "TransactionalLeaderboardCache",
+    "TransactionalSimilarityIndex",
+    "VoteBloomFilter",
+    "get_idempotency_store",
+    "get_leaderboard_cache",
+    "get_similarity_index",
+    "get_single_flight",
+    "get_vote_bloom_filter",
+]
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import async_session_maker
+from infrastructure.database.models import IdempotencyKeyModel
+
+PRUNE_INTERVAL = 1000
+PRUNE_BATCH_SIZE = 1000
+
+
+class IdempotentResponse:
+    __slots__ = ("fingerprint", "status_code", "headers", "body")
+
+    def __init__(
+        self,
+        fingerprint: str,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+    ):
+        self.fingerprint = fingerprint
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+class IdempotencyStore:
+    def __init__(
+        self,
+        capacity: int = 10000,
+        ttl_seconds: float = 3600.0,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        lease_seconds: float = 30.0,
+    ):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.conflicts = 0
+        self.pruned = 0
+        self._shared_claims = 0
+        self._entries: "OrderedDict[str, Tuple[float, IdempotentResponse]]" = OrderedDict()
+        self._pending: Dict[str, "asyncio.Future[Optional[IdempotentResponse]]"] = {}
+
+    async def lookup(self, key: str) -> Optional[IdempotentResponse]:
+        response = self._get_local(key)
+        if response is None and self.session_factory is not None:
+            response = await self._get_shared(key)
+            if response is not None:
+                self._put_local(key, response)
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    async def wait(self, key: str) -> Optional[IdempotentResponse]:
+        pending = self._pending.get(key)
+        if pending is None:
+            return None
+        self.waits += 1
+        return await asyncio.shield(pending)
+
+    async def claim(self, key: str, fingerprint: str) -> bool:
+        if key in self._pending:
+            return False
+        if self.session_factory is not None and not await self._claim_shared(key, fingerprint):
+            self.conflicts += 1
+            return False
+        self._pending[key] = asyncio.get_running_loop().create_future()
+        return True
+
+    async def complete(self, key: str, response: IdempotentResponse) -> None:
+        self._put_local(key, response)
+        try:
+            if self.session_factory is not None:
+                await self._save_shared(key, response)
+        finally:
+            self._resolve(key, response)
+
+    async def release(self, key: str) -> None:
+        try:
+            if self.session_factory is not None:
+                async with self.session_factory() as session:
+                    await session.execute(
+                        delete(IdempotencyKeyModel).where(
+                            IdempotencyKeyModel.key == key,
+                            IdempotencyKeyModel.status_code.is_(None),
+                        )
+                    )
+                    await session.commit()
+        finally:
+            self._resolve(key, None)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "waits": self.waits,
+            "conflicts": self.conflicts,
+            "pruned": self.pruned,
+            "size": len(self._entries),
+            "in_flight": len(self._pending),
+        }
+
+    def _get_local(self, key: str) -> Optional[IdempotentResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _put_local(self, key: str, response: IdempotentResponse) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def _resolve(self, key: str, response: Optional[IdempotentResponse]) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(response)
+
+    async def _get_shared(self, key: str) -> Optional[IdempotentResponse]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    IdempotencyKeyModel.fingerprint,
+                    IdempotencyKeyModel.status_code,
+                    IdempotencyKeyModel.headers,
+                    IdempotencyKeyModel.body,
+                ).where(
+                    IdempotencyKeyModel.key == key,
+                    IdempotencyKeyModel.status_code.is_not(None),
+                    IdempotencyKeyModel.expires_at > datetime.utcnow(),
+                )
+            )
+            row = result.one_or_none()
+        if row is None:
+            return None
+        return IdempotentResponse(
+            row.fingerprint,
+            row.status_code,
+            [tuple(header) for header in row.headers],
+            row.body,
+        )
+
+    async def _claim_shared(self, key: str, fingerprint: str) -> bool:
+        now = datetime.utcnow()
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key == key, IdempotencyKeyModel.expires_at <= now
+                )
+            )
+            result = await session.execute(
+                insert(IdempotencyKeyModel)
+                .values(
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=self.lease_seconds),
+                )
+                .on_conflict_do_nothing(index_elements=[IdempotencyKeyModel.key])
+                .returning(IdempotencyKeyModel.key)
+            )
+            claimed = result.scalar_one_or_none() is not None
+
+            self._shared_claims += 1
+            if self._shared_claims % PRUNE_INTERVAL == 0:
+                expired = (
+                    select(IdempotencyKeyModel.key)
+                    .where(IdempotencyKeyModel.expires_at <= now)
+                    .limit(PRUNE_BATCH_SIZE)
+                    .scalar_subquery()
+                )
+                pruned = await session.execute(
+                    delete(IdempotencyKeyModel).where(IdempotencyKeyModel.key.in_(expired))
+                )
+                self.pruned += pruned.rowcount
+            await session.commit()
+        return claimed
+
+    async def _save_shared(self, key: str, response: IdempotentResponse) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key)
+                .values(
+                    status_code=response.status_code,
+                    headers=[list(header) for header in response.headers],
+                    body=response.body,
+                    expires_at=datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+                )
+            )
+            await session.commit()
+
+
+_idempotency_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> Optional[IdempotencyStore]:
+    global _idempotency_store
+    settings = get_settings()
+    if not settings.idempotency_enabled:
+        return None
+    if _idempotency_store is None:
+        _idempotency_store = IdempotencyStore(
+            capacity=settings.idempotency_cache_size,
+            ttl_seconds=settings.idempotency_ttl_seconds,
+            lease_seconds=settings.idempotency_lease_seconds,
+            session_factory=(
+                async_session_maker if settings.idempotency_shared_store_enabled else None
+            ),
+        )
+    return _idempotency_store
@@ -0,0 +1,148 @@
+import bisect
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from application.interfaces.caches import LeaderboardCache
+from domain.entities import Feature
+from infrastructure.config.settings import get_settings
+
+
+def _rank_key(feature: Feature) -> Tuple[int, int]:
+    return (-feature.votes_count, -feature.id.int)
+
+
+class InMemoryLeaderboardCache(LeaderboardCache):
+    def __init__(self, capacity: int = 200, ttl_seconds: float = 30.0):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._keys: List[Tuple[int, int]] = []
+        self._features: Dict[Tuple[int, int], Feature] = {}
+        self._key_by_id: Dict[UUID, Tuple[int, int]] = {}
+        self._complete = False
+        self._loaded_at: Optional[float] = None
+
+    def get_top(self, limit: int) -> Optional[List[Feature]]:
+        if not self._is_fresh() or (not self._complete and len(self._keys) < limit):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [self._features[key] for key in self._keys[:limit]]
+
+    def load(self, features: List[Feature]) -> None:
+        previous = {
+            feature_id: self._features[key] for feature_id, key in self._key_by_id.items()
+        }
+        self._clear()
+        for feature in features[: self.capacity]:
+            cached = previous.get(feature.id)
+            if cached is not None and cached.votes_count > feature.votes_count:
+                feature = cached
+            self._insert(feature)
+        self._complete = len(features) < self.capacity
+        self._loaded_at = time.monotonic()
+
+    def record(self, feature: Feature) -> None:
+        if self._loaded_at is None:
+            return
+
+        self._remove(feature.id)
+        if self._complete or len(self._keys) < self.capacity:
+            self._insert(feature)
+        elif _rank_key(feature) < self._keys[-1]:
+            self._insert(feature)
+
+        if len(self._keys) > self.capacity:
+            self._remove(self._features[self._keys[-1]].id)
+            self._complete = False
+
+    def invalidate(self) -> None:
+        self._clear()
+        self._loaded_at = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._keys)}
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def _insert(self, feature: Feature) -> None:
+        key = _rank_key(feature)
+        bisect.insort(self._keys, key)
+        self._features[key] = feature
+        self._key_by_id[feature.id] = key
+
+    def _remove(self, feature_id: UUID) -> None:
+        key = self._key_by_id.pop(feature_id, None)
+        if key is None:
+            return
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        del self._features[key]
+
+    def _clear(self) -> None:
+        self._keys = []
+        self._features = {}
+        self._key_by_id = {}
+        self._complete = False
+
+
+PENDING_LEADERBOARD_KEY = "pending_leaderboard_updates"
+
+
+class TransactionalLeaderboardCache(LeaderboardCache):
+    def __init__(self, cache: LeaderboardCache, session: AsyncSession):
+        self.cache = cache
+        self.session = session
+        self.capacity = cache.capacity
+
+    def get_top(self, limit: int) -> Optional[List[Feature]]:
+        return self.cache.get_top(limit)
+
+    def load(self, features: List[Feature]) -> None:
+        self.cache.load(features)
+
+    def record(self, feature: Feature) -> None:
+        self._defer(lambda: self.cache.record(feature))
+
+    def invalidate(self) -> None:
+        self._defer(self.cache.invalidate)
+
+    def _defer(self, update) -> None:
+        self.session.sync_session.info.setdefault(PENDING_LEADERBOARD_KEY, []).append(update)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_updates(session: Session) -> None:
+    for update in session.info.pop(PENDING_LEADERBOARD_KEY, None) or []:
+        update()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_updates(session: Session) -> None:
+    session.info.pop(PENDING_LEADERBOARD_KEY, None)
+
+
+_leaderboard_cache: Optional[InMemoryLeaderboardCache] = None
+
+
+def get_leaderboard_cache() -> Optional[InMemoryLeaderboardCache]:
+    global _leaderboard_cache
+    settings = get_settings()
+    if not settings.leaderboard_cache_enabled:
+        return None
+    if _leaderboard_cache is None:
+        _leaderboard_cache = InMemoryLeaderboardCache(
+            capacity=settings.leaderboard_cache_size,
+            ttl_seconds=settings.leaderboard_cache_ttl_seconds,
+        )
+    return _leaderboard_cache
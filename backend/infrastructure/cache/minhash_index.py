@@ -0,0 +1,301 @@
+import asyncio
+import logging
+import random
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from application.interfaces.caches import SimilarityIndex
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import FeatureModel
+
+logger = logging.getLogger(__name__)
+
+PENDING_SIMILARITY_KEY = "pending_similarity_additions"
+
+WORD_PATTERN = re.compile(r"\w+")
+HASH_MASK = (1 << 61) - 1
+MIN_CONTAINMENT_SHINGLES = 8
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+Signature = Tuple[int, ...]
+
+
+def title_shingles(text: str) -> Set[str]:
+    normalized = f" {' '.join(WORD_PATTERN.findall(text.lower()))} "
+    return {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+
+
+def description_shingles(text: str) -> Set[str]:
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+@lru_cache(maxsize=None)
+def _donors(hash_count: int) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(
+        tuple(random.Random(hash_count * 1_000_003 + slot).sample(range(hash_count), hash_count))
+        for slot in range(hash_count)
+    )
+
+
+def minhash(shingles: Iterable[str], hash_count: int) -> Optional[Signature]:
+    empty = HASH_MASK + 1
+    bins = [empty] * hash_count
+    for shingle in shingles:
+        value = hash(shingle) & HASH_MASK
+        slot = value % hash_count
+        if value < bins[slot]:
+            bins[slot] = value
+    if empty not in bins:
+        return tuple(bins)
+    if bins.count(empty) == hash_count:
+        return None
+
+    donors = _donors(hash_count)
+    signature = list(bins)
+    for slot, value in enumerate(bins):
+        if value != empty:
+            continue
+        for donor in donors[slot]:
+            if bins[donor] != empty:
+                signature[slot] = bins[donor]
+                break
+    return tuple(signature)
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def containment(jaccard: float, first_size: int, second_size: int) -> float:
+    smaller = min(first_size, second_size)
+    if smaller < MIN_CONTAINMENT_SHINGLES:
+        return 0.0
+    return min(1.0, jaccard * (first_size + second_size) / ((1 + jaccard) * smaller))
+
+
+class MinHashLSH:
+    def __init__(self, hash_count: int = 64, bands: int = 16):
+        if hash_count % bands:
+            raise ValueError("hash_count must be a multiple of bands")
+        self.hash_count = hash_count
+        self.bands = bands
+        self.rows = hash_count // bands
+        self.signatures: Dict[UUID, Signature] = {}
+        self._buckets: List[Dict[Signature, List[UUID]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+
+    def add(self, item_id: UUID, signature: Optional[Signature]) -> None:
+        if signature is None or item_id in self.signatures:
+            return
+        self.signatures[item_id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].append(item_id)
+
+    def candidates(self, signature: Optional[Signature]) -> Set[UUID]:
+        found: Set[UUID] = set()
+        if signature is None:
+            return found
+        for band, key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(key, ()))
+        return found
+
+    def _band_keys(self, signature: Signature) -> Iterable[Signature]:
+        return (
+            signature[start : start + self.rows]
+            for start in range(0, self.hash_count, self.rows)
+        )
+
+
+class MinHashSimilarityIndex(SimilarityIndex):
+    def __init__(
+        self,
+        hash_count: int = 64,
+        bands: int = 32,
+        threshold: float = 0.5,
+        containment_threshold: float = 0.9,
+        refresh_seconds: float = 30.0,
+    ):
+        self.threshold = threshold
+        self.containment_threshold = containment_threshold
+        self.refresh_seconds = refresh_seconds
+        self.queries = 0
+        self.candidates_checked = 0
+        self.refreshed = 0
+        self._warm_task: Optional[asyncio.Task] = None
+        self._warmed = False
+        self._last_seen: Optional[datetime] = None
+        self._titles: Dict[UUID, str] = {}
+        self._title_sizes: Dict[UUID, int] = {}
+        self._title_index = MinHashLSH(hash_count, bands)
+        self._description_index = MinHashLSH(hash_count, bands)
+
+    def add(self, feature_id: UUID, title: str, description: str) -> None:
+        hash_count = self._title_index.hash_count
+        shingles = title_shingles(title)
+        self._titles[feature_id] = title
+        self._title_sizes[feature_id] = len(shingles)
+        self._title_index.add(feature_id, minhash(shingles, hash_count))
+        self._description_index.add(
+            feature_id, minhash(description_shingles(description), hash_count)
+        )
+
+    def query(
+        self, title: str, description: str = "", limit: int = 5
+    ) -> List[Tuple[UUID, str, float]]:
+        hash_count = self._title_index.hash_count
+        shingles = title_shingles(title)
+        title_signature = minhash(shingles, hash_count)
+        description_signature = (
+            minhash(description_shingles(description), hash_count) if description else None
+        )
+        candidates = self._title_index.candidates(title_signature)
+        candidates |= self._description_index.candidates(description_signature)
+        self.queries += 1
+        self.candidates_checked += len(candidates)
+
+        matches = []
+        for feature_id in candidates:
+            score = max(
+                self._title_score(feature_id, title_signature, len(shingles)),
+                self._score(self._description_index, feature_id, description_signature),
+            )
+            if score >= self.threshold:
+                matches.append((feature_id, self._titles[feature_id], score))
+        matches.sort(key=lambda match: (-match[2], match[1]))
+        return matches[:limit]
+
+    async def warm(
+        self, session: AsyncSession, chunk_size: int = 1000, since: Optional[datetime] = None
+    ) -> int:
+        statement = select(
+            FeatureModel.id, FeatureModel.title, FeatureModel.description, FeatureModel.created_at
+        )
+        if since is not None:
+            statement = statement.where(FeatureModel.created_at >= since)
+        result = await session.stream(statement.execution_options(yield_per=chunk_size))
+        added = 0
+        async for rows in result.partitions():
+            for feature_id, title, description, created_at in rows:
+                if feature_id not in self._titles:
+                    self.add(feature_id, title, description)
+                    added += 1
+                if self._last_seen is None or created_at > self._last_seen:
+                    self._last_seen = created_at
+            await asyncio.sleep(0)
+        return added
+
+    async def refresh(self, session: AsyncSession) -> int:
+        since = self._last_seen - REFRESH_OVERLAP if self._last_seen else None
+        added = await self.warm(session, since=since)
+        self.refreshed += added
+        return added
+
+    async def start(self, session_maker) -> None:
+        if self._warm_task is None:
+            self._warm_task = asyncio.create_task(self._warm(session_maker))
+
+    async def stop(self) -> None:
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_task = None
+
+    async def _warm(self, session_maker) -> None:
+        try:
+            async with session_maker() as session:
+                await self.warm(session)
+            logger.info("Similarity index warmed with %d features", len(self._titles))
+        except Exception:
+            logger.exception("Similarity index warm-up failed")
+        self._warmed = True
+
+        while self.refresh_seconds > 0:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                async with session_maker() as session:
+                    await self.refresh(session)
+            except Exception:
+                logger.exception("Similarity index refresh failed")
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "features": len(self._titles),
+            "warming": self._warm_task is not None and not self._warmed,
+            "refreshed": self.refreshed,
+            "queries": self.queries,
+            "candidates_per_query": (
+                self.candidates_checked / self.queries if self.queries else 0.0
+            ),
+        }
+
+    def _title_score(self, feature_id: UUID, signature: Optional[Signature], size: int) -> float:
+        jaccard = self._score(self._title_index, feature_id, signature)
+        contained = containment(jaccard, size, self._title_sizes.get(feature_id, 0))
+        return contained if contained >= self.containment_threshold else jaccard
+
+    def _score(self, index: MinHashLSH, feature_id: UUID, signature: Optional[Signature]) -> float:
+        indexed = index.signatures.get(feature_id)
+        if signature is None or indexed is None:
+            return 0.0
+        return similarity(signature, indexed)
+
+
+class TransactionalSimilarityIndex(SimilarityIndex):
+    def __init__(self, index: SimilarityIndex, session: AsyncSession):
+        self.index = index
+        self.session = session
+
+    def add(self, feature_id: UUID, title: str, description: str) -> None:
+        self.session.sync_session.info.setdefault(PENDING_SIMILARITY_KEY, []).append(
+            (feature_id, title, description)
+        )
+
+    def query(
+        self, title: str, description: str = "", limit: int = 5
+    ) -> List[Tuple[UUID, str, float]]:
+        return self.index.query(title, description, limit)
+
+
+@event.listens_for(Session, "after_commit")
+def _add_committed_features(session: Session) -> None:
+    additions = session.info.pop(PENDING_SIMILARITY_KEY, None)
+    if additions:
+        index = get_similarity_index()
+        for feature_id, title, description in additions:
+            index.add(feature_id, title, description)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_features(session: Session) -> None:
+    session.info.pop(PENDING_SIMILARITY_KEY, None)
+
+
+_similarity_index: Optional[MinHashSimilarityIndex] = None
+
+
+def get_similarity_index() -> Optional[MinHashSimilarityIndex]:
+    global _similarity_index
+    settings = get_settings()
+    if not settings.duplicate_detection_enabled:
+        return None
+    if _similarity_index is None:
+        _similarity_index = MinHashSimilarityIndex(
+            hash_count=settings.duplicate_detection_hashes,
+            bands=settings.duplicate_detection_bands,
+            threshold=settings.duplicate_detection_threshold,
+            containment_threshold=settings.duplicate_detection_containment_threshold,
+            refresh_seconds=settings.duplicate_detection_refresh_seconds,
+        )
+    return _similarity_index
@@ -0,0 +1,112 @@
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+from application.interfaces.caches import RequestCoalescer
+from infrastructure.config.settings import get_settings
+
+T = TypeVar("T")
+
+
+def _label(key: Hashable) -> str:
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
+
+
+class SingleFlight(RequestCoalescer):
+    def __init__(self, max_tracked_keys: int = 1000):
+        self.max_tracked_keys = max_tracked_keys
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._keys: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            self._record(key, coalesced=True)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.run(key, call)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.executions += 1
+        self._record(key, coalesced=False)
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            self.errors += 1
+            future.set_exception(error)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def scoped(self, scope: str) -> RequestCoalescer:
+        return ScopedSingleFlight(self, scope)
+
+    def stats(self, top: int = 20) -> Dict[str, object]:
+        requests = self.executions + self.coalesced
+        busiest = sorted(self._keys.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": self.coalesced / requests if requests else 0.0,
+            "keys": [
+                {"key": label, "requests": counts[0], "coalesced": counts[1]}
+                for label, counts in busiest[:top]
+                if counts[1]
+            ],
+        }
+
+    def _record(self, key: Hashable, coalesced: bool) -> None:
+        label = _label(key)
+        counts = self._keys.get(label)
+        if counts is None:
+            counts = self._keys[label] = [0, 0]
+            if len(self._keys) > self.max_tracked_keys:
+                self._keys.popitem(last=False)
+        else:
+            self._keys.move_to_end(label)
+        counts[0] += 1
+        if coalesced:
+            counts[1] += 1
+
+
+class ScopedSingleFlight(RequestCoalescer):
+    def __init__(self, single_flight: SingleFlight, scope: str):
+        self.single_flight = single_flight
+        self.scope = scope
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        parts = key if isinstance(key, tuple) else (key,)
+        return await self.single_flight.run((self.scope, *parts), call)
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    global _single_flight
+    settings = get_settings()
+    if not settings.single_flight_enabled or settings.repository_backend == "memory":
+        return None
+    if _single_flight is None:
+        _single_flight = SingleFlight(max_tracked_keys=settings.single_flight_tracked_keys)
+    return _single_flight
@@ -0,0 +1,70 @@
+import hashlib
+import math
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.interfaces.caches import VoteMembershipFilter
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import VoteModel
+
+
+class VoteBloomFilter(VoteMembershipFilter):
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def might_contain(self, feature_id: UUID, user_identifier: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(feature_id, user_identifier)
+        )
+
+    def add(self, feature_id: UUID, user_identifier: str) -> None:
+        for position in self._positions(feature_id, user_identifier):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    async def warm(self, session: AsyncSession, chunk_size: int = 10000) -> None:
+        result = await session.stream(
+            select(VoteModel.feature_id, VoteModel.user_identifier).execution_options(
+                yield_per=chunk_size
+            )
+        )
+        async for feature_id, user_identifier in result:
+            self.add(feature_id, user_identifier)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size_bits": self.size, "hash_count": self.hash_count, "items": self.count}
+
+    def _positions(self, feature_id: UUID, user_identifier: str):
+        digest = hashlib.blake2b(
+            feature_id.bytes + user_identifier.encode(), digest_size=16
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+
+_vote_bloom_filter: Optional[VoteBloomFilter] = None
+
+
+def get_vote_bloom_filter() -> Optional[VoteBloomFilter]:
+    global _vote_bloom_filter
+    settings = get_settings()
+    if (
+        not settings.vote_bloom_filter_enabled
+        or not settings.vote_buffer_enabled
+        or settings.repository_backend == "memory"
+    ):
+        return None
+    if _vote_bloom_filter is None:
+        _vote_bloom_filter = VoteBloomFilter(
+            capacity=settings.vote_bloom_filter_capacity,
+            error_rate=settings.vote_bloom_filter_error_rate,
+        )
+    return _vote_bloom_filter
@@ -0,0 +1,170 @@
+import csv
+import io
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.list_version import bump_list_version
+from infrastructure.database.models import FeatureModel, VoteModel
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+EXPORT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "features": (
+        "id",
+        "title",
+        "description",
+        "author_name",
+        "votes_count",
+        "created_at",
+        "updated_at",
+        "trending_score",
+    ),
+    "votes": ("id", "feature_id", "user_identifier", "created_at"),
+}
+
+IMPORT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "features": ("id", "title", "description", "author_name", "created_at", "updated_at"),
+    "votes": ("id", "feature_id", "user_identifier", "created_at"),
+}
+
+COLUMN_PARSERS: Dict[str, Callable[[str], object]] = {
+    "id": UUID,
+    "feature_id": UUID,
+    "title": str,
+    "description": str,
+    "author_name": str,
+    "user_identifier": str,
+    "created_at": datetime.fromisoformat,
+    "updated_at": datetime.fromisoformat,
+}
+
+TABLES = {"features": FeatureModel.__table__, "votes": VoteModel.__table__}
+
+MERGE_FEATURES_SQL = text(
+    """
+    INSERT INTO features (id, title, description, author_name, created_at, updated_at,
+                          votes_count, trending_score)
+    SELECT id, title, description, author_name, created_at, updated_at, 0, 0
+    FROM import_features
+    ON CONFLICT (id) DO NOTHING
+    """
+)
+
+MERGE_VOTES_SQL = text(
+    """
+    INSERT INTO votes (id, feature_id, user_identifier, created_at)
+    SELECT id, feature_id, user_identifier, created_at
+    FROM import_votes
+    WHERE EXISTS (SELECT 1 FROM features WHERE features.id = import_votes.feature_id)
+    ON CONFLICT DO NOTHING
+    """
+)
+
+REBUILD_VOTES_COUNT_SQL = text(
+    """
+    UPDATE features
+    SET votes_count = counts.total, updated_at = timezone('UTC', clock_timestamp())
+    FROM (
+        SELECT touched.id, count(votes.id) AS total
+        FROM (
+            SELECT id FROM import_features
+            UNION
+            SELECT feature_id FROM import_votes
+        ) AS touched
+        LEFT JOIN votes ON votes.feature_id = touched.id
+        GROUP BY touched.id
+    ) AS counts
+    WHERE features.id = counts.id AND features.votes_count <> counts.total
+    """
+)
+
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_rows(columns: Sequence[str], rows: Iterable[Sequence], fmt: str) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(
+            orjson.dumps(dict(zip(columns, row)), option=orjson.OPT_APPEND_NEWLINE)
+            for row in rows
+        )
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_serialize(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def encode_header(columns: Sequence[str], fmt: str) -> bytes:
+    if fmt == "csv":
+        return (",".join(columns) + "\r\n").encode()
+    return b""
+
+
+async def export_table(
+    session: AsyncSession, table: str, fmt: str, chunk_size: int
+) -> AsyncIterator[bytes]:
+    columns = EXPORT_COLUMNS[table]
+    model = TABLES[table]
+    yield encode_header(columns, fmt)
+    result = await session.stream(
+        select(*(model.c[name] for name in columns)).execution_options(yield_per=chunk_size)
+    )
+    async for rows in result.partitions():
+        yield encode_rows(columns, rows, fmt)
+
+
+def read_records(
+    handle: TextIO, table: str, fmt: str, chunk_size: int
+) -> Iterator[List[tuple]]:
+    columns = IMPORT_COLUMNS[table]
+    parsers = [COLUMN_PARSERS[name] for name in columns]
+    if fmt == "csv":
+        records = csv.DictReader(handle)
+    else:
+        records = (orjson.loads(line) for line in handle if line.strip())
+
+    chunk: List[tuple] = []
+    for record in records:
+        chunk.append(tuple(parse(record[name]) for parse, name in zip(parsers, columns)))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def create_staging_tables(session: AsyncSession) -> None:
+    for table, columns in IMPORT_COLUMNS.items():
+        await session.execute(
+            text(
+                f"CREATE TEMP TABLE import_{table} ON COMMIT DROP AS "
+                f"SELECT {', '.join(columns)} FROM {table} WITH NO DATA"
+            )
+        )
+
+
+async def copy_records(session: AsyncSession, table: str, records: List[tuple]) -> None:
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        f"import_{table}", records=records, columns=IMPORT_COLUMNS[table]
+    )
+
+
+async def merge_staging_tables(session: AsyncSession) -> Dict[str, int]:
+    features = await session.execute(MERGE_FEATURES_SQL)
+    votes = await session.execute(MERGE_VOTES_SQL)
+    recounted = await session.execute(REBUILD_VOTES_COUNT_SQL)
+    await session.execute(bump_list_version())
+    return {
+        "features": features.rowcount,
+        "votes": votes.rowcount,
+        "recounted": recounted.rowcount,
+    }
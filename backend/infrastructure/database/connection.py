@@ -1,11 +1,49 @@
+import asyncio
+
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from infrastructure.config.settings import get_settings
+from infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+from infrastructure.database.replicas import ReplicaRouter
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=settings.environment == "development")
+connect_args = {"prepared_statement_cache_size": settings.database_statement_cache_size}
+if settings.database_statement_timeout_ms:
+    connect_args["server_settings"] = {
+        "statement_timeout": str(settings.database_statement_timeout_ms)
+    }
+
+
+def _create_engine(url: str, poolclass=AsyncAdaptedQueuePool):
+    return create_async_engine(
+        url,
+        echo=(
+            settings.environment == "development"
+            if settings.database_echo is None
+            else settings.database_echo
+        ),
+        poolclass=poolclass,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
+engine = _create_engine(settings.database_url, poolclass=InstrumentedAsyncAdaptedQueuePool)
+replica_engines = [_create_engine(url) for url in settings.database_replica_urls]
+replica_router = ReplicaRouter(
+    replica_engines, cooldown_seconds=settings.database_replica_cooldown_seconds
+)
 
 async_session_maker = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
@@ -22,3 +60,31 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    pinned = (
+        settings.read_your_writes_seconds > 0 and PRIMARY_PIN_COOKIE in request.cookies
+    )
+    for replica in [] if pinned else replica_router.candidates():
+        session = AsyncSession(replica, expire_on_commit=False)
+        session.info["read_target"] = f"replica:{replica_engines.index(replica)}"
+        try:
+            await session.connection()
+        except (DBAPIError, OSError, asyncio.TimeoutError):
+            replica_router.mark_failed(replica)
+            await session.close()
+            continue
+
+        replica_router.replica_reads += 1
+        try:
+            yield session
+        finally:
+            await session.close()
+        return
+
+    replica_router.primary_reads += 1
+    async with async_session_maker() as session:
+        session.info["read_target"] = "primary"
+        session.info["primary_pinned"] = pinned
+        yield session
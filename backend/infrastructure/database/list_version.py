@@ -0,0 +1,26 @@
+import random
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from infrastructure.database.models import FeatureListVersionModel
+
+LIST_VERSION_SHARDS = 16
+
+
+def bump_list_version():
+    statement = insert(FeatureListVersionModel).values(
+        shard=random.randrange(LIST_VERSION_SHARDS), version=1
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["shard"],
+        set_={"version": FeatureListVersionModel.version + 1},
+    )
+
+
+def with_list_version_bump(statement):
+    return statement.add_cte(bump_list_version().cte("list_version_bump"))
+
+
+def current_list_version():
+    return select(func.coalesce(func.sum(FeatureListVersionModel.version), 0))
@@ -0,0 +1,50 @@
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+MIGRATIONS_PATH = Path(__file__).resolve().parents[2] / "migrations"
+REVISION_PATTERN = re.compile(r'^revision: str = "([^"]+)"', re.MULTILINE)
+DOWN_REVISION_PATTERN = re.compile(
+    r'^down_revision: Union\[str, None\] = "([^"]+)"', re.MULTILINE
+)
+
+
+@lru_cache()
+def head_revision() -> Optional[str]:
+    revisions = set()
+    parents = set()
+    for path in (MIGRATIONS_PATH / "versions").glob("*.py"):
+        source = path.read_text()
+        revisions.update(REVISION_PATTERN.findall(source))
+        parents.update(DOWN_REVISION_PATTERN.findall(source))
+
+    heads = revisions - parents
+    if len(heads) > 1:
+        raise RuntimeError(f"Multiple migration heads: {', '.join(sorted(heads))}")
+    return heads.pop() if heads else None
+
+
+async def current_revision(connection: AsyncConnection) -> Optional[str]:
+    try:
+        result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError:
+        return None
+    return result.scalar()
+
+
+async def verify_schema_revision(engine: AsyncEngine) -> str:
+    expected = head_revision()
+    async with engine.connect() as connection:
+        current = await current_revision(connection)
+
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current or 'none'} but this build expects "
+            f"{expected}; run `alembic upgrade head` before starting the API"
+        )
+    return current
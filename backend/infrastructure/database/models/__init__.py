@@ -1,4 +1,18 @@
 from .feature_model import Base, FeatureModel
+from .idempotency_key_model import IdempotencyKeyModel
+from .list_version_model import FeatureListVersionModel
+from .rate_limit_bucket_model import RateLimitBucketModel
+from .vote_bucket_model import VoteBucketModel
 from .vote_model import VoteModel
+from .vote_shard_model import VoteCounterShardModel
 
-__all__ = ["Base", "FeatureModel", "VoteModel"]
+__all__ = [
+    "Base",
+    "FeatureListVersionModel",
+    "FeatureModel",
+    "IdempotencyKeyModel",
+    "RateLimitBucketModel",
+    "VoteModel",
+    "VoteBucketModel",
+    "VoteCounterShardModel",
+]
@@ -1,9 +1,9 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Column, Computed, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import declarative_base, deferred
 
 Base = declarative_base()
 
@@ -18,3 +18,22 @@ class FeatureModel(Base):
     votes_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    trending_score = Column(Float, default=0.0, nullable=False)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
+
+    __table_args__ = (
+        Index("ix_features_votes_count_id", "votes_count", "id"),
+        Index("ix_features_created_at_id", "created_at", "id"),
+        Index("ix_features_updated_at", "updated_at"),
+        Index("ix_features_trending_score_id", "trending_score", "id"),
+        Index("ix_features_search_vector", "search_vector", postgresql_using="gin"),
+    )
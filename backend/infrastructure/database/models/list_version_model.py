@@ -0,0 +1,10 @@
+from sqlalchemy import BigInteger, Column, SmallInteger
+
+from .feature_model import Base
+
+
+class FeatureListVersionModel(Base):
+    __tablename__ = "feature_list_versions"
+
+    shard = Column(SmallInteger, primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
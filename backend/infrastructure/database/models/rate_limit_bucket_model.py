@@ -0,0 +1,13 @@
+from sqlalchemy import Column, DateTime, Float, String
+
+from .feature_model import Base
+
+
+class RateLimitBucketModel(Base):
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from .feature_model import Base
+
+
+class VoteBucketModel(Base):
+    __tablename__ = "vote_buckets"
+
+    feature_id = Column(UUID(as_uuid=True), ForeignKey("features.id"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
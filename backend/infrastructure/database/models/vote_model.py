@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 
 from .feature_model import Base
@@ -17,4 +17,5 @@ class VoteModel(Base):
 
     __table_args__ = (
         UniqueConstraint("feature_id", "user_identifier", name="unique_feature_user_vote"),
+        Index("ix_votes_user_identifier_feature_id", "user_identifier", "feature_id"),
     )
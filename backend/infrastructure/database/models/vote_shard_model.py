@@ -0,0 +1,12 @@
+from sqlalchemy import Column, ForeignKey, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import UUID
+
+from .feature_model import Base
+
+
+class VoteCounterShardModel(Base):
+    __tablename__ = "vote_counter_shards"
+
+    feature_id = Column(UUID(as_uuid=True), ForeignKey("features.id"), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,67 @@
+import bisect
+import time
+from typing import Dict, List
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    def __init__(self, buckets_ms=WAIT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.reset()
+
+    def reset(self) -> None:
+        self.wait_counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self.wait_total_ms = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.wait_counts[bisect.bisect_left(self.buckets_ms, wait_ms)] += 1
+        self.wait_total_ms += wait_ms
+        self.checkouts += 1
+
+    def wait_histogram(self) -> Dict[str, int]:
+        labels = [f"le_{bucket}ms" for bucket in self.buckets_ms] + ["le_inf"]
+        cumulative = 0
+        histogram = {}
+        for label, count in zip(labels, self.wait_counts):
+            cumulative += count
+            histogram[label] = cumulative
+        return histogram
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        pool_metrics.observe_wait((time.perf_counter() - started) * 1000)
+        return entry
+
+
+def pool_stats(pool) -> Dict[str, object]:
+    stats: Dict[str, object] = {
+        "checkouts": pool_metrics.checkouts,
+        "timeouts": pool_metrics.timeouts,
+        "wait_total_ms": round(pool_metrics.wait_total_ms, 3),
+        "wait_histogram": pool_metrics.wait_histogram(),
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    return stats
@@ -0,0 +1,40 @@
+import time
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class ReplicaRouter:
+    def __init__(self, engines: List[AsyncEngine], cooldown_seconds: float = 30.0):
+        self.engines = engines
+        self.cooldown_seconds = cooldown_seconds
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.failovers = 0
+        self._next = 0
+        self._down_until: Dict[int, float] = {}
+
+    def candidates(self) -> List[AsyncEngine]:
+        if not self.engines:
+            return []
+        now = time.monotonic()
+        start = self._next
+        self._next = (self._next + 1) % len(self.engines)
+        ordered = self.engines[start:] + self.engines[:start]
+        return [engine for engine in ordered if self._down_until.get(id(engine), 0) <= now]
+
+    def mark_failed(self, engine: AsyncEngine) -> None:
+        self.failovers += 1
+        self._down_until[id(engine)] = time.monotonic() + self.cooldown_seconds
+
+    def stats(self) -> Dict[str, object]:
+        now = time.monotonic()
+        return {
+            "replicas": len(self.engines),
+            "healthy": sum(
+                1 for engine in self.engines if self._down_until.get(id(engine), 0) <= now
+            ),
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "failovers": self.failovers,
+        }
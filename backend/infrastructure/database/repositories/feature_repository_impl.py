@@ -1,17 +1,100 @@
-from typing import List, Optional
+import math
+import random
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    REAL,
+    Integer,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import FeatureRepository
 from domain.entities import Feature
-from infrastructure.database.models import FeatureModel
+from infrastructure.config.settings import get_settings
+from infrastructure.database.list_version import (
+    bump_list_version,
+    current_list_version,
+    with_list_version_bump,
+)
+from infrastructure.database.models import FeatureModel, VoteCounterShardModel
+from infrastructure.database.trending import (
+    TRENDING_EPOCH,
+    TRENDING_SEED_OFFSET,
+    decay_rate,
+    log_add_exp,
+    trending_exponent,
+    trending_seed,
+)
+
+FEATURE_COLUMNS = (
+    FeatureModel.id,
+    FeatureModel.title,
+    FeatureModel.description,
+    FeatureModel.author_name,
+    FeatureModel.votes_count,
+    FeatureModel.created_at,
+    FeatureModel.updated_at,
+    FeatureModel.trending_score,
+)
+
+DATABASE_NOW = func.timezone("UTC", func.clock_timestamp())
+
+SORT_COLUMNS = {
+    "votes": FeatureModel.votes_count,
+    "created_at": FeatureModel.created_at,
+    "trending": FeatureModel.trending_score,
+}
+
+RECOMPUTE_TRENDING_SQL = text(
+    """
+    WITH terms AS (
+        SELECT id AS feature_id,
+               :rate * extract(epoch FROM created_at - :epoch) - :seed_offset AS exponent
+        FROM features
+        UNION ALL
+        SELECT feature_id,
+               :rate * extract(epoch FROM created_at - :epoch) AS exponent
+        FROM votes
+    ),
+    peaks AS (
+        SELECT feature_id, max(exponent) AS peak FROM terms GROUP BY feature_id
+    ),
+    scores AS (
+        SELECT terms.feature_id,
+               peaks.peak + ln(sum(exp(terms.exponent - peaks.peak))) AS score
+        FROM terms JOIN peaks ON peaks.feature_id = terms.feature_id
+        GROUP BY terms.feature_id, peaks.peak
+    )
+    UPDATE features SET trending_score = scores.score
+    FROM scores
+    WHERE features.id = scores.feature_id
+    """
+)
 
 
 class FeatureRepositoryImpl(FeatureRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, counter_shards: Optional[int] = None):
         self.session = session
+        settings = get_settings()
+        self.counter_shards = (
+            settings.vote_counter_shards if counter_shards is None else counter_shards
+        )
+        self.trending_rate = decay_rate(settings.trending_half_life_hours)
 
     async def create(self, feature: Feature) -> Feature:
         feature_model = FeatureModel(
@@ -22,13 +105,24 @@ class FeatureRepositoryImpl(FeatureRepository):
             votes_count=feature.votes_count,
             created_at=feature.created_at,
             updated_at=feature.updated_at,
+            trending_score=trending_seed(feature.created_at, self.trending_rate),
         )
         self.session.add(feature_model)
         await self.session.flush()
+        await self.session.execute(bump_list_version())
         await self.session.refresh(feature_model)
         return self._to_entity(feature_model)
 
     async def get_by_id(self, feature_id: UUID) -> Optional[Feature]:
+        if self.counter_shards > 1:
+            result = await self.session.execute(
+                select(FeatureModel, self._pending_shard_votes()).where(
+                    FeatureModel.id == feature_id
+                )
+            )
+            row = result.one_or_none()
+            return self._to_entity(row[0], row[1]) if row else None
+
         result = await self.session.execute(
             select(FeatureModel).where(FeatureModel.id == feature_id)
         )
@@ -36,18 +130,58 @@ class FeatureRepositoryImpl(FeatureRepository):
         return self._to_entity(feature_model) if feature_model else None
 
     async def list_all(
-        self, sort_by: str = "created_at", order: str = "desc", limit: int = 50
+        self,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        limit: int = 50,
+        after: Optional[Tuple[Union[int, float, datetime], UUID]] = None,
+        description_limit: Optional[int] = None,
     ) -> List[Feature]:
-        sort_column = (
-            FeatureModel.votes_count if sort_by == "votes" else FeatureModel.created_at
-        )
-        order_func = sort_column.desc() if order == "desc" else sort_column.asc()
+        sort_column = SORT_COLUMNS.get(sort_by, FeatureModel.created_at)
+        seek_key = tuple_(sort_column, FeatureModel.id)
 
-        result = await self.session.execute(
-            select(FeatureModel).order_by(order_func).limit(limit)
-        )
-        feature_models = result.scalars().all()
-        return [self._to_entity(model) for model in feature_models]
+        columns = FEATURE_COLUMNS
+        if description_limit is not None:
+            columns = tuple(
+                func.substr(FeatureModel.description, 1, description_limit + 1).label(
+                    "description"
+                )
+                if column is FeatureModel.description
+                else column
+                for column in FEATURE_COLUMNS
+            )
+
+        query = select(*columns)
+        if order == "desc":
+            query = query.order_by(sort_column.desc(), FeatureModel.id.desc())
+            if after is not None:
+                query = query.where(seek_key < tuple_(*after))
+        else:
+            query = query.order_by(sort_column.asc(), FeatureModel.id.asc())
+            if after is not None:
+                query = query.where(seek_key > tuple_(*after))
+
+        query = query.limit(limit)
+        if self.counter_shards > 1 and sort_by != "votes":
+            page = query.subquery()
+            query = select(
+                *(
+                    (page.c.votes_count + self._pending_shard_votes(page.c.id)).label(
+                        "votes_count"
+                    )
+                    if column.name == "votes_count"
+                    else column
+                    for column in page.c
+                )
+            )
+            page_key = (page.c[sort_column.key], page.c.id)
+            if order == "desc":
+                query = query.order_by(*(key.desc() for key in page_key))
+            else:
+                query = query.order_by(*(key.asc() for key in page_key))
+
+        result = await self.session.execute(query)
+        return [self._row_to_entity(row) for row in result.all()]
 
     async def update(self, feature: Feature) -> Feature:
         result = await self.session.execute(
@@ -59,18 +193,211 @@ class FeatureRepositoryImpl(FeatureRepository):
             feature_model.votes_count = feature.votes_count
             feature_model.updated_at = feature.updated_at
             await self.session.flush()
+            await self.session.execute(bump_list_version())
             await self.session.refresh(feature_model)
             return self._to_entity(feature_model)
 
         return feature
 
-    def _to_entity(self, model: FeatureModel) -> Feature:
+    async def increment_votes(self, feature_id: UUID, amount: int = 1) -> Optional[Feature]:
+        if self.counter_shards > 1:
+            source = select(
+                literal(feature_id, VoteCounterShardModel.feature_id.type),
+                literal(random.randrange(self.counter_shards), VoteCounterShardModel.shard.type),
+                literal(amount, VoteCounterShardModel.count.type),
+            ).where(exists().where(FeatureModel.id == feature_id))
+            await self.session.execute(with_list_version_bump(self._upsert_shards(source)))
+            return await self.get_by_id(feature_id)
+
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            with_list_version_bump(
+                update(FeatureModel)
+                .where(FeatureModel.id == feature_id)
+                .values(
+                    votes_count=FeatureModel.votes_count + amount,
+                    updated_at=DATABASE_NOW,
+                    trending_score=log_add_exp(
+                        FeatureModel.trending_score,
+                        trending_exponent(now, self.trending_rate) + math.log(amount),
+                    ),
+                )
+                .returning(FeatureModel)
+                .execution_options(synchronize_session=False)
+            )
+        )
+        feature_model = result.scalar_one_or_none()
+        return self._to_entity(feature_model) if feature_model else None
+
+    async def increment_many(self, amounts: Dict[UUID, int]) -> Dict[UUID, int]:
+        if not amounts:
+            return {}
+
+        increments = values(
+            column("feature_id", PG_UUID(as_uuid=True)),
+            column("amount", Integer()),
+            name="increments",
+        ).data(sorted(amounts.items()))
+
+        if self.counter_shards > 1:
+            source = select(
+                increments.c.feature_id,
+                func.floor(func.random() * self.counter_shards).cast(Integer),
+                increments.c.amount,
+            ).where(exists().where(FeatureModel.id == increments.c.feature_id))
+            await self.session.execute(with_list_version_bump(self._upsert_shards(source)))
+            result = await self.session.execute(
+                select(
+                    FeatureModel.id, FeatureModel.votes_count + self._pending_shard_votes()
+                ).where(FeatureModel.id.in_(amounts))
+            )
+            return dict(result.all())
+
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            with_list_version_bump(
+                update(FeatureModel)
+                .where(FeatureModel.id == increments.c.feature_id)
+                .values(
+                    votes_count=FeatureModel.votes_count + increments.c.amount,
+                    updated_at=DATABASE_NOW,
+                    trending_score=log_add_exp(
+                        FeatureModel.trending_score,
+                        trending_exponent(now, self.trending_rate)
+                        + func.ln(increments.c.amount),
+                    ),
+                )
+                .returning(FeatureModel.id, FeatureModel.votes_count)
+                .execution_options(synchronize_session=False)
+            )
+        )
+        return dict(result.all())
+
+    async def existing_ids(self, feature_ids: Iterable[UUID]) -> Set[UUID]:
+        feature_ids = set(feature_ids)
+        if not feature_ids:
+            return set()
+
+        result = await self.session.execute(
+            select(FeatureModel.id).where(FeatureModel.id.in_(feature_ids))
+        )
+        return set(result.scalars().all())
+
+    async def get_version(self, feature_id: UUID) -> Optional[Tuple[datetime, int]]:
+        votes_count = FeatureModel.votes_count
+        if self.counter_shards > 1:
+            votes_count = votes_count + self._pending_shard_votes()
+
+        result = await self.session.execute(
+            select(FeatureModel.updated_at, votes_count).where(FeatureModel.id == feature_id)
+        )
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
+    async def list_watermark(self) -> int:
+        result = await self.session.execute(current_list_version())
+        return int(result.scalar())
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Tuple[Feature, float]]:
+        ts_query = func.websearch_to_tsquery("english", query)
+        rank = func.ts_rank(FeatureModel.search_vector, ts_query)
+
+        statement = select(*FEATURE_COLUMNS, rank.label("rank")).where(
+            FeatureModel.search_vector.op("@@")(ts_query)
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(rank, FeatureModel.id) < tuple_(cast(after[0], REAL), after[1])
+            )
+        statement = statement.order_by(rank.desc(), FeatureModel.id.desc()).limit(limit)
+
+        result = await self.session.execute(statement)
+        return [(self._row_to_entity(row), row.rank) for row in result.all()]
+
+    async def rollup_vote_shards(self) -> Dict[UUID, int]:
+        drained = (
+            delete(VoteCounterShardModel)
+            .returning(VoteCounterShardModel.feature_id, VoteCounterShardModel.count)
+            .cte("drained")
+        )
+        totals = (
+            select(drained.c.feature_id, func.sum(drained.c.count).label("total"))
+            .group_by(drained.c.feature_id)
+            .subquery("totals")
+        )
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            with_list_version_bump(
+                update(FeatureModel)
+                .where(FeatureModel.id == totals.c.feature_id)
+                .values(
+                    votes_count=FeatureModel.votes_count + totals.c.total,
+                    updated_at=DATABASE_NOW,
+                    trending_score=log_add_exp(
+                        FeatureModel.trending_score,
+                        trending_exponent(now, self.trending_rate) + func.ln(totals.c.total),
+                    ),
+                )
+                .returning(FeatureModel.id, FeatureModel.votes_count)
+                .execution_options(synchronize_session=False)
+            )
+        )
+        return dict(result.all())
+
+    async def recompute_trending_scores(self) -> int:
+        await self.session.execute(bump_list_version())
+        result = await self.session.execute(
+            RECOMPUTE_TRENDING_SQL,
+            {
+                "rate": self.trending_rate,
+                "epoch": TRENDING_EPOCH,
+                "seed_offset": TRENDING_SEED_OFFSET,
+            },
+        )
+        return result.rowcount
+
+    def _pending_shard_votes(self, feature_id=FeatureModel.id):
+        return func.coalesce(
+            select(func.sum(VoteCounterShardModel.count))
+            .where(VoteCounterShardModel.feature_id == feature_id)
+            .scalar_subquery(),
+            0,
+        )
+
+    def _upsert_shards(self, source):
+        statement = insert(VoteCounterShardModel).from_select(
+            ["feature_id", "shard", "count"], source
+        )
+        return statement.on_conflict_do_update(
+            index_elements=["feature_id", "shard"],
+            set_={"count": VoteCounterShardModel.count + statement.excluded.count},
+        )
+
+    def _row_to_entity(self, row) -> Feature:
+        return Feature(
+            id=row.id,
+            title=row.title,
+            description=row.description,
+            author_name=row.author_name,
+            votes_count=row.votes_count,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            trending_score=row.trending_score,
+        )
+
+    def _to_entity(self, model: FeatureModel, pending_votes: int = 0) -> Feature:
         return Feature(
             id=model.id,
             title=model.title,
             description=model.description,
             author_name=model.author_name,
-            votes_count=model.votes_count,
+            votes_count=model.votes_count + pending_votes,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            trending_score=model.trending_score,
         )
@@ -1,17 +1,47 @@
-from typing import Optional
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, Integer, String, column, exists, func, literal, select, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import VoteRepository
 from domain.value_objects import Vote
-from infrastructure.database.models import VoteModel
+from infrastructure.config.settings import get_settings
+from infrastructure.database.models import FeatureModel, VoteBucketModel, VoteModel
+
+
+def vote_bucket_start(created_at: datetime) -> datetime:
+    return created_at.replace(minute=0, second=0, microsecond=0)
+
+
+def upsert_vote_buckets(counts: "Counter[Tuple[UUID, datetime]]"):
+    buckets = values(
+        column("feature_id", PG_UUID(as_uuid=True)),
+        column("bucket_start", DateTime()),
+        column("count", Integer()),
+        name="buckets",
+    ).data([(feature_id, bucket, count) for (feature_id, bucket), count in counts.items()])
+
+    statement = insert(VoteBucketModel).from_select(
+        ["feature_id", "bucket_start", "count"],
+        select(buckets.c.feature_id, buckets.c.bucket_start, buckets.c.count),
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[VoteBucketModel.feature_id, VoteBucketModel.bucket_start],
+        set_={"count": VoteBucketModel.count + statement.excluded.count},
+    )
 
 
 class VoteRepositoryImpl(VoteRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, record_buckets: Optional[bool] = None):
         self.session = session
+        self.record_buckets = (
+            get_settings().vote_analytics_enabled if record_buckets is None else record_buckets
+        )
 
     async def create(self, vote: Vote) -> Vote:
         vote_model = VoteModel(
@@ -23,8 +53,76 @@ class VoteRepositoryImpl(VoteRepository):
         self.session.add(vote_model)
         await self.session.flush()
         await self.session.refresh(vote_model)
+        await self._record_buckets([vote])
         return self._to_value_object(vote_model)
 
+    async def create_if_absent(self, vote: Vote) -> bool:
+        source = select(
+            literal(vote.id, VoteModel.id.type),
+            literal(vote.feature_id, VoteModel.feature_id.type),
+            literal(vote.user_identifier, VoteModel.user_identifier.type),
+            literal(vote.created_at, VoteModel.created_at.type),
+        ).where(exists().where(FeatureModel.id == vote.feature_id))
+
+        result = await self.session.execute(
+            insert(VoteModel)
+            .from_select(
+                ["id", "feature_id", "user_identifier", "created_at"], source
+            )
+            .on_conflict_do_nothing(constraint="unique_feature_user_vote")
+            .returning(VoteModel.id)
+        )
+        created = result.scalar_one_or_none() is not None
+        if created:
+            await self._record_buckets([vote])
+        return created
+
+    async def create_many(self, votes: List[Vote]) -> List[Vote]:
+        if not votes:
+            return []
+
+        incoming = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("feature_id", PG_UUID(as_uuid=True)),
+            column("user_identifier", String(100)),
+            column("created_at", DateTime()),
+            name="incoming",
+        ).data(
+            [
+                (vote.id, vote.feature_id, vote.user_identifier, vote.created_at)
+                for vote in votes
+            ]
+        )
+        source = select(
+            incoming.c.id,
+            incoming.c.feature_id,
+            incoming.c.user_identifier,
+            incoming.c.created_at,
+        ).where(exists().where(FeatureModel.id == incoming.c.feature_id))
+
+        result = await self.session.execute(
+            insert(VoteModel)
+            .from_select(["id", "feature_id", "user_identifier", "created_at"], source)
+            .on_conflict_do_nothing(constraint="unique_feature_user_vote")
+            .returning(
+                VoteModel.id,
+                VoteModel.feature_id,
+                VoteModel.user_identifier,
+                VoteModel.created_at,
+            )
+        )
+        created = [
+            Vote(
+                id=row.id,
+                feature_id=row.feature_id,
+                user_identifier=row.user_identifier,
+                created_at=row.created_at,
+            )
+            for row in result.all()
+        ]
+        await self._record_buckets(created)
+        return created
+
     async def get_by_feature_and_user(
         self, feature_id: UUID, user_identifier: str
     ) -> Optional[Vote]:
@@ -38,8 +136,64 @@ class VoteRepositoryImpl(VoteRepository):
         return self._to_value_object(vote_model) if vote_model else None
 
     async def exists(self, feature_id: UUID, user_identifier: str) -> bool:
-        vote = await self.get_by_feature_and_user(feature_id, user_identifier)
-        return vote is not None
+        result = await self.session.execute(
+            select(
+                exists().where(
+                    VoteModel.feature_id == feature_id,
+                    VoteModel.user_identifier == user_identifier,
+                )
+            )
+        )
+        return result.scalar()
+
+    async def has_voted_many(
+        self, user_identifier: str, feature_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        feature_ids = set(feature_ids)
+        if not feature_ids:
+            return set()
+
+        result = await self.session.execute(
+            select(VoteModel.feature_id).where(
+                VoteModel.user_identifier == user_identifier,
+                VoteModel.feature_id.in_(feature_ids),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def vote_histogram(
+        self,
+        feature_id: UUID,
+        start: datetime,
+        end: datetime,
+        granularity: str = "hour",
+    ) -> List[Tuple[datetime, int]]:
+        bucket = (
+            VoteBucketModel.bucket_start
+            if granularity == "hour"
+            else func.date_trunc(granularity, VoteBucketModel.bucket_start)
+        ).label("bucket")
+
+        result = await self.session.execute(
+            select(bucket, func.sum(VoteBucketModel.count).label("count"))
+            .where(
+                VoteBucketModel.feature_id == feature_id,
+                VoteBucketModel.bucket_start >= start,
+                VoteBucketModel.bucket_start < end,
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        return [(row.bucket, int(row.count)) for row in result.all()]
+
+    async def _record_buckets(self, votes: List[Vote]) -> None:
+        if not self.record_buckets or not votes:
+            return
+
+        counts = Counter(
+            (vote.feature_id, vote_bucket_start(vote.created_at)) for vote in votes
+        )
+        await self.session.execute(upsert_vote_buckets(counts))
 
     def _to_value_object(self, model: VoteModel) -> Vote:
         return Vote(
@@ -0,0 +1,25 @@
+import math
+from datetime import datetime
+
+from sqlalchemy import func
+
+TRENDING_EPOCH = datetime(2024, 1, 1)
+TRENDING_SEED_OFFSET = 20.0
+
+
+def decay_rate(half_life_hours: float) -> float:
+    return math.log(2) / (half_life_hours * 3600)
+
+
+def trending_exponent(at: datetime, rate: float) -> float:
+    return rate * (at - TRENDING_EPOCH).total_seconds()
+
+
+def trending_seed(created_at: datetime, rate: float) -> float:
+    return trending_exponent(created_at, rate) - TRENDING_SEED_OFFSET
+
+
+def log_add_exp(score, exponent):
+    return func.greatest(score, exponent) + func.ln(
+        1 + func.exp(-func.abs(score - exponent))
+    )
@@ -0,0 +1,12 @@
+from .counter_rollup import VoteCounterRollup, get_vote_counter_rollup
+from .trending_recompute import TrendingScoreRecompute, get_trending_score_recompute
+from .vote_buffer import VoteBuffer, get_vote_buffer
+
+__all__ = [
+    "TrendingScoreRecompute",
+    "VoteBuffer",
+    "VoteCounterRollup",
+    "get_trending_score_recompute",
+    "get_vote_buffer",
+    "get_vote_counter_rollup",
+]
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.interfaces.events import VoteEventPublisher
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import async_session_maker
+from infrastructure.database.repositories import FeatureRepositoryImpl
+from infrastructure.streaming import get_vote_stream_hub
+
+logger = logging.getLogger(__name__)
+
+
+class VoteCounterRollup:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        counter_shards: int,
+        interval_ms: int = 1000,
+        event_publisher: Optional[VoteEventPublisher] = None,
+    ):
+        self.session_factory = session_factory
+        self.counter_shards = counter_shards
+        self.event_publisher = event_publisher
+        self.interval = interval_ms / 1000
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def rollup(self) -> int:
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    repo = FeatureRepositoryImpl(session, self.counter_shards)
+                    counts = await repo.rollup_vote_shards()
+        except Exception:
+            logger.exception("Failed to roll up sharded vote counters")
+            return 0
+
+        if self.event_publisher:
+            for feature_id, votes_count in counts.items():
+                self.event_publisher.publish(feature_id, votes_count)
+        return len(counts)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.rollup()
+
+
+_vote_counter_rollup: Optional[VoteCounterRollup] = None
+
+
+def get_vote_counter_rollup() -> Optional[VoteCounterRollup]:
+    global _vote_counter_rollup
+    settings = get_settings()
+    if settings.vote_counter_shards <= 1 or settings.repository_backend == "memory":
+        return None
+    if _vote_counter_rollup is None:
+        _vote_counter_rollup = VoteCounterRollup(
+            async_session_maker,
+            settings.vote_counter_shards,
+            interval_ms=settings.vote_counter_rollup_interval_ms,
+            event_publisher=get_vote_stream_hub(),
+        )
+    return _vote_counter_rollup
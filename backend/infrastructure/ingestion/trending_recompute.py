@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import async_session_maker
+from infrastructure.database.repositories import FeatureRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+class TrendingScoreRecompute:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval_seconds: int = 3600,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    async def recompute(self) -> int:
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    repo = FeatureRepositoryImpl(session)
+                    return await repo.recompute_trending_scores()
+        except Exception:
+            logger.exception("Failed to recompute trending scores")
+            return 0
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval)
+            except asyncio.TimeoutError:
+                await self.recompute()
+
+
+_trending_score_recompute: Optional[TrendingScoreRecompute] = None
+
+
+def get_trending_score_recompute() -> Optional[TrendingScoreRecompute]:
+    global _trending_score_recompute
+    settings = get_settings()
+    if settings.trending_recompute_interval_seconds <= 0 or settings.repository_backend == "memory":
+        return None
+    if _trending_score_recompute is None:
+        _trending_score_recompute = TrendingScoreRecompute(
+            async_session_maker,
+            interval_seconds=settings.trending_recompute_interval_seconds,
+        )
+    return _trending_score_recompute
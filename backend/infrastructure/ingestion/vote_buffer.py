@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import os
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.interfaces.caches import LeaderboardCache, VoteMembershipFilter
+from application.interfaces.events import VoteEventPublisher
+from application.interfaces.repositories import FeatureRepository
+from domain.exceptions import DuplicateVoteException, FeatureNotFoundException
+from domain.value_objects import Vote
+from infrastructure.cache import get_leaderboard_cache, get_vote_bloom_filter
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import async_session_maker
+from infrastructure.database.repositories import FeatureRepositoryImpl, VoteRepositoryImpl
+from infrastructure.streaming import get_vote_stream_hub
+
+logger = logging.getLogger(__name__)
+
+
+class VoteBuffer:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_size: int = 10000,
+        flush_interval_ms: int = 50,
+        flush_batch_size: int = 500,
+        dedup_size: int = 100000,
+        leaderboard: Optional[LeaderboardCache] = None,
+        vote_filter: Optional[VoteMembershipFilter] = None,
+        flush_retries: int = 3,
+        retry_backoff_ms: int = 100,
+        spill_path: Optional[str] = None,
+        event_publisher: Optional[VoteEventPublisher] = None,
+    ):
+        self.session_factory = session_factory
+        self.leaderboard = leaderboard
+        self.vote_filter = vote_filter
+        self.event_publisher = event_publisher
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_batch_size = flush_batch_size
+        self.dedup_size = dedup_size
+        self.flush_retries = flush_retries
+        self.retry_backoff = retry_backoff_ms / 1000
+        self.spill_path = spill_path
+        self.spilled = 0
+        self.dropped = 0
+        self._queue: "asyncio.Queue[Vote]" = asyncio.Queue(maxsize=max_size)
+        self._recent: "OrderedDict[Tuple[UUID, str], None]" = OrderedDict()
+        self._known_features: "OrderedDict[UUID, None]" = OrderedDict()
+        self._has_spill = False
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, vote: Vote, feature_repository: FeatureRepository) -> bool:
+        key = (vote.feature_id, vote.user_identifier)
+        if key in self._recent:
+            raise DuplicateVoteException(str(vote.feature_id), vote.user_identifier)
+        self._recent[key] = None
+        if len(self._recent) > self.dedup_size:
+            self._recent.popitem(last=False)
+
+        try:
+            await self._require_feature(vote.feature_id, feature_repository)
+            self._queue.put_nowait(vote)
+        except asyncio.QueueFull:
+            self._recent.pop(key, None)
+            return False
+        except BaseException:
+            self._recent.pop(key, None)
+            raise
+        return True
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._has_spill = bool(self.spill_path) and (
+                os.path.exists(self.spill_path) or os.path.exists(self.spill_path + ".replay")
+            )
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "spilled": self.spilled,
+            "dropped": self.dropped,
+            "spill_pending": self._has_spill,
+        }
+
+    async def _require_feature(
+        self, feature_id: UUID, feature_repository: FeatureRepository
+    ) -> None:
+        if feature_id in self._known_features:
+            self._known_features.move_to_end(feature_id)
+            return
+        if not await feature_repository.existing_ids([feature_id]):
+            raise FeatureNotFoundException(str(feature_id))
+        self._known_features[feature_id] = None
+        if len(self._known_features) > self.dedup_size:
+            self._known_features.popitem(last=False)
+
+    async def _run(self) -> None:
+        if self._has_spill:
+            await self._replay_spill()
+        while True:
+            batch = await self._collect()
+            if batch:
+                if await self._flush(batch) and self._has_spill:
+                    await self._replay_spill()
+            elif self._stopping.is_set():
+                return
+
+    async def _collect(self) -> List[Vote]:
+        batch: List[Vote] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.flush_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - loop.time()
+            if timeout <= 0 or self._stopping.is_set():
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _flush(self, batch: List[Vote]) -> bool:
+        for attempt in range(self.flush_retries + 1):
+            try:
+                await self._write(batch)
+                return True
+            except Exception:
+                if attempt == self.flush_retries:
+                    logger.exception(
+                        "Failed to flush %d buffered votes after %d attempts",
+                        len(batch),
+                        attempt + 1,
+                    )
+                    break
+                logger.warning(
+                    "Failed to flush %d buffered votes, retrying", len(batch), exc_info=True
+                )
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+
+        self._spill(batch)
+        return False
+
+    async def _write(self, batch: List[Vote]) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                created = await VoteRepositoryImpl(session).create_many(batch)
+                counts = await FeatureRepositoryImpl(session).increment_many(
+                    Counter(vote.feature_id for vote in created)
+                )
+        if self.leaderboard and created:
+            self.leaderboard.invalidate()
+        if self.event_publisher:
+            for feature_id, votes_count in counts.items():
+                self.event_publisher.publish(feature_id, votes_count)
+        if self.vote_filter:
+            for vote in created:
+                self.vote_filter.add(vote.feature_id, vote.user_identifier)
+
+    def _spill(self, batch: List[Vote]) -> None:
+        for vote in batch:
+            self._recent.pop((vote.feature_id, vote.user_identifier), None)
+
+        if self.spill_path:
+            try:
+                with open(self.spill_path, "ab") as handle:
+                    handle.write(b"".join(_dump_vote(vote) for vote in batch))
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                self.spilled += len(batch)
+                self._has_spill = True
+                return
+            except OSError:
+                logger.exception("Failed to spill buffered votes to %s", self.spill_path)
+
+        self.dropped += len(batch)
+        for vote in batch:
+            logger.error(
+                "Dropped buffered vote id=%s feature_id=%s user_identifier=%s created_at=%s",
+                vote.id,
+                vote.feature_id,
+                vote.user_identifier,
+                vote.created_at.isoformat(),
+            )
+
+    async def _replay_spill(self) -> None:
+        replay_path = self.spill_path + ".replay"
+        if not os.path.exists(replay_path):
+            os.replace(self.spill_path, replay_path)
+
+        with open(replay_path, "rb") as handle:
+            votes = [_load_vote(line) for line in handle if line.strip()]
+        logger.info("Replaying %d spilled votes from %s", len(votes), self.spill_path)
+
+        for start in range(0, len(votes), self.flush_batch_size):
+            if not await self._flush(votes[start : start + self.flush_batch_size]):
+                self._spill(votes[start + self.flush_batch_size :])
+                break
+        os.remove(replay_path)
+        self._has_spill = os.path.exists(self.spill_path)
+
+
+def _dump_vote(vote: Vote) -> bytes:
+    return orjson.dumps(
+        {
+            "id": vote.id,
+            "feature_id": vote.feature_id,
+            "user_identifier": vote.user_identifier,
+            "created_at": vote.created_at,
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+def _load_vote(line: bytes) -> Vote:
+    record = orjson.loads(line)
+    return Vote(
+        id=UUID(record["id"]),
+        feature_id=UUID(record["feature_id"]),
+        user_identifier=record["user_identifier"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+    )
+
+
+_vote_buffer: Optional[VoteBuffer] = None
+
+
+def get_vote_buffer() -> Optional[VoteBuffer]:
+    global _vote_buffer
+    settings = get_settings()
+    if not settings.vote_buffer_enabled or settings.repository_backend == "memory":
+        return None
+    if _vote_buffer is None:
+        _vote_buffer = VoteBuffer(
+            async_session_maker,
+            max_size=settings.vote_buffer_max_size,
+            flush_interval_ms=settings.vote_buffer_flush_interval_ms,
+            flush_batch_size=settings.vote_buffer_flush_batch_size,
+            dedup_size=settings.vote_buffer_dedup_size,
+            leaderboard=get_leaderboard_cache(),
+            vote_filter=get_vote_bloom_filter(),
+            flush_retries=settings.vote_buffer_flush_retries,
+            retry_backoff_ms=settings.vote_buffer_retry_backoff_ms,
+            spill_path=settings.vote_buffer_spill_path,
+            event_publisher=get_vote_stream_hub(),
+        )
+    return _vote_buffer
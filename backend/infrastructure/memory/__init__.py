@@ -0,0 +1,11 @@
+from .repositories import InMemoryFeatureRepository, InMemoryVoteRepository
+from .sorted_index import SortedIndex
+from .store import InMemoryStore, get_in_memory_store
+
+__all__ = [
+    "InMemoryFeatureRepository",
+    "InMemoryStore",
+    "InMemoryVoteRepository",
+    "SortedIndex",
+    "get_in_memory_store",
+]
@@ -0,0 +1,182 @@
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from application.interfaces.repositories import FeatureRepository, VoteRepository
+from domain.entities import Feature
+from domain.exceptions import DuplicateVoteException
+from domain.value_objects import Vote
+from infrastructure.config.settings import get_settings
+from infrastructure.database.trending import decay_rate, trending_exponent, trending_seed
+from infrastructure.memory.store import InMemoryStore, terms
+
+TITLE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.4
+
+
+def _log_add_exp(score: float, exponent: float) -> float:
+    return max(score, exponent) + math.log1p(math.exp(-abs(score - exponent)))
+
+
+def _copy(feature: Feature, description_limit: Optional[int] = None) -> Feature:
+    description = feature.description
+    if description_limit is not None:
+        description = description[: description_limit + 1]
+    return Feature(
+        id=feature.id,
+        title=feature.title,
+        description=description,
+        author_name=feature.author_name,
+        votes_count=feature.votes_count,
+        created_at=feature.created_at,
+        updated_at=feature.updated_at,
+        trending_score=feature.trending_score,
+    )
+
+
+class InMemoryFeatureRepository(FeatureRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+        self.trending_rate = decay_rate(get_settings().trending_half_life_hours)
+
+    async def create(self, feature: Feature) -> Feature:
+        created = _copy(feature)
+        created.trending_score = trending_seed(created.created_at, self.trending_rate)
+        self.store.insert_feature(created)
+        return _copy(created)
+
+    async def get_by_id(self, feature_id: UUID) -> Optional[Feature]:
+        feature = self.store.features.get(feature_id)
+        return _copy(feature) if feature else None
+
+    async def list_all(
+        self,
+        sort_by: str = "created_at",
+        order: str = "desc",
+        limit: int = 50,
+        after: Optional[Tuple[Union[int, float, datetime], UUID]] = None,
+        description_limit: Optional[int] = None,
+    ) -> List[Feature]:
+        index = self.store.indexes.get(sort_by, self.store.indexes["created_at"])
+        return [
+            _copy(self.store.features[feature_id], description_limit)
+            for _, feature_id in index.page(order, limit, after)
+        ]
+
+    async def update(self, feature: Feature) -> Feature:
+        current = self.store.features.get(feature.id)
+        if current is None:
+            return feature
+
+        updated = _copy(current)
+        updated.votes_count = feature.votes_count
+        updated.updated_at = feature.updated_at
+        self.store.update_features([updated])
+        return _copy(updated)
+
+    async def increment_votes(self, feature_id: UUID, amount: int = 1) -> Optional[Feature]:
+        updated = self._increment({feature_id: amount}, datetime.utcnow())
+        return _copy(updated[0]) if updated else None
+
+    async def increment_many(self, amounts: Dict[UUID, int]) -> Dict[UUID, int]:
+        updated = self._increment(amounts, datetime.utcnow())
+        return {feature.id: feature.votes_count for feature in updated}
+
+    async def existing_ids(self, feature_ids: Iterable[UUID]) -> Set[UUID]:
+        return {feature_id for feature_id in feature_ids if feature_id in self.store.features}
+
+    async def get_version(self, feature_id: UUID) -> Optional[Tuple[datetime, int]]:
+        feature = self.store.features.get(feature_id)
+        return (feature.updated_at, feature.votes_count) if feature else None
+
+    async def list_watermark(self) -> int:
+        return self.store.version
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Tuple[Feature, float]]:
+        query_terms = terms(query)
+        matches = []
+        for feature_id in self.store.search_candidates(query_terms):
+            feature = self.store.features[feature_id]
+            title_terms = Counter(terms(feature.title))
+            description_terms = Counter(terms(feature.description))
+            rank = sum(
+                TITLE_WEIGHT * title_terms[term] + DESCRIPTION_WEIGHT * description_terms[term]
+                for term in query_terms
+            ) / (1 + math.log1p(len(description_terms)))
+            if after is None or (rank, feature_id) < after:
+                matches.append((rank, feature_id))
+
+        matches.sort(reverse=True)
+        return [
+            (_copy(self.store.features[feature_id]), rank)
+            for rank, feature_id in matches[:limit]
+        ]
+
+    def _increment(self, amounts: Dict[UUID, int], now: datetime) -> List[Feature]:
+        exponent = trending_exponent(now, self.trending_rate)
+        updated = []
+        for feature_id, amount in amounts.items():
+            current = self.store.features.get(feature_id)
+            if current is None or amount <= 0:
+                continue
+            feature = _copy(current)
+            feature.votes_count += amount
+            feature.updated_at = now
+            feature.trending_score = _log_add_exp(
+                feature.trending_score, exponent + math.log(amount)
+            )
+            updated.append(feature)
+        self.store.update_features(updated)
+        return updated
+
+
+class InMemoryVoteRepository(VoteRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, vote: Vote) -> Vote:
+        if not self.store.insert_votes([vote]):
+            raise DuplicateVoteException(str(vote.feature_id), vote.user_identifier)
+        return vote
+
+    async def create_if_absent(self, vote: Vote) -> bool:
+        return bool(self.store.insert_votes([vote]))
+
+    async def create_many(self, votes: List[Vote]) -> List[Vote]:
+        return self.store.insert_votes(votes)
+
+    async def get_by_feature_and_user(
+        self, feature_id: UUID, user_identifier: str
+    ) -> Optional[Vote]:
+        return self.store.votes.get((feature_id, user_identifier))
+
+    async def exists(self, feature_id: UUID, user_identifier: str) -> bool:
+        return user_identifier in self.store.voters.get(feature_id, ())
+
+    async def has_voted_many(
+        self, user_identifier: str, feature_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        voted = self.store.voted_features.get(user_identifier, set())
+        return {feature_id for feature_id in feature_ids if feature_id in voted}
+
+    async def vote_histogram(
+        self,
+        feature_id: UUID,
+        start: datetime,
+        end: datetime,
+        granularity: str = "hour",
+    ) -> List[Tuple[datetime, int]]:
+        totals: Counter = Counter()
+        for bucket, count in self.store.vote_buckets.get(feature_id, {}).items():
+            if start <= bucket < end:
+                if granularity == "day":
+                    bucket = bucket.replace(hour=0)
+                totals[bucket] += count
+        return sorted(totals.items())
@@ -0,0 +1,28 @@
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sortedcontainers import SortedList
+
+IndexKey = Tuple[Any, UUID]
+
+
+class SortedIndex:
+    def __init__(self):
+        self._keys: SortedList = SortedList()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: IndexKey) -> None:
+        self._keys.add(key)
+
+    def remove(self, key: IndexKey) -> None:
+        self._keys.discard(key)
+
+    def page(self, order: str, limit: int, after: Optional[IndexKey] = None) -> List[IndexKey]:
+        if order == "desc":
+            end = self._keys.bisect_left(after) if after is not None else len(self._keys)
+            return list(self._keys.islice(max(0, end - limit), end, reverse=True))
+
+        start = self._keys.bisect_right(after) if after is not None else 0
+        return list(self._keys.islice(start, start + limit))
@@ -0,0 +1,306 @@
+import asyncio
+import fcntl
+import logging
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+import orjson
+
+from domain.entities import Feature
+from domain.value_objects import Vote
+from infrastructure.config.settings import get_settings
+from infrastructure.memory.sorted_index import IndexKey, SortedIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.json"
+LOG_FILE = "log.jsonl"
+LOCK_FILE = "store.lock"
+TERM_PATTERN = re.compile(r"\w+")
+
+INDEX_KEYS: Dict[str, Callable[[Feature], IndexKey]] = {
+    "votes": lambda feature: (feature.votes_count, feature.id),
+    "created_at": lambda feature: (feature.created_at, feature.id),
+    "trending": lambda feature: (feature.trending_score, feature.id),
+}
+
+
+def terms(text: str) -> List[str]:
+    return TERM_PATTERN.findall(text.lower())
+
+
+class InMemoryStore:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        snapshot_interval_seconds: int = 300,
+        fsync: bool = False,
+    ):
+        self.path = path
+        self.snapshot_interval = snapshot_interval_seconds
+        self.fsync = fsync
+        self.features: Dict[UUID, Feature] = {}
+        self.indexes = {name: SortedIndex() for name in INDEX_KEYS}
+        self.votes: Dict[Tuple[UUID, str], Vote] = {}
+        self.voters: Dict[UUID, Set[str]] = defaultdict(set)
+        self.voted_features: Dict[str, Set[UUID]] = defaultdict(set)
+        self.vote_buckets: Dict[UUID, "Counter[datetime]"] = defaultdict(Counter)
+        self.title_terms: Dict[str, Set[UUID]] = defaultdict(set)
+        self.description_terms: Dict[str, Set[UUID]] = defaultdict(set)
+        self.version = 0
+        self._log = None
+        self._lock = None
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.path is None or self._log is not None:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        self._acquire_lock()
+        self.load()
+        self._log = open(os.path.join(self.path, LOG_FILE), "ab")
+        if self.snapshot_interval > 0:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        if self._log is not None:
+            self.snapshot()
+            self._log.close()
+            self._log = None
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+    def insert_feature(self, feature: Feature) -> None:
+        self._apply_feature(feature)
+        self._append({"op": "features", "features": [self._dump_feature(feature)]})
+
+    def update_features(self, features: List[Feature]) -> None:
+        for feature in features:
+            self._apply_feature(feature)
+        if features:
+            self._append(
+                {"op": "features", "features": [self._dump_feature(f) for f in features]}
+            )
+
+    def insert_votes(self, votes: Iterable[Vote]) -> List[Vote]:
+        created = [vote for vote in votes if self._apply_vote(vote)]
+        if created:
+            self._append({"op": "votes", "votes": [self._dump_vote(v) for v in created]})
+        return created
+
+    def search_candidates(self, query_terms: List[str]) -> Set[UUID]:
+        matches = None
+        for term in query_terms:
+            found = self.title_terms.get(term, set()) | self.description_terms.get(term, set())
+            matches = found if matches is None else matches & found
+            if not matches:
+                return set()
+        return matches or set()
+
+    def load(self) -> None:
+        snapshot_path = os.path.join(self.path, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, "rb") as handle:
+                snapshot = orjson.loads(handle.read())
+            for record in snapshot["features"]:
+                self._apply_feature(self._load_feature(record))
+            for record in snapshot["votes"]:
+                self._apply_vote(self._load_vote(record))
+
+        log_path = os.path.join(self.path, LOG_FILE)
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as handle:
+                for line in handle:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Ignoring truncated in-memory store log entry")
+                        break
+                    self._replay(entry)
+
+        logger.info(
+            "Loaded %d features and %d votes into the in-memory store",
+            len(self.features),
+            len(self.votes),
+        )
+
+    def snapshot(self) -> None:
+        if self.path is None:
+            return
+        self._write_snapshot(self._snapshot_records())
+        if self._log is not None:
+            self._log.truncate(0)
+            self._log.flush()
+
+    def stats(self) -> Dict[str, int]:
+        return {"features": len(self.features), "votes": len(self.votes)}
+
+    async def _snapshot_in_background(self) -> None:
+        records = self._snapshot_records()
+        offset = self._log.tell()
+        await asyncio.to_thread(self._write_snapshot, records)
+        self._compact_log(offset)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.snapshot_interval)
+            except asyncio.TimeoutError:
+                try:
+                    await self._snapshot_in_background()
+                except Exception:
+                    logger.exception("Failed to snapshot the in-memory store")
+
+    def _acquire_lock(self) -> None:
+        lock = open(os.path.join(self.path, LOCK_FILE), "a")
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            raise RuntimeError(
+                f"In-memory store at {self.path} is already open in another process; "
+                "REPOSITORY_BACKEND=memory supports a single worker per MEMORY_STORE_PATH"
+            )
+        self._lock = lock
+
+    def _snapshot_records(self) -> dict:
+        return {
+            "features": [self._dump_feature(f) for f in self.features.values()],
+            "votes": [self._dump_vote(v) for v in self.votes.values()],
+        }
+
+    def _write_snapshot(self, records: dict) -> None:
+        snapshot_path = os.path.join(self.path, SNAPSHOT_FILE)
+        payload = orjson.dumps(records)
+        with open(snapshot_path + ".tmp", "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(snapshot_path + ".tmp", snapshot_path)
+
+    def _compact_log(self, offset: int) -> None:
+        log_path = os.path.join(self.path, LOG_FILE)
+        self._log.flush()
+        with open(log_path, "rb") as handle:
+            handle.seek(offset)
+            tail = handle.read()
+        with open(log_path + ".tmp", "wb") as handle:
+            handle.write(tail)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(log_path + ".tmp", log_path)
+        self._log.close()
+        self._log = open(log_path, "ab")
+
+    def _apply_feature(self, feature: Feature) -> None:
+        previous = self.features.get(feature.id)
+        if previous is not None:
+            for name, key in INDEX_KEYS.items():
+                self.indexes[name].remove(key(previous))
+        else:
+            for term in terms(feature.title):
+                self.title_terms[term].add(feature.id)
+            for term in terms(feature.description):
+                self.description_terms[term].add(feature.id)
+
+        self.features[feature.id] = feature
+        for name, key in INDEX_KEYS.items():
+            self.indexes[name].add(key(feature))
+        self.version = max(self.version + 1, time.time_ns())
+
+    def _apply_vote(self, vote: Vote) -> bool:
+        if vote.feature_id not in self.features:
+            return False
+        if vote.user_identifier in self.voters.get(vote.feature_id, ()):
+            return False
+        self.votes[(vote.feature_id, vote.user_identifier)] = vote
+        self.voters[vote.feature_id].add(vote.user_identifier)
+        self.voted_features[vote.user_identifier].add(vote.feature_id)
+        bucket = vote.created_at.replace(minute=0, second=0, microsecond=0)
+        self.vote_buckets[vote.feature_id][bucket] += 1
+        return True
+
+    def _replay(self, entry: dict) -> None:
+        if entry["op"] == "features":
+            for record in entry["features"]:
+                self._apply_feature(self._load_feature(record))
+        elif entry["op"] == "votes":
+            for record in entry["votes"]:
+                self._apply_vote(self._load_vote(record))
+
+    def _append(self, entry: dict) -> None:
+        if self._log is None:
+            return
+        self._log.write(orjson.dumps(entry) + b"\n")
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+
+    def _dump_feature(self, feature: Feature) -> dict:
+        return {
+            "id": feature.id,
+            "title": feature.title,
+            "description": feature.description,
+            "author_name": feature.author_name,
+            "votes_count": feature.votes_count,
+            "created_at": feature.created_at,
+            "updated_at": feature.updated_at,
+            "trending_score": feature.trending_score,
+        }
+
+    def _load_feature(self, record: dict) -> Feature:
+        return Feature(
+            id=UUID(record["id"]),
+            title=record["title"],
+            description=record["description"],
+            author_name=record["author_name"],
+            votes_count=record["votes_count"],
+            created_at=datetime.fromisoformat(record["created_at"]),
+            updated_at=datetime.fromisoformat(record["updated_at"]),
+            trending_score=record["trending_score"],
+        )
+
+    def _dump_vote(self, vote: Vote) -> dict:
+        return {
+            "id": vote.id,
+            "feature_id": vote.feature_id,
+            "user_identifier": vote.user_identifier,
+            "created_at": vote.created_at,
+        }
+
+    def _load_vote(self, record: dict) -> Vote:
+        return Vote(
+            id=UUID(record["id"]),
+            feature_id=UUID(record["feature_id"]),
+            user_identifier=record["user_identifier"],
+            created_at=datetime.fromisoformat(record["created_at"]),
+        )
+
+
+_in_memory_store: Optional[InMemoryStore] = None
+
+
+def get_in_memory_store() -> Optional[InMemoryStore]:
+    global _in_memory_store
+    settings = get_settings()
+    if settings.repository_backend != "memory":
+        return None
+    if _in_memory_store is None:
+        _in_memory_store = InMemoryStore(
+            settings.memory_store_path,
+            snapshot_interval_seconds=settings.memory_snapshot_interval_seconds,
+            fsync=settings.memory_store_fsync,
+        )
+    return _in_memory_store
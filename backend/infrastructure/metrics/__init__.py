@@ -0,0 +1,15 @@
+from .request_metrics import (
+    QueryStats,
+    RequestMetrics,
+    current_query_stats,
+    get_request_metrics,
+    instrument_engine,
+)
+
+__all__ = [
+    "QueryStats",
+    "RequestMetrics",
+    "current_query_stats",
+    "get_request_metrics",
+    "instrument_engine",
+]
@@ -0,0 +1,150 @@
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from infrastructure.config.settings import get_settings
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50)
+
+RouteKey = Tuple[str, str]
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.request_duration: Dict[RouteKey, Histogram] = {}
+        self.query_count: Dict[RouteKey, Histogram] = {}
+        self.query_duration: Dict[RouteKey, Histogram] = {}
+        self.responses: "Counter[Tuple[str, str, int]]" = Counter()
+
+    def observe(
+        self, method: str, route: str, status: int, seconds: float, queries: QueryStats
+    ) -> None:
+        key = (method, route)
+        if key not in self.request_duration:
+            self.request_duration[key] = Histogram(LATENCY_BUCKETS)
+            self.query_count[key] = Histogram(QUERY_COUNT_BUCKETS)
+            self.query_duration[key] = Histogram(LATENCY_BUCKETS)
+        self.request_duration[key].observe(seconds)
+        self.query_count[key].observe(queries.count)
+        self.query_duration[key].observe(queries.seconds)
+        self.responses[(method, route, status)] += 1
+
+    def render(self) -> str:
+        lines = []
+        for name, help_text, histograms in (
+            (
+                "http_request_duration_seconds",
+                "Request latency by route",
+                self.request_duration,
+            ),
+            (
+                "db_queries_per_request",
+                "SQL statements executed per request",
+                self.query_count,
+            ),
+            (
+                "db_query_duration_seconds_per_request",
+                "Time spent executing SQL per request",
+                self.query_duration,
+            ),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), histogram in sorted(histograms.items()):
+                lines.extend(
+                    histogram.render(name, f'method="{_label(method)}",route="{_label(route)}"')
+                )
+
+        lines.append("# HELP http_responses_total Responses by route and status")
+        lines.append("# TYPE http_responses_total counter")
+        for (method, route, status), count in sorted(self.responses.items()):
+            lines.append(
+                f'http_responses_total{{method="{_label(method)}",route="{_label(route)}",'
+                f'status="{status}"}} {count}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_query_stats.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_query_stats.get()
+    if stats is not None and conn.info.get("query_started"):
+        stats.count += 1
+        stats.seconds += time.perf_counter() - conn.info["query_started"].pop()
+
+
+def _handle_error(context) -> None:
+    if context.connection is not None and context.connection.info.get("query_started"):
+        context.connection.info["query_started"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+_request_metrics: Optional[RequestMetrics] = None
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    global _request_metrics
+    if not get_settings().metrics_enabled:
+        return None
+    if _request_metrics is None:
+        _request_metrics = RequestMetrics()
+    return _request_metrics
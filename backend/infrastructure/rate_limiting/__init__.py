@@ -0,0 +1,15 @@
+from .rate_limiter import (
+    RateLimit,
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+    parse_rate_limits,
+    retry_after_header,
+)
+
+__all__ = [
+    "RateLimit",
+    "TokenBucketRateLimiter",
+    "get_rate_limiter",
+    "parse_rate_limits",
+    "retry_after_header",
+]
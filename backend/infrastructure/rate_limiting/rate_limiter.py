@@ -0,0 +1,175 @@
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import async_session_maker
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+SCOPES = ("ip", "user")
+
+ACQUIRE_SHARED_SQL = text(
+    """
+    INSERT INTO rate_limit_buckets (key, tokens, updated_at)
+    VALUES (:key, :capacity - 1, clock_timestamp())
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = LEAST(
+            :capacity,
+            rate_limit_buckets.tokens
+            + extract(epoch FROM clock_timestamp() - rate_limit_buckets.updated_at) * :rate
+        ) - 1,
+        updated_at = clock_timestamp()
+    WHERE LEAST(
+        :capacity,
+        rate_limit_buckets.tokens
+        + extract(epoch FROM clock_timestamp() - rate_limit_buckets.updated_at) * :rate
+    ) >= 1
+    RETURNING tokens
+    """
+)
+
+SHARED_RETRY_AFTER_SQL = text(
+    """
+    SELECT (1 - LEAST(
+        :capacity,
+        tokens + extract(epoch FROM clock_timestamp() - updated_at) * :rate
+    )) / :rate
+    FROM rate_limit_buckets
+    WHERE key = :key
+    """
+)
+
+PRUNE_SHARED_SQL = text(
+    "DELETE FROM rate_limit_buckets WHERE updated_at < clock_timestamp() - interval '1 day'"
+)
+
+
+class RateLimit:
+    __slots__ = ("scope", "capacity", "rate")
+
+    def __init__(self, scope: str, capacity: int, period_seconds: float):
+        self.scope = scope
+        self.capacity = capacity
+        self.rate = capacity / period_seconds
+
+
+def parse_rate_limits(rules: Dict[str, Dict[str, str]]) -> Dict[str, List[RateLimit]]:
+    parsed = {}
+    for route, limits in rules.items():
+        parsed[route] = []
+        for scope, value in limits.items():
+            match = LIMIT_PATTERN.match(value)
+            if scope not in SCOPES or match is None:
+                raise ValueError(f"Invalid rate limit for {route}: {scope}={value}")
+            parsed[route].append(
+                RateLimit(scope, int(match.group(1)), PERIODS[match.group(2)])
+            )
+    return parsed
+
+
+class TokenBucketRateLimiter:
+    def __init__(
+        self,
+        rules: Dict[str, List[RateLimit]],
+        max_keys: int = 100000,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.rules = rules
+        self.max_keys = max_keys
+        self.session_factory = session_factory
+        self.allowed: "Counter[str]" = Counter()
+        self.limited: "Counter[str]" = Counter()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._shared_acquisitions = 0
+
+    def limits_for(self, route: str) -> Optional[List[RateLimit]]:
+        return self.rules.get(route)
+
+    async def acquire(self, route: str, limit: RateLimit, identity: str) -> float:
+        key = f"{route}|{limit.scope}|{identity}"
+        retry_after = self._acquire_local(key, limit)
+        if retry_after == 0 and self.session_factory is not None:
+            retry_after = await self._acquire_shared(key, limit)
+            if retry_after > 0:
+                self._refund_local(key, limit)
+
+        if retry_after > 0:
+            self.limited[f"{route} {limit.scope}"] += 1
+        else:
+            self.allowed[f"{route} {limit.scope}"] += 1
+        return retry_after
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "allowed": dict(self.allowed),
+            "limited": dict(self.limited),
+            "tracked_keys": len(self._buckets),
+        }
+
+    def _acquire_local(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (limit.capacity, now))
+        tokens = min(limit.capacity, tokens + (now - updated_at) * limit.rate)
+
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            retry_after = 0.0
+        else:
+            self._buckets[key] = (tokens, now)
+            retry_after = (1 - tokens) / limit.rate
+
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    def _refund_local(self, key: str, limit: RateLimit) -> None:
+        entry = self._buckets.get(key)
+        if entry is not None:
+            tokens, updated_at = entry
+            self._buckets[key] = (min(limit.capacity, tokens + 1), updated_at)
+
+    async def _acquire_shared(self, key: str, limit: RateLimit) -> float:
+        parameters = {"key": key, "capacity": limit.capacity, "rate": limit.rate}
+        async with self.session_factory() as session:
+            result = await session.execute(ACQUIRE_SHARED_SQL, parameters)
+            retry_after = 0.0
+            if result.scalar_one_or_none() is None:
+                retry_after = (
+                    await session.scalar(SHARED_RETRY_AFTER_SQL, parameters) or 1 / limit.rate
+                )
+
+            self._shared_acquisitions += 1
+            if self._shared_acquisitions % 1000 == 0:
+                await session.execute(PRUNE_SHARED_SQL)
+            await session.commit()
+        return max(0.0, float(retry_after))
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+_rate_limiter: Optional[TokenBucketRateLimiter] = None
+
+
+def get_rate_limiter() -> Optional[TokenBucketRateLimiter]:
+    global _rate_limiter
+    settings = get_settings()
+    if not settings.rate_limit_enabled:
+        return None
+    if _rate_limiter is None:
+        _rate_limiter = TokenBucketRateLimiter(
+            parse_rate_limits(settings.rate_limit_rules),
+            max_keys=settings.rate_limit_max_keys,
+            session_factory=(
+                async_session_maker if settings.rate_limit_shared_store_enabled else None
+            ),
+        )
+    return _rate_limiter
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.interfaces.repositories import FeatureRepository, VoteRepository
+from infrastructure.database.repositories import FeatureRepositoryImpl, VoteRepositoryImpl
+from infrastructure.memory import (
+    InMemoryFeatureRepository,
+    InMemoryVoteRepository,
+    get_in_memory_store,
+)
+
+
+def get_feature_repository(session: AsyncSession) -> FeatureRepository:
+    store = get_in_memory_store()
+    if store is not None:
+        return InMemoryFeatureRepository(store)
+    return FeatureRepositoryImpl(session)
+
+
+def get_vote_repository(session: AsyncSession) -> VoteRepository:
+    store = get_in_memory_store()
+    if store is not None:
+        return InMemoryVoteRepository(store)
+    return VoteRepositoryImpl(session)
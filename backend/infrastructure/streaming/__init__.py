@@ -0,0 +1,13 @@
+from .vote_stream import (
+    TransactionalVoteEventPublisher,
+    VoteStreamHub,
+    VoteStreamSubscription,
+    get_vote_stream_hub,
+)
+
+__all__ = [
+    "TransactionalVoteEventPublisher",
+    "VoteStreamHub",
+    "VoteStreamSubscription",
+    "get_vote_stream_hub",
+]
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from application.interfaces.events import VoteEventPublisher
+from infrastructure.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+PENDING_EVENTS_KEY = "pending_vote_events"
+NOTIFY_PAYLOAD_LIMIT = 7900
+RECONNECT_MAX_SECONDS = 30.0
+
+
+class VoteStreamSubscription:
+    def __init__(self, buffer_size: int):
+        self.queue: "asyncio.Queue[Optional[List[Dict]]]" = asyncio.Queue(maxsize=buffer_size)
+        self.dropped = False
+
+    def offer(self, message: List[Dict]) -> bool:
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.close()
+            return False
+
+    def close(self) -> None:
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class VoteStreamHub(VoteEventPublisher):
+    def __init__(
+        self,
+        tick_ms: int = 250,
+        subscriber_buffer: int = 100,
+        notify_dsn: Optional[str] = None,
+        channel: str = "feature_votes",
+    ):
+        self.tick = tick_ms / 1000
+        self.subscriber_buffer = subscriber_buffer
+        self.notify_dsn = notify_dsn
+        self.channel = channel
+        self.dropped_subscribers = 0
+        self.connections = 0
+        self._pending: Dict[UUID, int] = {}
+        self._unsent: Dict[UUID, int] = {}
+        self._subscribers: Set[VoteStreamSubscription] = set()
+        self._connection: Optional[asyncpg.Connection] = None
+        self._reconnect_delay = self.tick
+        self._reconnect_at = 0.0
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, feature_id: UUID, votes_count: int) -> None:
+        self._merge({feature_id: votes_count})
+
+    def subscribe(self) -> VoteStreamSubscription:
+        subscription = VoteStreamSubscription(self.subscriber_buffer)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: VoteStreamSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        if self.notify_dsn:
+            await self._reconnect()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        for subscription in list(self._subscribers):
+            subscription.close()
+        self._subscribers.clear()
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": len(self._subscribers),
+            "dropped_subscribers": self.dropped_subscribers,
+            "pending": len(self._pending),
+            "listening": self._connection is not None,
+            "connections": self.connections,
+        }
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.tick)
+            except asyncio.TimeoutError:
+                pass
+            if self.notify_dsn and self._connection is None:
+                await self._reconnect()
+            try:
+                await self._flush()
+            except Exception:
+                logger.exception("Failed to flush vote stream tick")
+
+    async def _reconnect(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._reconnect_at:
+            return
+        try:
+            connection = await asyncpg.connect(self.notify_dsn)
+            await connection.add_listener(self.channel, self._on_notification)
+        except Exception:
+            logger.warning(
+                "Vote stream LISTEN connection failed, retrying in %.1fs",
+                self._reconnect_delay,
+                exc_info=True,
+            )
+            self._reconnect_at = loop.time() + self._reconnect_delay
+            self._reconnect_delay = min(self._reconnect_delay * 2, RECONNECT_MAX_SECONDS)
+            return
+
+        connection.add_termination_listener(self._on_terminated)
+        self._connection = connection
+        self._merge(self._unsent)
+        self._unsent = {}
+        self._reconnect_delay = self.tick
+        self.connections += 1
+
+    def _on_terminated(self, connection) -> None:
+        if self._connection is connection:
+            logger.warning("Vote stream LISTEN connection closed, reconnecting")
+            self._connection = None
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        message = [
+            {"feature_id": str(feature_id), "votes_count": votes_count}
+            for feature_id, votes_count in pending.items()
+        ]
+
+        if self._connection is None:
+            self._fan_out(message)
+            if self.notify_dsn:
+                for feature_id, votes_count in pending.items():
+                    self._unsent[feature_id] = max(votes_count, self._unsent.get(feature_id, 0))
+            return
+
+        try:
+            for payload in self._chunk_payloads(message):
+                await self._connection.execute(
+                    "SELECT pg_notify($1, $2)", self.channel, payload
+                )
+        except Exception:
+            self._merge(pending)
+            if self._connection is not None and self._connection.is_closed():
+                self._connection = None
+            raise
+
+    def _merge(self, counts: Dict[UUID, int]) -> None:
+        for feature_id, votes_count in counts.items():
+            self._pending[feature_id] = max(votes_count, self._pending.get(feature_id, 0))
+
+    def _chunk_payloads(self, message: List[Dict]) -> List[str]:
+        payloads, chunk = [], []
+        for delta in message:
+            candidate = json.dumps(chunk + [delta], separators=(",", ":"))
+            if chunk and len(candidate) > NOTIFY_PAYLOAD_LIMIT:
+                payloads.append(json.dumps(chunk, separators=(",", ":")))
+                chunk = [delta]
+            else:
+                chunk.append(delta)
+        if chunk:
+            payloads.append(json.dumps(chunk, separators=(",", ":")))
+        return payloads
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            self._fan_out(json.loads(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed vote stream payload")
+
+    def _fan_out(self, message: List[Dict]) -> None:
+        for subscription in list(self._subscribers):
+            if not subscription.offer(message):
+                self._subscribers.discard(subscription)
+                self.dropped_subscribers += 1
+
+
+class TransactionalVoteEventPublisher(VoteEventPublisher):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def publish(self, feature_id: UUID, votes_count: int) -> None:
+        pending = self.session.sync_session.info.setdefault(PENDING_EVENTS_KEY, [])
+        pending.append((feature_id, votes_count))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_events(session: Session) -> None:
+    pending = session.info.pop(PENDING_EVENTS_KEY, None)
+    hub = get_vote_stream_hub()
+    if pending and hub is not None:
+        for feature_id, votes_count in pending:
+            hub.publish(feature_id, votes_count)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_events(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+_vote_stream_hub: Optional[VoteStreamHub] = None
+
+
+def get_vote_stream_hub() -> Optional[VoteStreamHub]:
+    global _vote_stream_hub
+    settings = get_settings()
+    if not settings.vote_stream_enabled:
+        return None
+    if _vote_stream_hub is None:
+        notify_dsn = None
+        if settings.vote_stream_use_notify:
+            notify_dsn = (
+                make_url(settings.database_url)
+                .set(drivername="postgresql")
+                .render_as_string(hide_password=False)
+            )
+        _vote_stream_hub = VoteStreamHub(
+            tick_ms=settings.vote_stream_tick_ms,
+            subscriber_buffer=settings.vote_stream_subscriber_buffer,
+            notify_dsn=notify_dsn,
+            channel=settings.vote_stream_channel,
+        )
+    return _vote_stream_hub
@@ -1,22 +1,105 @@
+import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from infrastructure.cache import (
+    get_idempotency_store,
+    get_similarity_index,
+    get_vote_bloom_filter,
+)
 from infrastructure.config.settings import get_settings
-from infrastructure.database.models import Base
-from infrastructure.database.connection import engine
-from presentation.api.routes import features_router, health_router
+from infrastructure.database.connection import async_session_maker, engine, replica_engines
+from infrastructure.database.migrations import verify_schema_revision
+from infrastructure.ingestion import (
+    get_trending_score_recompute,
+    get_vote_buffer,
+    get_vote_counter_rollup,
+)
+from infrastructure.memory import get_in_memory_store
+from infrastructure.metrics import get_request_metrics, instrument_engine
+from infrastructure.rate_limiting import get_rate_limiter
+from infrastructure.streaming import get_vote_stream_hub
+from presentation.api.http import (
+    IdempotencyMiddleware,
+    MetricsMiddleware,
+    PrimaryPinMiddleware,
+    RateLimitMiddleware,
+)
+from presentation.api.routes import (
+    exports_router,
+    features_router,
+    health_router,
+    metrics_router,
+)
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    started = time.perf_counter()
+    app.state.schema_revision = None
+
+    in_memory_store = get_in_memory_store()
+    if in_memory_store is not None:
+        await in_memory_store.start()
+    elif settings.database_schema_check:
+        app.state.schema_revision = await verify_schema_revision(engine)
+
+    vote_bloom_filter = get_vote_bloom_filter()
+    if vote_bloom_filter is not None:
+        async with async_session_maker() as session:
+            await vote_bloom_filter.warm(session)
+
+    similarity_index = get_similarity_index()
+    if similarity_index is not None:
+        if in_memory_store is not None:
+            for feature in in_memory_store.features.values():
+                similarity_index.add(feature.id, feature.title, feature.description)
+        else:
+            await similarity_index.start(async_session_maker)
+
+    vote_buffer = get_vote_buffer()
+    if vote_buffer is not None:
+        await vote_buffer.start()
+
+    vote_counter_rollup = get_vote_counter_rollup()
+    if vote_counter_rollup is not None:
+        await vote_counter_rollup.start()
+
+    trending_score_recompute = get_trending_score_recompute()
+    if trending_score_recompute is not None:
+        await trending_score_recompute.start()
+
+    vote_stream_hub = get_vote_stream_hub()
+    if vote_stream_hub is not None:
+        await vote_stream_hub.start()
+
+    app.state.startup_seconds = time.perf_counter() - started
+    logger.info("Application startup completed in %.1f ms", app.state.startup_seconds * 1000)
+
     yield
+
+    if vote_stream_hub is not None:
+        await vote_stream_hub.stop()
+    if vote_buffer is not None:
+        await vote_buffer.stop()
+    if vote_counter_rollup is not None:
+        await vote_counter_rollup.stop()
+    if trending_score_recompute is not None:
+        await trending_score_recompute.stop()
+    if similarity_index is not None:
+        await similarity_index.stop()
+    if in_memory_store is not None:
+        await in_memory_store.stop()
     await engine.dispose()
+    for replica_engine in replica_engines:
+        await replica_engine.dispose()
 
 
 app = FastAPI(
@@ -26,16 +109,42 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if replica_engines and settings.read_your_writes_seconds > 0:
+    app.add_middleware(PrimaryPinMiddleware, pin_seconds=settings.read_your_writes_seconds)
+
+idempotency_store = get_idempotency_store()
+if idempotency_store is not None:
+    app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+
+rate_limiter = get_rate_limiter()
+if rate_limiter is not None:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=rate_limiter,
+        routes=app.routes,
+        trusted_proxies=settings.rate_limit_trusted_proxies,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Idempotent-Replayed", "Retry-After"],
 )
 
+request_metrics = get_request_metrics()
+if request_metrics is not None:
+    instrument_engine(engine.sync_engine)
+    for replica_engine in replica_engines:
+        instrument_engine(replica_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+
 app.include_router(features_router)
+app.include_router(exports_router)
 app.include_router(health_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -0,0 +1,48 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2024-01-01 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "features",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("author_name", sa.String(100), nullable=False),
+        sa.Column("votes_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        "votes",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "feature_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("features.id"),
+            nullable=False,
+        ),
+        sa.Column("user_identifier", sa.String(100), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.UniqueConstraint("feature_id", "user_identifier", name="unique_feature_user_vote"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("votes")
+    op.drop_table("features")
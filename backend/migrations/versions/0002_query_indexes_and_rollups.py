@@ -0,0 +1,125 @@
+"""query indexes, search, trending and rollup tables
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-01-02 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.trending import TRENDING_EPOCH, decay_rate
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+INDEXES = [
+    ("ix_features_votes_count_id", "features", ["votes_count", "id"], {}),
+    ("ix_features_created_at_id", "features", ["created_at", "id"], {}),
+    ("ix_features_updated_at", "features", ["updated_at"], {}),
+    ("ix_features_trending_score_id", "features", ["trending_score", "id"], {}),
+    ("ix_features_search_vector", "features", ["search_vector"], {"postgresql_using": "gin"}),
+    ("ix_votes_user_identifier_feature_id", "votes", ["user_identifier", "feature_id"], {}),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "features",
+        sa.Column("trending_score", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.alter_column("features", "trending_score", server_default=None)
+    op.execute(
+        sa.text(
+            """
+            WITH terms AS (
+                SELECT id AS feature_id,
+                       :rate * extract(epoch FROM created_at - :epoch) AS exponent
+                FROM features
+                UNION ALL
+                SELECT feature_id,
+                       :rate * extract(epoch FROM created_at - :epoch)
+                FROM votes
+            ),
+            peaks AS (
+                SELECT feature_id, max(exponent) AS peak FROM terms GROUP BY feature_id
+            ),
+            scores AS (
+                SELECT terms.feature_id,
+                       peaks.peak + ln(sum(exp(terms.exponent - peaks.peak))) AS score
+                FROM terms JOIN peaks ON peaks.feature_id = terms.feature_id
+                GROUP BY terms.feature_id, peaks.peak
+            )
+            UPDATE features SET trending_score = scores.score
+            FROM scores
+            WHERE features.id = scores.feature_id
+            """
+        ).bindparams(
+            rate=decay_rate(get_settings().trending_half_life_hours),
+            epoch=TRENDING_EPOCH,
+        )
+    )
+    op.add_column(
+        "features",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+        ),
+    )
+
+    op.create_table(
+        "vote_counter_shards",
+        sa.Column(
+            "feature_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("features.id"),
+            primary_key=True,
+        ),
+        sa.Column("shard", sa.SmallInteger(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "vote_buckets",
+        sa.Column(
+            "feature_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("features.id"),
+            primary_key=True,
+        ),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    op.drop_table("vote_buckets")
+    op.drop_table("vote_counter_shards")
+    op.drop_column("features", "search_vector")
+    op.drop_column("features", "trending_score")
@@ -0,0 +1,65 @@
+"""seed trending scores with a negligible creation term
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-01-05 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.trending import (
+    TRENDING_EPOCH,
+    TRENDING_SEED_OFFSET,
+    decay_rate,
+)
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RECOMPUTE_SQL = sa.text(
+    """
+    WITH terms AS (
+        SELECT id AS feature_id,
+               :rate * extract(epoch FROM created_at - :epoch) - :seed_offset AS exponent
+        FROM features
+        UNION ALL
+        SELECT feature_id,
+               :rate * extract(epoch FROM created_at - :epoch)
+        FROM votes
+    ),
+    peaks AS (
+        SELECT feature_id, max(exponent) AS peak FROM terms GROUP BY feature_id
+    ),
+    scores AS (
+        SELECT terms.feature_id,
+               peaks.peak + ln(sum(exp(terms.exponent - peaks.peak))) AS score
+        FROM terms JOIN peaks ON peaks.feature_id = terms.feature_id
+        GROUP BY terms.feature_id, peaks.peak
+    )
+    UPDATE features SET trending_score = scores.score
+    FROM scores
+    WHERE features.id = scores.feature_id
+    """
+)
+
+
+def recompute(seed_offset: float):
+    return RECOMPUTE_SQL.bindparams(
+        rate=decay_rate(get_settings().trending_half_life_hours),
+        epoch=TRENDING_EPOCH,
+        seed_offset=seed_offset,
+    )
+
+
+def upgrade() -> None:
+    op.execute(recompute(TRENDING_SEED_OFFSET))
+
+
+def downgrade() -> None:
+    op.execute(recompute(0))
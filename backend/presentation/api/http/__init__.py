@@ -0,0 +1,17 @@
+from .etag import etag_matches, weak_etag
+from .idempotency_middleware import IdempotencyMiddleware
+from .metrics_middleware import MetricsMiddleware
+from .primary_pin_middleware import PrimaryPinMiddleware
+from .rate_limit_middleware import RateLimitMiddleware
+from .responses import feature_list_response, feature_response
+
+__all__ = [
+    "IdempotencyMiddleware",
+    "MetricsMiddleware",
+    "PrimaryPinMiddleware",
+    "RateLimitMiddleware",
+    "etag_matches",
+    "feature_list_response",
+    "feature_response",
+    "weak_etag",
+]
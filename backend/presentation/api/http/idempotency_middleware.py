@@ -0,0 +1,129 @@
+import hashlib
+import json
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.cache import IdempotencyStore, IdempotentResponse
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyMiddleware:
+    def __init__(self, app: ASGIApp, store: IdempotencyStore):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = dict(scope["headers"]).get(IDEMPOTENCY_HEADER)
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await self._error(send, 400, "Idempotency-Key must be 1-255 characters")
+            return
+
+        body = await self._read_body(receive)
+        key = hashlib.sha256(
+            b"\0".join([scope["path"].encode(), idempotency_key])
+        ).hexdigest()
+        fingerprint = hashlib.sha256(body).hexdigest()
+
+        cached = await self.store.lookup(key)
+        if cached is None:
+            cached = await self.store.wait(key)
+        if cached is not None:
+            await self._replay(send, cached, fingerprint)
+            return
+
+        if not await self.store.claim(key, fingerprint):
+            cached = await self.store.wait(key) or await self.store.lookup(key)
+            if cached is not None:
+                await self._replay(send, cached, fingerprint)
+            else:
+                await self._error(
+                    send, 409, "A request with this Idempotency-Key is in progress", retry=True
+                )
+            return
+
+        status_code = 500
+        headers = []
+        chunks = []
+
+        replayed = False
+
+        async def replay_body() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_body, capture)
+        except BaseException:
+            await self.store.release(key)
+            raise
+
+        if status_code >= 500:
+            await self.store.release(key)
+            return
+
+        await self.store.complete(
+            key,
+            IdempotentResponse(
+                fingerprint,
+                status_code,
+                [(name.decode("latin-1"), value.decode("latin-1")) for name, value in headers],
+                b"".join(chunks),
+            ),
+        )
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    async def _replay(self, send: Send, response: IdempotentResponse, fingerprint: str) -> None:
+        if response.fingerprint != fingerprint:
+            await self._error(
+                send, 422, "Idempotency-Key was already used with a different request body"
+            )
+            return
+
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in response.headers
+        ]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send(
+            {"type": "http.response.start", "status": response.status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    async def _error(self, send: Send, status_code: int, detail: str, retry: bool = False) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if retry:
+            headers.append((b"retry-after", b"1"))
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,28 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.database.connection import PRIMARY_PIN_COOKIE
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class PrimaryPinMiddleware:
+    def __init__(self, app: ASGIApp, pin_seconds: float):
+        self.app = app
+        self.cookie = (
+            f"{PRIMARY_PIN_COOKIE}=1; Max-Age={max(1, round(pin_seconds))}; Path=/; "
+            "HttpOnly; SameSite=Lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"set-cookie", self.cookie)
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
@@ -0,0 +1,120 @@
+import json
+from typing import List, Optional
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.rate_limiting import TokenBucketRateLimiter, retry_after_header
+
+MAX_IDENTITY_LENGTH = 100
+UNKNOWN_CLIENT = "unknown"
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: TokenBucketRateLimiter,
+        routes: List[BaseRoute],
+        trusted_proxies: int = 0,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.routes = routes
+        self.trusted_proxies = trusted_proxies
+        self.methods = {rule.split(" ", 1)[0] for rule in limiter.rules}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        route = self._match_route(scope)
+        limits = self.limiter.limits_for(route) if route else None
+        if not limits:
+            await self.app(scope, receive, send)
+            return
+
+        body = None
+        for limit in limits:
+            if limit.scope == "ip":
+                identity = self._client_ip(scope)
+            else:
+                if body is None:
+                    body = await self._read_body(receive)
+                identity = self._user_identifier(body)
+            if identity is None:
+                continue
+
+            retry_after = await self.limiter.acquire(route, limit, identity)
+            if retry_after > 0:
+                await self._reject(send, retry_after)
+                return
+
+        if body is not None:
+            receive = self._replay(body, receive)
+        await self.app(scope, receive, send)
+
+    def _match_route(self, scope: Scope) -> Optional[str]:
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return f"{scope['method']} {route.path}"
+        return None
+
+    def _client_ip(self, scope: Scope) -> str:
+        if self.trusted_proxies > 0:
+            forwarded = [
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == b"x-forwarded-for"
+            ]
+            hops = [hop.strip() for hop in ",".join(forwarded).split(",") if hop.strip()]
+            if hops:
+                return hops[-min(self.trusted_proxies, len(hops))]
+        client = scope.get("client")
+        return client[0] if client else UNKNOWN_CLIENT
+
+    def _user_identifier(self, body: bytes) -> Optional[str]:
+        try:
+            user_identifier = json.loads(body).get("user_identifier")
+        except (ValueError, AttributeError):
+            return None
+        if not isinstance(user_identifier, str) or not user_identifier:
+            return None
+        return user_identifier[:MAX_IDENTITY_LENGTH]
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    def _replay(self, body: bytes, receive: Receive) -> Receive:
+        replayed = False
+
+        async def replay() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return replay
+
+    async def _reject(self, send: Send, retry_after: float) -> None:
+        body = json.dumps({"detail": "Too many requests"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", retry_after_header(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,20 @@
+from typing import Dict, List, Optional
+
+from fastapi.responses import ORJSONResponse
+
+from application.dtos import FeatureResponseDTO
+
+
+def feature_response(
+    result: FeatureResponseDTO,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
+    return ORJSONResponse(content=result.__dict__, status_code=status_code, headers=headers)
+
+
+def feature_list_response(
+    results: List[FeatureResponseDTO],
+    headers: Optional[Dict[str, str]] = None,
+) -> ORJSONResponse:
+    return ORJSONResponse(content=[result.__dict__ for result in results], headers=headers)
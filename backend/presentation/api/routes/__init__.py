@@ -1,4 +1,6 @@
+from .exports import router as exports_router
 from .features import router as features_router
 from .health import router as health_router
+from .metrics import router as metrics_router
 
-__all__ = ["features_router", "health_router"]
+__all__ = ["exports_router", "features_router", "health_router", "metrics_router"]
@@ -0,0 +1,74 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.config.settings import get_settings
+from infrastructure.database.bulk import EXPORT_COLUMNS, encode_header, encode_rows, export_table
+from infrastructure.database.connection import engine
+from infrastructure.memory import get_in_memory_store
+
+router = APIRouter(prefix="/api/v1/export", tags=["export"])
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+async def _memory_chunks(store, table: str, fmt: str, chunk_size: int):
+    columns = EXPORT_COLUMNS[table]
+    items = list(store.features.values() if table == "features" else store.votes.values())
+    yield encode_header(columns, fmt)
+    for start in range(0, len(items), chunk_size):
+        yield encode_rows(
+            columns,
+            (
+                tuple(getattr(item, name) for name in columns)
+                for item in items[start : start + chunk_size]
+            ),
+            fmt,
+        )
+
+
+async def _database_chunks(table: str, fmt: str, chunk_size: int):
+    async with AsyncSession(engine) as session:
+        async for chunk in export_table(session, table, fmt, chunk_size):
+            yield chunk
+
+
+def _authorize(authorization: Optional[str], token: Optional[str]) -> None:
+    if not token:
+        raise HTTPException(status_code=403, detail="Bulk export requires BULK_EXPORT_TOKEN")
+    if authorization is None or not secrets.compare_digest(
+        authorization.encode(), f"Bearer {token}".encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid export token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.get("/{table}")
+async def export(
+    table: str,
+    format: str = Query("ndjson", regex="^(ndjson|csv)$"),
+    authorization: Optional[str] = Header(None),
+):
+    settings = get_settings()
+    if not settings.bulk_export_enabled:
+        raise HTTPException(status_code=404, detail="Bulk export is disabled")
+    _authorize(authorization, settings.bulk_export_token)
+    if table not in EXPORT_COLUMNS:
+        raise HTTPException(status_code=404, detail=f"Unknown table: {table}")
+
+    store = get_in_memory_store()
+    if store is not None:
+        chunks = _memory_chunks(store, table, format, settings.bulk_export_chunk_size)
+    else:
+        chunks = _database_chunks(table, format, settings.bulk_export_chunk_size)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{table}.{format}"'},
+    )
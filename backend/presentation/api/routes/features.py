@@ -1,36 +1,109 @@
-from typing import List
+import asyncio
+import json
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from application.dtos import CreateFeatureDTO, VoteDTO
+from application.dtos import BulkVoteItemDTO, CreateFeatureDTO, VoteDTO
+from application.interfaces.caches import RequestCoalescer
 from application.use_cases import (
+    BulkUpvoteFeaturesUseCase,
     CreateFeatureUseCase,
     GetFeatureUseCase,
+    GetVoteHistogramUseCase,
     ListFeaturesUseCase,
+    SearchFeaturesUseCase,
     UpvoteFeatureUseCase,
 )
 from domain.exceptions import (
     DuplicateVoteException,
     FeatureNotFoundException,
+    InvalidCursorException,
     InvalidFeatureDataException,
 )
-from infrastructure.database.connection import get_db
-from infrastructure.database.repositories import FeatureRepositoryImpl, VoteRepositoryImpl
-from presentation.api.schemas import CreateFeatureRequest, FeatureResponse, VoteRequest
+from domain.value_objects import Vote
+from infrastructure.cache import (
+    TransactionalLeaderboardCache,
+    TransactionalSimilarityIndex,
+    get_leaderboard_cache,
+    get_similarity_index,
+    get_single_flight,
+    get_vote_bloom_filter,
+)
+from infrastructure.config.settings import get_settings
+from infrastructure.database.connection import get_db, get_read_db
+from infrastructure.ingestion import get_vote_buffer
+from infrastructure.repositories import get_feature_repository, get_vote_repository
+from infrastructure.streaming import TransactionalVoteEventPublisher, get_vote_stream_hub
+from presentation.api.http import (
+    etag_matches,
+    feature_list_response,
+    feature_response,
+    weak_etag,
+)
+from presentation.api.schemas import (
+    BulkVoteItemResult,
+    BulkVoteRequest,
+    BulkVoteResponse,
+    CreateFeatureRequest,
+    CreatedFeatureResponse,
+    FeatureResponse,
+    SimilarFeature,
+    VoteAcceptedResponse,
+    VoteHistogramBucket,
+    VoteHistogramResponse,
+    VoteRequest,
+)
 
 router = APIRouter(prefix="/api/v1/features", tags=["features"])
 
 
-@router.post("", response_model=FeatureResponse, status_code=201)
+def _read_coalescer(session: AsyncSession) -> Optional[RequestCoalescer]:
+    single_flight = get_single_flight()
+    info = getattr(session, "info", {})
+    if single_flight is None or info.get("primary_pinned"):
+        return None
+    return single_flight.scoped(info.get("read_target", "primary"))
+
+
+def _leaderboard(session: AsyncSession) -> Optional[TransactionalLeaderboardCache]:
+    leaderboard = get_leaderboard_cache()
+    if leaderboard is None:
+        return None
+    return TransactionalLeaderboardCache(leaderboard, session)
+
+
+def _similarity_index(session: AsyncSession) -> Optional[TransactionalSimilarityIndex]:
+    similarity_index = get_similarity_index()
+    if similarity_index is None:
+        return None
+    return TransactionalSimilarityIndex(similarity_index, session)
+
+
+def _event_publisher(session: AsyncSession) -> Optional[TransactionalVoteEventPublisher]:
+    if get_vote_stream_hub() is None:
+        return None
+    return TransactionalVoteEventPublisher(session)
+
+
+@router.post("", response_model=CreatedFeatureResponse, status_code=201)
 async def create_feature(
     request: CreateFeatureRequest,
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        feature_repo = FeatureRepositoryImpl(session)
-        use_case = CreateFeatureUseCase(feature_repo)
+        feature_repo = get_feature_repository(session)
+        use_case = CreateFeatureUseCase(
+            feature_repo,
+            _leaderboard(session),
+            _event_publisher(session),
+            _similarity_index(session),
+            get_settings().duplicate_detection_limit,
+        )
 
         dto = CreateFeatureDTO(
             title=request.title,
@@ -39,7 +112,7 @@ async def create_feature(
         )
 
         result = await use_case.execute(dto)
-        return FeatureResponse(**result.__dict__)
+        return feature_response(result, status_code=201)
     except InvalidFeatureDataException as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -48,52 +121,267 @@ async def create_feature(
 
 @router.get("", response_model=List[FeatureResponse])
 async def list_features(
-    sort_by: str = Query("created_at", regex="^(votes|created_at)$"),
+    sort_by: str = Query("created_at", regex="^(votes|created_at|trending)$"),
     order: str = Query("desc", regex="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=512),
+    user_identifier: Optional[str] = Query(None, min_length=1, max_length=100),
+    view: str = Query("full", regex="^(full|summary)$"),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_db),
+):
+    try:
+        feature_repo = get_feature_repository(session)
+        vote_repo = get_vote_repository(session)
+        use_case = ListFeaturesUseCase(
+            feature_repo,
+            get_leaderboard_cache(),
+            vote_repo,
+            _read_coalescer(session),
+        )
+
+        settings = get_settings()
+        cache_headers = {"Cache-Control": settings.feature_cache_control}
+        if if_none_match:
+            cache_headers["ETag"] = weak_etag(
+                "features",
+                await use_case.watermark(),
+                sort_by,
+                order,
+                limit,
+                cursor,
+                user_identifier,
+                view,
+            )
+            if etag_matches(if_none_match, cache_headers["ETag"]):
+                return Response(status_code=304, headers=cache_headers)
+
+        description_limit = (
+            settings.feature_summary_description_length if view == "summary" else None
+        )
+        page = await use_case.execute(
+            sort_by, order, limit, cursor, user_identifier, description_limit
+        )
+        if page.next_cursor:
+            cache_headers["X-Next-Cursor"] = page.next_cursor
+        return feature_list_response(page.items, headers=cache_headers)
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/votes/batch", response_model=BulkVoteResponse)
+async def bulk_upvote_features(
+    request: BulkVoteRequest,
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        feature_repo = FeatureRepositoryImpl(session)
-        use_case = ListFeaturesUseCase(feature_repo)
+        feature_repo = get_feature_repository(session)
+        vote_repo = get_vote_repository(session)
+        use_case = BulkUpvoteFeaturesUseCase(
+            feature_repo,
+            vote_repo,
+            _leaderboard(session),
+            get_vote_bloom_filter(),
+            _event_publisher(session),
+        )
 
-        results = await use_case.execute(sort_by, order, limit)
-        return [FeatureResponse(**result.__dict__) for result in results]
+        items = [
+            BulkVoteItemDTO(feature_id=vote.feature_id, user_identifier=vote.user_identifier)
+            for vote in request.votes
+        ]
+        results = await use_case.execute(items)
+        return BulkVoteResponse(
+            results=[BulkVoteItemResult(**result.__dict__) for result in results]
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/search", response_model=List[FeatureResponse])
+async def search_features(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=512),
+    session: AsyncSession = Depends(get_read_db),
+):
+    try:
+        feature_repo = get_feature_repository(session)
+        use_case = SearchFeaturesUseCase(feature_repo)
+
+        page = await use_case.execute(q, limit, cursor)
+        headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+        return feature_list_response(page.items, headers=headers)
+    except (InvalidCursorException, InvalidFeatureDataException) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/similar", response_model=List[SimilarFeature])
+async def similar_features(
+    title: str = Query(..., min_length=1, max_length=200),
+    description: str = Query("", max_length=5000),
+    limit: int = Query(5, ge=1, le=50),
+):
+    similarity_index = get_similarity_index()
+    if similarity_index is None:
+        raise HTTPException(status_code=404, detail="Duplicate detection is disabled")
+
+    return [
+        SimilarFeature(id=feature_id, title=match_title, similarity=score)
+        for feature_id, match_title, score in similarity_index.query(title, description, limit)
+    ]
+
+
+@router.get("/stream")
+async def stream_votes():
+    hub = get_vote_stream_hub()
+    if hub is None:
+        raise HTTPException(status_code=404, detail="Vote stream is disabled")
+
+    subscription = hub.subscribe()
+    heartbeat = get_settings().vote_stream_heartbeat_seconds
+
+    async def events():
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    break
+                yield f"event: votes\ndata: {json.dumps(message)}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{feature_id}", response_model=FeatureResponse)
 async def get_feature(
     feature_id: UUID,
-    session: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_db),
 ):
     try:
-        feature_repo = FeatureRepositoryImpl(session)
-        use_case = GetFeatureUseCase(feature_repo)
+        feature_repo = get_feature_repository(session)
+        use_case = GetFeatureUseCase(feature_repo, _read_coalescer(session))
+        cache_control = get_settings().feature_cache_control
+
+        if if_none_match:
+            updated_at, votes_count = await use_case.get_version(feature_id)
+            etag = weak_etag(feature_id, votes_count, updated_at.isoformat())
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": cache_control},
+                )
 
         result = await use_case.execute(feature_id)
-        return FeatureResponse(**result.__dict__)
+        return feature_response(
+            result,
+            headers={
+                "ETag": weak_etag(result.id, result.votes_count, result.updated_at.isoformat()),
+                "Cache-Control": cache_control,
+            },
+        )
     except FeatureNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.post("/{feature_id}/vote", response_model=FeatureResponse)
+@router.get("/{feature_id}/votes/histogram", response_model=VoteHistogramResponse)
+async def get_vote_histogram(
+    feature_id: UUID,
+    start: Optional[datetime] = Query(None),
+    end: Optional[datetime] = Query(None),
+    granularity: str = Query("hour", regex="^(hour|day)$"),
+    session: AsyncSession = Depends(get_read_db),
+):
+    if not get_settings().vote_analytics_enabled:
+        raise HTTPException(status_code=404, detail="Vote analytics are disabled")
+
+    try:
+        feature_repo = get_feature_repository(session)
+        vote_repo = get_vote_repository(session)
+        use_case = GetVoteHistogramUseCase(feature_repo, vote_repo)
+
+        result = await use_case.execute(feature_id, start, end, granularity)
+        return VoteHistogramResponse(
+            feature_id=result.feature_id,
+            granularity=result.granularity,
+            start=result.start,
+            end=result.end,
+            buckets=[VoteHistogramBucket(**bucket.__dict__) for bucket in result.buckets],
+        )
+    except FeatureNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidFeatureDataException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/{feature_id}/vote",
+    response_model=FeatureResponse,
+    responses={
+        202: {
+            "model": VoteAcceptedResponse,
+            "description": (
+                "Queued for a batched write. Repeats seen by this worker get 409, "
+                "but a vote that already exists in the database is still accepted "
+                "and then ignored when the batch is written"
+            ),
+        }
+    },
+)
 async def upvote_feature(
     feature_id: UUID,
     request: VoteRequest,
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        feature_repo = FeatureRepositoryImpl(session)
-        vote_repo = VoteRepositoryImpl(session)
-        use_case = UpvoteFeatureUseCase(feature_repo, vote_repo)
+        feature_repo = get_feature_repository(session)
+        vote_buffer = get_vote_buffer()
+        vote_filter = get_vote_bloom_filter()
+        if (
+            vote_buffer is not None
+            and (
+                vote_filter is None
+                or not vote_filter.might_contain(feature_id, request.user_identifier)
+            )
+            and await vote_buffer.submit(
+                Vote(feature_id=feature_id, user_identifier=request.user_identifier),
+                feature_repo,
+            )
+        ):
+            accepted = VoteAcceptedResponse(
+                feature_id=feature_id, user_identifier=request.user_identifier
+            )
+            return JSONResponse(status_code=202, content=accepted.model_dump(mode="json"))
+
+        vote_repo = get_vote_repository(session)
+        use_case = UpvoteFeatureUseCase(
+            feature_repo,
+            vote_repo,
+            _leaderboard(session),
+            vote_filter,
+            _event_publisher(session),
+        )
 
         dto = VoteDTO(user_identifier=request.user_identifier)
         result = await use_case.execute(feature_id, dto)
-        return FeatureResponse(**result.__dict__)
+        return feature_response(result)
     except FeatureNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except DuplicateVoteException as e:
@@ -1,19 +1,40 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Request
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.database.connection import get_db
+from infrastructure.cache import (
+    get_idempotency_store,
+    get_leaderboard_cache,
+    get_similarity_index,
+    get_single_flight,
+    get_vote_bloom_filter,
+)
+from infrastructure.database.connection import engine, replica_router
+from infrastructure.database.pool import pool_stats
+from infrastructure.ingestion import get_vote_buffer
+from infrastructure.memory import get_in_memory_store
+from infrastructure.rate_limiting import get_rate_limiter
+from infrastructure.streaming import get_vote_stream_hub
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/api/health")
-async def health_check(session: AsyncSession = Depends(get_db)):
+async def health_check():
+    in_memory_store = get_in_memory_store()
+    if in_memory_store is not None:
+        return {
+            "status": "healthy",
+            "database": "memory",
+            **in_memory_store.stats(),
+        }
+
     try:
-        await session.execute(text("SELECT 1"))
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
         return {
             "status": "healthy",
             "database": "connected",
+            "read_replicas": replica_router.stats(),
         }
     except Exception as e:
         return {
@@ -21,3 +42,50 @@ async def health_check(session: AsyncSession = Depends(get_db)):
             "database": "disconnected",
             "error": str(e),
         }
+
+
+@router.get("/api/health/startup")
+async def startup_stats(request: Request):
+    return {
+        "startup_seconds": getattr(request.app.state, "startup_seconds", None),
+        "schema_revision": getattr(request.app.state, "schema_revision", None),
+    }
+
+
+@router.get("/api/health/cache")
+async def cache_stats():
+    leaderboard = get_leaderboard_cache()
+    vote_bloom_filter = get_vote_bloom_filter()
+    idempotency_store = get_idempotency_store()
+    single_flight = get_single_flight()
+    similarity_index = get_similarity_index()
+    return {
+        "leaderboard": leaderboard.stats() if leaderboard else None,
+        "vote_bloom_filter": vote_bloom_filter.stats() if vote_bloom_filter else None,
+        "idempotency": idempotency_store.stats() if idempotency_store else None,
+        "single_flight": single_flight.stats() if single_flight else None,
+        "similarity_index": similarity_index.stats() if similarity_index else None,
+    }
+
+
+@router.get("/api/health/pool")
+async def database_pool_stats():
+    return pool_stats(engine.pool)
+
+
+@router.get("/api/health/stream")
+async def vote_stream_stats():
+    hub = get_vote_stream_hub()
+    return {"vote_stream": hub.stats() if hub else None}
+
+
+@router.get("/api/health/vote-buffer")
+async def vote_buffer_stats():
+    vote_buffer = get_vote_buffer()
+    return {"vote_buffer": vote_buffer.stats() if vote_buffer else None}
+
+
+@router.get("/api/health/rate-limit")
+async def rate_limit_stats():
+    rate_limiter = get_rate_limiter()
+    return {"rate_limit": rate_limiter.stats() if rate_limiter else None}
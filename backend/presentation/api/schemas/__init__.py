@@ -1,3 +1,29 @@
-from .feature_schemas import CreateFeatureRequest, FeatureResponse, VoteRequest
+from .feature_schemas import (
+    BulkVoteItem,
+    BulkVoteItemResult,
+    BulkVoteRequest,
+    BulkVoteResponse,
+    CreateFeatureRequest,
+    CreatedFeatureResponse,
+    FeatureResponse,
+    SimilarFeature,
+    VoteAcceptedResponse,
+    VoteHistogramBucket,
+    VoteHistogramResponse,
+    VoteRequest,
+)
 
-__all__ = ["CreateFeatureRequest", "FeatureResponse", "VoteRequest"]
+__all__ = [
+    "BulkVoteItem",
+    "BulkVoteItemResult",
+    "BulkVoteRequest",
+    "BulkVoteResponse",
+    "CreateFeatureRequest",
+    "CreatedFeatureResponse",
+    "FeatureResponse",
+    "SimilarFeature",
+    "VoteAcceptedResponse",
+    "VoteHistogramBucket",
+    "VoteHistogramResponse",
+    "VoteRequest",
+]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -18,10 +19,59 @@ class FeatureResponse(BaseModel):
     votes_count: int
     created_at: datetime
     updated_at: datetime
+    has_voted: Optional[bool] = None
 
     class Config:
         from_attributes = True
 
 
+class SimilarFeature(BaseModel):
+    id: UUID
+    title: str
+    similarity: float
+
+
+class CreatedFeatureResponse(FeatureResponse):
+    similar_features: List[SimilarFeature] = []
+
+
 class VoteRequest(BaseModel):
     user_identifier: str = Field(..., min_length=1, max_length=100)
+
+
+class VoteAcceptedResponse(BaseModel):
+    feature_id: UUID
+    user_identifier: str
+    status: str = "accepted"
+
+
+class BulkVoteItem(BaseModel):
+    feature_id: UUID
+    user_identifier: str = Field(..., min_length=1, max_length=100)
+
+
+class BulkVoteRequest(BaseModel):
+    votes: List[BulkVoteItem] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkVoteItemResult(BaseModel):
+    feature_id: UUID
+    user_identifier: str
+    status: Literal["created", "duplicate", "not_found"]
+
+
+class BulkVoteResponse(BaseModel):
+    results: List[BulkVoteItemResult]
+
+
+class VoteHistogramBucket(BaseModel):
+    bucket_start: datetime
+    count: int
+
+
+class VoteHistogramResponse(BaseModel):
+    feature_id: UUID
+    granularity: Literal["hour", "day"]
+    start: datetime
+    end: datetime
+    buckets: List[VoteHistogramBucket]
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+REQUIRE_POSTGRES_TESTS = os.environ.get("REQUIRE_POSTGRES_TESTS") == "1"
+
+os.environ["DATABASE_ECHO"] = "false"
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+
+def pytest_collection_modifyitems(config, items):
+    postgres_items = [item for item in items if "postgres" in item.keywords]
+    if TEST_DATABASE_URL or not postgres_items:
+        return
+    if REQUIRE_POSTGRES_TESTS:
+        raise pytest.UsageError(
+            f"REQUIRE_POSTGRES_TESTS=1 but TEST_DATABASE_URL is not set "
+            f"({len(postgres_items)} postgres tests would be skipped)"
+        )
+    skip = pytest.mark.skip(reason="set TEST_DATABASE_URL to run against PostgreSQL")
+    for item in postgres_items:
+        item.add_marker(skip)
+
+
+@pytest.fixture(params=["memory", pytest.param("sqlalchemy", marks=pytest.mark.postgres)])
+def backend(request, monkeypatch):
+    from infrastructure.config.settings import get_settings
+    from infrastructure.memory import store
+
+    monkeypatch.setenv("REPOSITORY_BACKEND", request.param)
+    monkeypatch.delenv("MEMORY_STORE_PATH", raising=False)
+    monkeypatch.setattr(store, "_in_memory_store", None)
+    get_settings.cache_clear()
+    yield request.param
+    get_settings.cache_clear()
@@ -0,0 +1,110 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from domain.entities import Feature
+from domain.value_objects import Vote
+from infrastructure.database.connection import async_session_maker
+from infrastructure.database.repositories import FeatureRepositoryImpl, VoteRepositoryImpl
+from main import app
+
+VOTERS = 50
+
+
+async def _with_client(scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+async def _with_session(scenario):
+    async with app.router.lifespan_context(app):
+        async with async_session_maker() as session:
+            try:
+                return await scenario(session)
+            finally:
+                await session.rollback()
+
+
+async def _create_feature(client: httpx.AsyncClient) -> str:
+    response = await client.post(
+        "/api/v1/features",
+        json={
+            "title": f"Concurrent votes {uuid4()}",
+            "description": "Feature used by the concurrent vote tests",
+            "author_name": "tests",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _vote(client: httpx.AsyncClient, feature_id: str, user_identifier: str):
+    return client.post(
+        f"/api/v1/features/{feature_id}/vote", json={"user_identifier": user_identifier}
+    )
+
+
+def test_concurrent_votes_are_all_counted(backend):
+    async def scenario(client):
+        feature_id = await _create_feature(client)
+        responses = await asyncio.gather(
+            *(_vote(client, feature_id, f"voter-{i}") for i in range(VOTERS))
+        )
+        feature = await client.get(f"/api/v1/features/{feature_id}")
+        return [response.status_code for response in responses], feature.json()
+
+    statuses, feature = asyncio.run(_with_client(scenario))
+
+    assert statuses == [200] * VOTERS
+    assert feature["votes_count"] == VOTERS
+
+
+def test_concurrent_duplicate_votes_are_counted_once(backend):
+    async def scenario(client):
+        feature_id = await _create_feature(client)
+        responses = await asyncio.gather(
+            *(_vote(client, feature_id, "same-voter") for _ in range(VOTERS))
+        )
+        feature = await client.get(f"/api/v1/features/{feature_id}")
+        return [response.status_code for response in responses], feature.json()
+
+    statuses, feature = asyncio.run(_with_client(scenario))
+
+    assert sorted(statuses) == [200] + [409] * (VOTERS - 1)
+    assert feature["votes_count"] == 1
+
+
+def test_vote_for_unknown_feature_is_not_found(backend):
+    async def scenario(client):
+        response = await _vote(client, str(uuid4()), "voter")
+        return response.status_code
+
+    assert asyncio.run(_with_client(scenario)) == 404
+
+
+@pytest.mark.postgres
+def test_create_if_absent_does_not_create_on_conflict():
+    async def scenario(session):
+        feature = await FeatureRepositoryImpl(session).create(
+            Feature(title="Conflicting votes", description="Repository test", author_name="tests")
+        )
+        votes = VoteRepositoryImpl(session)
+        return (
+            await votes.create_if_absent(Vote(feature_id=feature.id, user_identifier="voter")),
+            await votes.create_if_absent(Vote(feature_id=feature.id, user_identifier="voter")),
+            await votes.create_if_absent(Vote(feature_id=uuid4(), user_identifier="voter")),
+        )
+
+    assert asyncio.run(_with_session(scenario)) == (True, False, False)
+
+
+@pytest.mark.postgres
+def test_increment_votes_returns_none_for_unknown_feature():
+    async def scenario(session):
+        return await FeatureRepositoryImpl(session).increment_votes(uuid4())
+
+    assert asyncio.run(_with_session(scenario)) is None
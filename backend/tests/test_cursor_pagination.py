@@ -0,0 +1,113 @@
+import asyncio
+import base64
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from application.pagination import decode_cursor, encode_cursor
+from domain.exceptions import InvalidCursorException
+from main import app
+
+FEATURES = 7
+
+
+async def _with_client(scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+async def _create_feature(client: httpx.AsyncClient, votes: int) -> str:
+    response = await client.post(
+        "/api/v1/features",
+        json={
+            "title": f"Cursor pagination {uuid4()}",
+            "description": "Feature used by the cursor pagination tests",
+            "author_name": "tests",
+        },
+    )
+    assert response.status_code == 201
+    feature_id = response.json()["id"]
+    for voter in range(votes):
+        response = await client.post(
+            f"/api/v1/features/{feature_id}/vote", json={"user_identifier": f"voter-{voter}"}
+        )
+        assert response.status_code == 200
+    return feature_id
+
+
+async def _walk(client: httpx.AsyncClient, params: dict):
+    pages = []
+    cursor = None
+    while True:
+        response = await client.get(
+            "/api/v1/features", params={**params, **({"cursor": cursor} if cursor else {})}
+        )
+        assert response.status_code == 200
+        pages.append([feature["id"] for feature in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trips():
+    payload = {"sort_by": "votes", "order": "desc", "value": 3, "id": str(uuid4())}
+
+    cursor = encode_cursor(payload)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == payload
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        base64.urlsafe_b64encode(b"[1, 2]").decode(),
+    ],
+)
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("sort_by, order", [("votes", "desc"), ("created_at", "asc")])
+def test_cursor_pages_cover_every_feature_once(backend, sort_by, order):
+    async def scenario(client):
+        created = [await _create_feature(client, votes=i % 3) for i in range(FEATURES)]
+        everything = await client.get(
+            "/api/v1/features", params={"sort_by": sort_by, "order": order, "limit": 100}
+        )
+        pages = await _walk(client, {"sort_by": sort_by, "order": order, "limit": 2})
+        return created, [feature["id"] for feature in everything.json()], pages
+
+    created, everything, pages = asyncio.run(_with_client(scenario))
+
+    walked = [feature_id for page in pages for feature_id in page]
+    assert all(len(page) <= 2 for page in pages)
+    assert walked == everything
+    assert set(created) <= set(walked)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        encode_cursor({"sort_by": "created_at", "order": "desc", "value": 3, "id": str(uuid4())}),
+        encode_cursor({"sort_by": "votes", "order": "desc", "value": "3", "id": str(uuid4())}),
+        encode_cursor({"sort_by": "votes", "order": "desc", "value": 3, "id": "not-a-uuid"}),
+        encode_cursor({"sort_by": "votes", "order": "desc", "value": 3}),
+    ],
+)
+def test_list_rejects_malformed_cursors(backend, cursor):
+    async def scenario(client):
+        return await client.get(
+            "/api/v1/features", params={"sort_by": "votes", "order": "desc", "cursor": cursor}
+        )
+
+    response = asyncio.run(_with_client(scenario))
+
+    assert response.status_code == 400
@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.cache import MinHashSimilarityIndex, TransactionalSimilarityIndex
+from infrastructure.cache import minhash_index
+from infrastructure.config.settings import get_settings
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def stable_hashing(monkeypatch):
+    def stable_hash(text: str) -> int:
+        return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+    monkeypatch.setattr(minhash_index, "hash", stable_hash, raising=False)
+
+
+@pytest.fixture
+def similarity_index(monkeypatch):
+    monkeypatch.setenv("DUPLICATE_DETECTION_ENABLED", "true")
+    monkeypatch.setenv("DUPLICATE_DETECTION_REFRESH_SECONDS", "0")
+    monkeypatch.setattr(minhash_index, "_similarity_index", None)
+    get_settings.cache_clear()
+    yield minhash_index.get_similarity_index
+    get_settings.cache_clear()
+
+
+async def _with_client(scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+def _index(containment_threshold: float = 0.9) -> MinHashSimilarityIndex:
+    return MinHashSimilarityIndex(threshold=0.5, containment_threshold=containment_threshold)
+
+
+def test_short_title_contained_in_a_longer_one_matches():
+    index = _index()
+    dark_mode = uuid4()
+    index.add(dark_mode, "Dark mode", "")
+    index.add(uuid4(), "Export votes as CSV", "")
+
+    matches = index.query("dark mode support please")
+
+    assert [(feature_id, title) for feature_id, title, _ in matches] == [
+        (dark_mode, "Dark mode")
+    ]
+    assert matches[0][2] >= 0.9
+
+
+def test_containment_is_what_matches_a_contained_title():
+    index = _index(containment_threshold=1.1)
+    index.add(uuid4(), "Dark mode", "")
+
+    assert index.query("dark mode support please") == []
+
+
+def test_titles_too_short_for_containment_do_not_match():
+    index = _index()
+    index.add(uuid4(), "Dark", "")
+
+    assert index.query("dark mode support please") == []
+
+
+def test_index_only_learns_committed_features(similarity_index):
+    async def scenario():
+        committed, rolled_back = uuid4(), uuid4()
+        async with AsyncSession() as session:
+            await session.begin()
+            TransactionalSimilarityIndex(similarity_index(), session).add(
+                rolled_back, "Offline mode", ""
+            )
+            await session.rollback()
+            TransactionalSimilarityIndex(similarity_index(), session).add(
+                committed, "Dark mode", ""
+            )
+            before_commit = similarity_index().query("Dark mode")
+            await session.commit()
+        return committed, before_commit
+
+    committed, before_commit = asyncio.run(scenario())
+
+    assert before_commit == []
+    assert [match[0] for match in similarity_index().query("Dark mode")] == [committed]
+    assert similarity_index().query("Offline mode") == []
+
+
+def test_created_feature_is_found_after_commit(backend, similarity_index):
+    title = f"Keyboard shortcuts for voting {uuid4().hex[:8]}"
+
+    async def scenario(client):
+        created = await client.post(
+            "/api/v1/features",
+            json={
+                "title": title,
+                "description": "Vote and navigate without the mouse",
+                "author_name": "tests",
+            },
+        )
+        similar = await client.get("/api/v1/features/similar", params={"title": title})
+        return created, similar
+
+    created, similar = asyncio.run(_with_client(scenario))
+
+    assert created.status_code == 201
+    assert similar.status_code == 200
+    assert created.json()["id"] in [match["id"] for match in similar.json()]
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Optional
+
+import httpx
+import pytest
+
+from infrastructure.config.settings import get_settings
+from main import app
+
+TOKEN = "export-secret"
+
+
+async def _export(authorization: Optional[str]):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            feature = await client.post(
+                "/api/v1/features",
+                json={
+                    "title": "Exported feature",
+                    "description": "Feature used by the export tests",
+                    "author_name": "tests",
+                },
+            )
+            await client.post(
+                f"/api/v1/features/{feature.json()['id']}/vote",
+                json={"user_identifier": "private-voter"},
+            )
+            headers = {"Authorization": authorization} if authorization else None
+            return await client.get("/api/v1/export/votes", headers=headers)
+
+
+@pytest.fixture
+def export_enabled(monkeypatch):
+    monkeypatch.setenv("BULK_EXPORT_ENABLED", "true")
+    monkeypatch.delenv("BULK_EXPORT_TOKEN", raising=False)
+    get_settings.cache_clear()
+    yield monkeypatch
+    get_settings.cache_clear()
+
+
+def _with_token(monkeypatch):
+    monkeypatch.setenv("BULK_EXPORT_TOKEN", TOKEN)
+    get_settings.cache_clear()
+
+
+def test_export_is_refused_without_a_configured_token(backend, export_enabled):
+    response = asyncio.run(_export(f"Bearer {TOKEN}"))
+
+    assert response.status_code == 403
+    assert b"private-voter" not in response.content
+
+
+@pytest.mark.parametrize("authorization", [None, "Bearer wrong", TOKEN])
+def test_export_requires_the_bearer_token(backend, export_enabled, authorization):
+    _with_token(export_enabled)
+
+    response = asyncio.run(_export(authorization))
+
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert b"private-voter" not in response.content
+
+
+def test_export_with_the_token_streams_votes(backend, export_enabled):
+    _with_token(export_enabled)
+
+    response = asyncio.run(_export(f"Bearer {TOKEN}"))
+
+    assert response.status_code == 200
+    assert b"private-voter" in response.content
@@ -0,0 +1,127 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from infrastructure.cache import IdempotencyStore
+from infrastructure.database.connection import async_session_maker
+from main import app
+from presentation.api.http import IdempotencyMiddleware
+
+
+async def _with_client(store: IdempotencyStore, scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=IdempotencyMiddleware(app, store=store))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+def _feature(title: str) -> dict:
+    return {
+        "title": title,
+        "description": "Feature used by the idempotency tests",
+        "author_name": "tests",
+    }
+
+
+def _create(client: httpx.AsyncClient, key: str, body: dict):
+    return client.post("/api/v1/features", json=body, headers={"Idempotency-Key": key})
+
+
+def test_same_key_replays_the_first_response(backend):
+    key = str(uuid4())
+    body = _feature(f"Idempotent {key}")
+
+    async def scenario(client):
+        first = await _create(client, key, body)
+        second = await _create(client, key, body)
+        listed = await client.get("/api/v1/features", params={"limit": 100})
+        return first, second, listed.json()
+
+    first, second, listed = asyncio.run(_with_client(IdempotencyStore(), scenario))
+
+    assert first.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+    assert second.status_code == 201
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert [feature["title"] for feature in listed].count(body["title"]) == 1
+
+
+def test_concurrent_requests_with_one_key_create_once(backend):
+    key = str(uuid4())
+    body = _feature(f"Idempotent {key}")
+
+    async def scenario(client):
+        responses = await asyncio.gather(*(_create(client, key, body) for _ in range(10)))
+        listed = await client.get("/api/v1/features", params={"limit": 100})
+        return responses, listed.json()
+
+    responses, listed = asyncio.run(_with_client(IdempotencyStore(), scenario))
+
+    assert [response.status_code for response in responses] == [201] * 10
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert sum("Idempotent-Replayed" not in response.headers for response in responses) == 1
+    assert [feature["title"] for feature in listed].count(body["title"]) == 1
+
+
+def test_same_key_with_a_different_body_is_rejected(backend):
+    key = str(uuid4())
+
+    async def scenario(client):
+        first = await _create(client, key, _feature(f"Idempotent {key}"))
+        second = await _create(client, key, _feature(f"Changed {key}"))
+        return first, second
+
+    first, second = asyncio.run(_with_client(IdempotencyStore(), scenario))
+
+    assert first.status_code == 201
+    assert second.status_code == 422
+    assert "Idempotent-Replayed" not in second.headers
+
+
+def test_invalid_key_is_rejected(backend):
+    async def scenario(client):
+        return await _create(client, "k" * 256, _feature("Too long a key"))
+
+    response = asyncio.run(_with_client(IdempotencyStore(), scenario))
+
+    assert response.status_code == 400
+
+
+def test_expired_key_is_executed_again(backend):
+    key = str(uuid4())
+    body = _feature(f"Idempotent {key}")
+
+    async def scenario(client):
+        first = await _create(client, key, body)
+        await asyncio.sleep(0.1)
+        second = await _create(client, key, body)
+        return first, second
+
+    first, second = asyncio.run(_with_client(IdempotencyStore(ttl_seconds=0.05), scenario))
+
+    assert first.status_code == 201
+    assert second.status_code == 201
+    assert "Idempotent-Replayed" not in second.headers
+    assert second.json()["id"] != first.json()["id"]
+
+
+@pytest.mark.postgres
+def test_abandoned_shared_claim_expires_after_the_lease():
+    key = f"lease-{uuid4()}"
+
+    async def scenario():
+        crashed = IdempotencyStore(session_factory=async_session_maker, lease_seconds=0.2)
+        retried = IdempotencyStore(session_factory=async_session_maker, lease_seconds=0.2)
+        async with app.router.lifespan_context(app):
+            claimed = await crashed.claim(key, "fingerprint")
+            blocked = await retried.claim(key, "fingerprint")
+            await asyncio.sleep(0.3)
+            reclaimed = await retried.claim(key, "fingerprint")
+            await retried.release(key)
+            await crashed.release(key)
+        return claimed, blocked, reclaimed
+
+    assert asyncio.run(scenario()) == (True, False, True)
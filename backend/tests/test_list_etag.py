@@ -0,0 +1,78 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+
+from main import app
+
+
+async def _with_client(scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+async def _create_feature(client: httpx.AsyncClient) -> str:
+    response = await client.post(
+        "/api/v1/features",
+        json={
+            "title": f"List ETag {uuid4()}",
+            "description": "Feature used by the list ETag tests",
+            "author_name": "tests",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _list(client: httpx.AsyncClient, etag: str):
+    return client.get(
+        "/api/v1/features", params={"sort_by": "created_at"}, headers={"If-None-Match": etag}
+    )
+
+
+def test_unconditional_list_has_no_etag(backend):
+    async def scenario(client):
+        await _create_feature(client)
+        return await client.get("/api/v1/features")
+
+    response = asyncio.run(_with_client(scenario))
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_matching_if_none_match_gets_304(backend):
+    async def scenario(client):
+        await _create_feature(client)
+        first = await _list(client, 'W/"0"')
+        second = await _list(client, first.headers["ETag"])
+        return first, second
+
+    first, second = asyncio.run(_with_client(scenario))
+
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    assert second.status_code == 304
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.content == b""
+
+
+def test_vote_changes_list_etag(backend):
+    async def scenario(client):
+        feature_id = await _create_feature(client)
+        before = await _list(client, 'W/"0"')
+        vote = await client.post(
+            f"/api/v1/features/{feature_id}/vote", json={"user_identifier": "etag-voter"}
+        )
+        after = await _list(client, before.headers["ETag"])
+        return before, vote, after, feature_id
+
+    before, vote, after, feature_id = asyncio.run(_with_client(scenario))
+
+    assert vote.status_code == 200
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    voted = next(feature for feature in after.json() if feature["id"] == feature_id)
+    assert voted["votes_count"] == 1
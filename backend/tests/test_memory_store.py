@@ -0,0 +1,72 @@
+import asyncio
+import os
+from uuid import UUID
+
+import pytest
+
+from domain.entities import Feature
+from infrastructure.memory import InMemoryStore, SortedIndex
+from infrastructure.memory.store import LOG_FILE
+
+
+def _feature(title: str) -> Feature:
+    return Feature(title=title, description="Feature used by the store tests", author_name="tests")
+
+
+def test_sorted_index_pages_in_both_directions():
+    index = SortedIndex()
+    keys = [(votes, UUID(int=votes)) for votes in range(10)]
+    for key in reversed(keys):
+        index.add(key)
+    index.remove(keys[5])
+    index.remove((42, UUID(int=42)))
+
+    assert len(index) == 9
+    assert index.page("asc", 3) == keys[:3]
+    assert index.page("asc", 3, after=keys[3]) == [keys[4], keys[6], keys[7]]
+    assert index.page("desc", 3) == [keys[9], keys[8], keys[7]]
+    assert index.page("desc", 3, after=keys[7]) == [keys[6], keys[4], keys[3]]
+    assert index.page("desc", 3, after=keys[1]) == [keys[0]]
+
+
+def test_second_process_cannot_open_the_same_store(tmp_path):
+    async def scenario():
+        first = InMemoryStore(str(tmp_path), snapshot_interval_seconds=0)
+        second = InMemoryStore(str(tmp_path), snapshot_interval_seconds=0)
+        await first.start()
+        try:
+            with pytest.raises(RuntimeError, match="single worker"):
+                await second.start()
+        finally:
+            await first.stop()
+        await second.start()
+        await second.stop()
+
+    asyncio.run(scenario())
+
+
+def test_background_snapshot_keeps_writes_made_while_it_runs(tmp_path):
+    before, during = _feature("Before snapshot"), _feature("During snapshot")
+
+    async def scenario():
+        store = InMemoryStore(str(tmp_path), snapshot_interval_seconds=0)
+        await store.start()
+        store.insert_feature(before)
+        snapshot = asyncio.create_task(store._snapshot_in_background())
+        await asyncio.sleep(0)
+        store.insert_feature(during)
+        await snapshot
+        return store
+
+    store = asyncio.run(scenario())
+
+    with open(os.path.join(tmp_path, LOG_FILE), "rb") as handle:
+        log = handle.read()
+    assert str(during.id).encode() in log
+    assert str(before.id).encode() not in log
+
+    reloaded = InMemoryStore(str(tmp_path))
+    reloaded.load()
+    assert set(reloaded.features) == {before.id, during.id}
+
+    asyncio.run(store.stop())
@@ -0,0 +1,155 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from infrastructure.rate_limiting import TokenBucketRateLimiter, parse_rate_limits
+from main import app
+from presentation.api.http import RateLimitMiddleware
+
+CREATE_ROUTE = "POST /api/v1/features"
+VOTE_ROUTE = "POST /api/v1/features/{feature_id}/vote"
+
+
+def _middleware(rules, trusted_proxies: int = 0) -> RateLimitMiddleware:
+    return RateLimitMiddleware(
+        app,
+        limiter=TokenBucketRateLimiter(parse_rate_limits(rules)),
+        routes=app.routes,
+        trusted_proxies=trusted_proxies,
+    )
+
+
+async def _with_client(middleware: RateLimitMiddleware, scenario):
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await scenario(client)
+
+
+def _create(client: httpx.AsyncClient, headers=None):
+    return client.post(
+        "/api/v1/features",
+        json={
+            "title": f"Rate limited {uuid4()}",
+            "description": "Feature used by the rate limiting tests",
+            "author_name": "tests",
+        },
+        headers=headers,
+    )
+
+
+def _scope(forwarded_for=(), client=("10.0.0.1", 1234)) -> dict:
+    return {
+        "type": "http",
+        "headers": [(b"x-forwarded-for", value.encode()) for value in forwarded_for],
+        "client": client,
+    }
+
+
+def test_exhausted_bucket_gets_429_with_retry_after(backend):
+    middleware = _middleware({CREATE_ROUTE: {"ip": "2/minute"}})
+
+    async def scenario(client):
+        return [await _create(client) for _ in range(3)]
+
+    responses = asyncio.run(_with_client(middleware, scenario))
+
+    assert [response.status_code for response in responses] == [201, 201, 429]
+    assert int(responses[-1].headers["Retry-After"]) >= 1
+    assert responses[-1].json() == {"detail": "Too many requests"}
+
+
+def test_user_limit_reads_the_body_and_still_passes_it_on(backend):
+    middleware = _middleware({VOTE_ROUTE: {"user": "1/minute"}})
+
+    async def scenario(client):
+        feature_id = (await _create(client)).json()["id"]
+
+        def vote(user_identifier):
+            return client.post(
+                f"/api/v1/features/{feature_id}/vote",
+                json={"user_identifier": user_identifier},
+            )
+
+        return [await vote("alice"), await vote("alice"), await vote("bob")]
+
+    responses = asyncio.run(_with_client(middleware, scenario))
+
+    assert [response.status_code for response in responses] == [200, 429, 200]
+    assert responses[2].json()["votes_count"] == 2
+
+
+def test_trusted_proxy_hop_identifies_the_client(backend):
+    middleware = _middleware({CREATE_ROUTE: {"ip": "1/minute"}}, trusted_proxies=1)
+
+    async def scenario(client):
+        return [
+            await _create(client, {"X-Forwarded-For": "1.1.1.1, 203.0.113.7"}),
+            await _create(client, {"X-Forwarded-For": "2.2.2.2, 203.0.113.7"}),
+            await _create(client, {"X-Forwarded-For": "1.1.1.1, 203.0.113.8"}),
+        ]
+
+    responses = asyncio.run(_with_client(middleware, scenario))
+
+    assert [response.status_code for response in responses] == [201, 429, 201]
+
+
+@pytest.mark.parametrize(
+    "trusted_proxies, forwarded_for, expected",
+    [
+        (0, ["1.1.1.1, 2.2.2.2"], "10.0.0.1"),
+        (1, ["1.1.1.1, 2.2.2.2"], "2.2.2.2"),
+        (2, ["1.1.1.1, 2.2.2.2, 3.3.3.3"], "2.2.2.2"),
+        (2, ["1.1.1.1", "2.2.2.2, 3.3.3.3"], "2.2.2.2"),
+        (5, [" 1.1.1.1 ,, 2.2.2.2 "], "1.1.1.1"),
+        (1, [], "10.0.0.1"),
+        (1, [" , "], "10.0.0.1"),
+    ],
+)
+def test_client_ip_counts_trusted_hops_from_the_right(trusted_proxies, forwarded_for, expected):
+    middleware = _middleware({}, trusted_proxies=trusted_proxies)
+
+    assert middleware._client_ip(_scope(forwarded_for)) == expected
+
+
+def test_client_ip_without_client_address():
+    middleware = _middleware({})
+
+    assert middleware._client_ip(_scope(client=None)) == "unknown"
+
+
+def test_replayed_body_is_followed_by_the_server_receive():
+    async def server_receive():
+        return {"type": "http.disconnect"}
+
+    async def scenario():
+        receive = _middleware({})._replay(b'{"user_identifier": "alice"}', server_receive)
+        return await receive(), await receive()
+
+    first, second = asyncio.run(scenario())
+
+    assert first == {
+        "type": "http.request",
+        "body": b'{"user_identifier": "alice"}',
+        "more_body": False,
+    }
+    assert second == {"type": "http.disconnect"}
+
+
+def test_shared_denial_refunds_the_local_token():
+    class DenyingSharedLimiter(TokenBucketRateLimiter):
+        async def _acquire_shared(self, key, limit):
+            return 5.0
+
+    rules = parse_rate_limits({CREATE_ROUTE: {"ip": "1/minute"}})
+    limiter = DenyingSharedLimiter(rules, session_factory=object)
+    limit = rules[CREATE_ROUTE][0]
+
+    async def scenario():
+        return [await limiter.acquire(CREATE_ROUTE, limit, "1.1.1.1") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [5.0, 5.0]
+    tokens, _ = limiter._buckets[f"{CREATE_ROUTE}|ip|1.1.1.1"]
+    assert tokens == pytest.approx(1.0)
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from infrastructure.cache import SingleFlight
+
+FOLLOWERS = 5
+
+
+class Call:
+    def __init__(self, result="value", error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_callers_share_one_execution():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = Call()
+        tasks = [
+            asyncio.create_task(single_flight.run("key", call)) for _ in range(FOLLOWERS + 1)
+        ]
+        await _settle()
+        call.release.set()
+        return await asyncio.gather(*tasks), call.calls, single_flight.stats()
+
+    results, calls, stats = asyncio.run(scenario())
+
+    assert results == ["value"] * (FOLLOWERS + 1)
+    assert calls == 1
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == FOLLOWERS
+    assert stats["in_flight"] == 0
+    assert stats["keys"] == [{"key": "key", "requests": FOLLOWERS + 1, "coalesced": FOLLOWERS}]
+
+
+def test_leader_error_reaches_every_caller_and_is_not_cached():
+    async def scenario():
+        single_flight = SingleFlight()
+        failing = Call(error=ValueError("boom"))
+        tasks = [
+            asyncio.create_task(single_flight.run("key", failing))
+            for _ in range(FOLLOWERS + 1)
+        ]
+        await _settle()
+        failing.release.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        retry = Call(result="recovered")
+        retry.release.set()
+        return outcomes, failing.calls, await single_flight.run("key", retry), single_flight
+
+    outcomes, calls, retried, single_flight = asyncio.run(scenario())
+
+    assert calls == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert len({id(outcome) for outcome in outcomes}) == 1
+    assert retried == "recovered"
+    assert single_flight.errors == 1
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_cancelled_leader_hands_the_call_to_a_follower():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = Call()
+        leader = asyncio.create_task(single_flight.run("key", call))
+        await _settle()
+        followers = [
+            asyncio.create_task(single_flight.run("key", call)) for _ in range(FOLLOWERS)
+        ]
+        await _settle()
+
+        leader.cancel()
+        await _settle()
+        call.release.set()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results, call.calls, single_flight.stats()
+
+    results, calls, stats = asyncio.run(scenario())
+
+    assert results == ["value"] * FOLLOWERS
+    assert calls == 2
+    assert stats["executions"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_cancelled_follower_leaves_the_leader_running():
+    async def scenario():
+        single_flight = SingleFlight()
+        call = Call()
+        leader = asyncio.create_task(single_flight.run("key", call))
+        await _settle()
+        follower = asyncio.create_task(single_flight.run("key", call))
+        await _settle()
+
+        follower.cancel()
+        await _settle()
+        call.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader, call.calls
+
+    assert asyncio.run(scenario()) == ("value", 1)
+
+
+def test_scopes_do_not_share_calls():
+    async def scenario():
+        single_flight = SingleFlight()
+        primary, replica = Call("primary"), Call("replica")
+        tasks = [
+            asyncio.create_task(single_flight.scoped("primary").run(("list", 1), primary)),
+            asyncio.create_task(single_flight.scoped("replica").run(("list", 1), replica)),
+        ]
+        await _settle()
+        primary.release.set()
+        replica.release.set()
+        return await asyncio.gather(*tasks), single_flight.stats()
+
+    results, stats = asyncio.run(scenario())
+
+    assert results == ["primary", "replica"]
+    assert stats["executions"] == 2
+    assert stats["coalesced"] == 0